@@ -53,6 +53,11 @@ generate() {
     command "Transactions.Send" "tx send"
     command "Transactions.Sign" "tx sign"
     command "Transactions.Relay" "tx relay"
+    command "Transactions.RelayBatch" "tx relay-batch"
+    command "Transactions.SimulateBatch" "tx simulate-batch"
+    command "Transactions.Fee" "tx fee"
+    command "Transactions.Pack" "tx pack"
+    command "Transactions.Unpack" "tx unpack"
 
     group "Validator" "validator"
     command "Validator.Stake" "validator stake"
@@ -128,6 +133,9 @@ generate() {
     command "Data.Dump" "data parse"
     command "Data.Store" "data store"
     command "Data.Load" "data load"
+    command "Data.StoreMany" "data store-many"
+    command "Data.DumpStore" "data dump"
+    command "Data.Import" "data import"
 
     group "Faucet" "faucet"
     command "Faucet.Request" "faucet request"
@@ -208,10 +216,12 @@ generate() {
 
     group "Get" "get"
     command "Get.Account" "get account"
+    command "Get.Accounts" "get accounts"
     command "Get.Storage" "get storage"
     command "Get.StorageEntry" "get storage-entry"
     command "Get.Token" "get token"
     command "Get.Transaction" "get transaction"
+    command "Get.Transactions" "get transactions"
 
     group "Token" "token"
     command "Token.IssueFungbile" "token issue-fungible"
@@ -0,0 +1,161 @@
+import logging
+import time
+from typing import Any, Callable, Optional
+
+from multiversx_sdk import Address
+
+from multiversx_sdk_cli.bulk_fetching import fetch_concurrently
+from multiversx_sdk_cli.pooled_proxy import PooledProxyNetworkProvider
+from multiversx_sdk_cli.storage_streaming import fetch_storage_pairs
+
+logger = logging.getLogger("account_watching")
+
+# When nothing changes, the polling interval doubles (starting from the round duration), up to a maximum.
+DEFAULT_MAX_INTERVAL_IN_ROUNDS = 10
+MAX_NUM_CONCURRENT_POLLS = 16
+
+
+class AccountState:
+    def __init__(
+        self,
+        nonce: int,
+        balance: int,
+        root_hash: str,
+        tokens: Optional[dict[str, str]] = None,
+        storage: Optional[dict[str, str]] = None,
+    ) -> None:
+        self.nonce = nonce
+        self.balance = balance
+        self.root_hash = root_hash
+        self.tokens = tokens
+        self.storage = storage
+
+
+class AccountWatcher:
+    """
+    Polls accounts and reports what changed since the previous poll. Tokens and storage are only fetched again
+    when the root hash of the account's data changes (ESDT balances are part of that data, as well).
+    """
+
+    def __init__(
+        self,
+        proxy: PooledProxyNetworkProvider,
+        addresses: list[Address],
+        with_tokens: bool = False,
+        with_storage: bool = False,
+    ) -> None:
+        self.proxy = proxy
+        self.addresses = addresses
+        self.with_tokens = with_tokens
+        self.with_storage = with_storage
+        self.states: dict[str, AccountState] = {}
+
+    def poll(self) -> list[dict[str, Any]]:
+        events: list[dict[str, Any]] = []
+        num_workers = min(len(self.addresses), MAX_NUM_CONCURRENT_POLLS) or 1
+
+        for result in fetch_concurrently(self.addresses, self._fetch_state, num_workers):
+            address = result.item.to_bech32()
+
+            if result.error:
+                events.append(_create_event("error", address, error=str(result.error)))
+                continue
+
+            previous = self.states.get(address)
+            self.states[address] = result.value
+
+            if previous is None:
+                events.append(self._create_initial_event(address, result.value))
+            else:
+                events.extend(self._diff(address, previous, result.value))
+
+        return events
+
+    def _fetch_state(self, address: Address) -> AccountState:
+        response = self.proxy.do_get_generic(f"address/{address.to_bech32()}")
+        account: dict[str, Any] = response.get("account", {})
+        state = AccountState(account.get("nonce", 0), int(account.get("balance", 0)), account.get("rootHash", ""))
+
+        previous = self.states.get(address.to_bech32())
+        is_data_unchanged = previous is not None and state.root_hash and previous.root_hash == state.root_hash
+
+        if is_data_unchanged:
+            state.tokens, state.storage = previous.tokens, previous.storage  # type: ignore
+            return state
+
+        if self.with_tokens:
+            response = self.proxy.do_get_generic(f"address/{address.to_bech32()}/esdt")
+            esdts: dict[str, Any] = response.get("esdts", {})
+            state.tokens = {identifier: str(esdt.get("balance", "0")) for identifier, esdt in esdts.items()}
+
+        if self.with_storage:
+            state.storage = dict(fetch_storage_pairs(self.proxy, address))
+
+        return state
+
+    def _create_initial_event(self, address: str, state: AccountState) -> dict[str, Any]:
+        event = _create_event("initial", address, nonce=state.nonce, balance=str(state.balance))
+        if state.tokens is not None:
+            event["tokens"] = state.tokens
+        if state.storage is not None:
+            event["numStorageKeys"] = len(state.storage)
+        return event
+
+    def _diff(self, address: str, previous: AccountState, current: AccountState) -> list[dict[str, Any]]:
+        events: list[dict[str, Any]] = []
+
+        if previous.nonce != current.nonce:
+            events.append(_create_event("nonce", address, previous=previous.nonce, current=current.nonce))
+        if previous.balance != current.balance:
+            events.append(
+                _create_event("balance", address, previous=str(previous.balance), current=str(current.balance))
+            )
+
+        for identifier, old, new in _diff_dictionaries(previous.tokens, current.tokens):
+            events.append(_create_event("token", address, token=identifier, previous=old, current=new))
+        for key, old, new in _diff_dictionaries(previous.storage, current.storage):
+            events.append(_create_event("storage", address, key=key, previous=old, current=new))
+
+        return events
+
+
+def watch(
+    watcher: AccountWatcher,
+    round_duration: float,
+    max_interval: float,
+    on_events: Callable[[list[dict[str, Any]]], None],
+    num_polls: Optional[int] = None,
+):
+    """
+    Polls every round while the accounts change; otherwise, the interval grows (exponentially) up to `max_interval`.
+    Durations are in seconds.
+    """
+    interval = round_duration
+    poll_index = 0
+
+    while num_polls is None or poll_index < num_polls:
+        if poll_index > 0:
+            time.sleep(interval)
+
+        events = watcher.poll()
+        on_events(events)
+
+        has_changes = any(event["event"] not in ["initial", "error"] for event in events)
+        is_first_poll = poll_index == 0
+        interval = round_duration if has_changes or is_first_poll else min(interval * 2, max_interval)
+        poll_index += 1
+        logger.debug(f"Next poll in {interval:.1f}s")
+
+
+def _diff_dictionaries(
+    previous: Optional[dict[str, str]], current: Optional[dict[str, str]]
+) -> list[tuple[str, Optional[str], Optional[str]]]:
+    if previous is None or current is None or previous is current:
+        return []
+
+    keys = sorted(previous.keys() | current.keys())
+    return [(key, previous.get(key), current.get(key)) for key in keys if previous.get(key) != current.get(key)]
+
+
+def _create_event(kind: str, address: str, **fields: Any) -> dict[str, Any]:
+    return {"event": kind, "timestamp": int(time.time()), "address": address, **fields}
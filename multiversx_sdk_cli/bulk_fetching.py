@@ -0,0 +1,250 @@
+import csv
+import io
+import json
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional, TextIO, TypeVar, Union
+
+from multiversx_sdk_cli import errors
+from multiversx_sdk_cli.utils import BasicEncoder
+
+logger = logging.getLogger("bulk_fetching")
+
+DEFAULT_NUM_WORKERS = 16
+DEFAULT_NUM_RECORDS_PER_ROW_GROUP = 10_000
+# Bounds the memory: the input is consumed while this many items (per worker) are not yet handed over to the caller.
+MAX_NUM_PENDING_ITEMS_PER_WORKER = 4
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class RateLimiter:
+    """Spaces out the calls of `acquire` (across threads), so that at most `max_per_second` happen each second."""
+
+    def __init__(self, max_per_second: float) -> None:
+        self.interval = 1 / max_per_second if max_per_second > 0 else 0
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self.interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+class FetchResult:
+    def __init__(self, item: Any, value: Any = None, error: Optional[Exception] = None) -> None:
+        self.item = item
+        self.value = value
+        self.error = error
+
+
+def fetch_concurrently(
+    items: Iterable[T],
+    fetch: Callable[[T], R],
+    num_workers: int = DEFAULT_NUM_WORKERS,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> Iterator[FetchResult]:
+    """
+    Calls `fetch` for each item, on a bounded pool of threads, and yields the results in the order of the items.
+    The items are consumed lazily. A failed fetch does not stop the others: its error is part of its result.
+    """
+    limiter = rate_limiter or RateLimiter(0)
+
+    def do_fetch(item: T) -> FetchResult:
+        limiter.acquire()
+        try:
+            return FetchResult(item, value=fetch(item))
+        except Exception as error:
+            return FetchResult(item, error=error)
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        pending: deque[Future[FetchResult]] = deque()
+
+        for item in items:
+            pending.append(executor.submit(do_fetch, item))
+
+            if len(pending) >= num_workers * MAX_NUM_PENDING_ITEMS_PER_WORKER:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+class RecordsWriter:
+    """
+    Writes records (dictionaries) as JSON Lines or CSV, flushing each one. The output itself is the checkpoint:
+    when resuming, the records already written are read back (a partially written last line is discarded),
+    and new ones are appended.
+    """
+
+    def __init__(self, path: Path, format: str, fields: list[str], resume: bool = False) -> None:
+        if format not in ["jsonl", "csv"]:
+            raise errors.BadUsage(f"Unknown output format: {format}")
+
+        self.format = format
+        self.fields = fields
+        self.existing_records: list[dict[str, Any]] = []
+
+        if resume and path.exists():
+            self.existing_records = self._read_existing(path)
+            self.f: TextIO = open(path, "a", newline="")
+        else:
+            self.f = open(path, "w", newline="")
+
+        self.csv_writer = csv.DictWriter(self.f, fieldnames=fields, extrasaction="ignore")
+        if format == "csv" and self.f.tell() == 0:
+            self.csv_writer.writeheader()
+
+    def __enter__(self) -> "RecordsWriter":
+        return self
+
+    def __exit__(self, *args: Any):
+        self.f.close()
+
+    def write(self, record: dict[str, Any]):
+        if self.format == "csv":
+            self.csv_writer.writerow({key: _to_csv_value(value) for key, value in record.items()})
+        else:
+            self.f.write(json.dumps(record, cls=BasicEncoder) + "\n")
+
+        self.f.flush()
+
+    def _read_existing(self, path: Path) -> list[dict[str, Any]]:
+        _truncate_partial_last_line(path)
+
+        with open(path, newline="") as f:
+            if self.format == "csv":
+                return list(csv.DictReader(f))
+            return [json.loads(line) for line in f if line.strip()]
+
+
+class ParquetRecordsWriter:
+    """
+    Writes records as a Parquet file, one row group at a time (records are buffered until a row group is full).
+    All the columns are strings, except for the integer ones; nested values are stored as JSON.
+    A Parquet file cannot be appended to, thus it cannot be resumed.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        fields: list[str],
+        integer_fields: Optional[list[str]] = None,
+        num_records_per_row_group: int = DEFAULT_NUM_RECORDS_PER_ROW_GROUP,
+    ) -> None:
+        self.pyarrow = _get_pyarrow()
+        self.fields = fields
+        self.integer_fields = integer_fields or []
+        self.num_records_per_row_group = num_records_per_row_group
+        self.existing_records: list[dict[str, Any]] = []
+        self._buffer: list[dict[str, Any]] = []
+
+        types = {
+            field: self.pyarrow.int64() if field in self.integer_fields else self.pyarrow.string() for field in fields
+        }
+        self.schema = self.pyarrow.schema([(field, types[field]) for field in fields])
+        self.writer = self.pyarrow.parquet.ParquetWriter(str(path), self.schema)
+
+    def __enter__(self) -> "ParquetRecordsWriter":
+        return self
+
+    def __exit__(self, *args: Any):
+        self.flush()
+        self.writer.close()
+
+    def write(self, record: dict[str, Any]):
+        self._buffer.append(record)
+        if len(self._buffer) >= self.num_records_per_row_group:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+
+        columns = {
+            field: [self._to_value(field, record.get(field)) for record in self._buffer] for field in self.fields
+        }
+        self.writer.write_table(self.pyarrow.Table.from_pydict(columns, schema=self.schema))
+        self._buffer = []
+
+    def _to_value(self, field: str, value: Any) -> Any:
+        if value is None or value == "":
+            return None
+        if field in self.integer_fields:
+            return int(value)
+        if isinstance(value, (dict, list, tuple)):
+            return json.dumps(value, cls=BasicEncoder)
+        return str(value)
+
+
+def create_records_writer(
+    path: Path,
+    format: str,
+    fields: list[str],
+    resume: bool = False,
+    integer_fields: Optional[list[str]] = None,
+) -> Union[RecordsWriter, ParquetRecordsWriter]:
+    if format != "parquet":
+        return RecordsWriter(path, format, fields, resume)
+
+    if resume:
+        raise errors.BadUsage("A Parquet output cannot be resumed (use CSV or JSON Lines instead)")
+    return ParquetRecordsWriter(path, fields, integer_fields)
+
+
+def _get_pyarrow() -> Any:
+    try:
+        import pyarrow  # type: ignore
+        import pyarrow.parquet  # type: ignore # noqa: F401
+
+        return pyarrow
+    except ImportError:
+        raise errors.DependencyMissing("pyarrow", "(needed for Parquet output; run: pip install pyarrow)")
+
+
+def _to_csv_value(value: Any) -> Any:
+    # Nested values (e.g. decoded return values) are kept in a single cell, as JSON.
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, cls=BasicEncoder)
+    return value
+
+
+def _truncate_partial_last_line(path: Path):
+    with open(path, "rb+") as f:
+        end = f.seek(0, io.SEEK_END)
+        if end == 0:
+            return
+
+        f.seek(end - 1)
+        if f.read(1) == b"\n":
+            return
+
+        logger.info(f"Discarding the partially written last line of {path}")
+
+        # Look for the last newline, backwards, one block at a time.
+        position = end
+        while position > 0:
+            start = max(0, position - io.DEFAULT_BUFFER_SIZE)
+            f.seek(start)
+            newline_index = f.read(position - start).rfind(b"\n")
+            if newline_index >= 0:
+                f.truncate(start + newline_index + 1)
+                return
+            position = start
+
+        f.truncate(0)
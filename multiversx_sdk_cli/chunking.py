@@ -0,0 +1,90 @@
+import logging
+from typing import Any, Callable, Optional, Sequence, TypeVar
+
+from multiversx_sdk_cli import cli_shared, config
+from multiversx_sdk_cli.constants import (
+    EXTRA_GAS_LIMIT_FOR_GUARDED_TRANSACTIONS,
+    EXTRA_GAS_LIMIT_FOR_RELAYED_TRANSACTIONS,
+    MAX_GAS_LIMIT_PER_TRANSACTION,
+)
+from multiversx_sdk_cli.errors import BadUsage
+
+logger = logging.getLogger("chunking")
+
+T = TypeVar("T")
+
+
+def split_items_into_chunks(
+    args: Any,
+    items: Sequence[T],
+    compute_gas_limit: Callable[[Sequence[T]], int],
+) -> list[Sequence[T]]:
+    """
+    Splits the items (e.g. BLS keys) of a multi-node operation into chunks, so that each chunk fits into a single transaction.
+    The chunk size is either provided by the user (`--nodes-per-transaction`) or derived from the network's max gas per transaction.
+    A single item, or an explicit `--gas-limit` (meant for the whole operation), results in a single chunk, without calling the network.
+    `compute_gas_limit` must compute the gas limit of a transaction holding the given items, without signing it or calling the network.
+    """
+    chunk_size: Optional[int] = getattr(args, "nodes_per_transaction", None)
+
+    if not chunk_size and (len(items) <= 1 or getattr(args, "gas_limit", None)):
+        chunk_size = max(len(items), 1)
+    elif not chunk_size:
+        max_gas_limit = get_max_gas_limit_per_transaction(getattr(args, "proxy", None))
+        chunk_size = compute_chunk_size(items, compute_gas_limit, _get_gas_limit_budget(args, max_gas_limit))
+
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    if len(chunks) > 1:
+        logger.info(f"Splitting {len(items)} nodes into {len(chunks)} transactions, at most {chunk_size} nodes each.")
+
+    return chunks
+
+
+def compute_chunk_size(items: Sequence[T], compute_gas_limit: Callable[[Sequence[T]], int], max_gas_limit: int) -> int:
+    """
+    The gas limit of a multi-node transaction is affine in the number of nodes (fixed cost, plus cost & data movement per node).
+    Thus, two probes are enough to find out how many nodes fit into a transaction.
+    """
+    num_items = len(items)
+    if num_items <= 1:
+        return max(num_items, 1)
+
+    gas_limit_for_one = compute_gas_limit(items[:1])
+    gas_limit_for_two = compute_gas_limit(items[:2])
+    gas_limit_per_item = gas_limit_for_two - gas_limit_for_one
+    base_gas_limit = gas_limit_for_one - gas_limit_per_item
+
+    if gas_limit_per_item <= 0:
+        return num_items
+
+    chunk_size = (max_gas_limit - base_gas_limit) // gas_limit_per_item
+    if chunk_size < 1:
+        raise BadUsage(f"a single node requires {gas_limit_for_one} gas, more than allowed per transaction")
+
+    return min(chunk_size, num_items)
+
+
+def split_amount(amount: int, chunks: Sequence[Sequence[Any]]) -> list[int]:
+    """Splits a (per-node) amount, such as the stake or the unjail fee, proportionally to the size of the chunks."""
+    num_items = sum(len(chunk) for chunk in chunks)
+    amounts = [amount * len(chunk) // num_items for chunk in chunks]
+
+    # The remainder of the integer division goes into the last chunk.
+    amounts[-1] += amount - sum(amounts)
+    return amounts
+
+
+def _get_gas_limit_budget(args: Any, max_gas_limit: int) -> int:
+    # Leave room for the gas limit multiplier (when the gas limit is estimated) and for guardians & relayers.
+    multiplier = getattr(args, "gas_limit_multiplier", None) or config.get_gas_limit_multiplier_from_config()
+    budget = int(max_gas_limit / max(multiplier, 1))
+    return budget - EXTRA_GAS_LIMIT_FOR_GUARDED_TRANSACTIONS - EXTRA_GAS_LIMIT_FOR_RELAYED_TRANSACTIONS
+
+
+def get_max_gas_limit_per_transaction(proxy_url: Optional[str]) -> int:
+    if not proxy_url:
+        return MAX_GAS_LIMIT_PER_TRANSACTION
+
+    network_config = cli_shared.get_network_config(proxy_url)
+    max_gas_limit = network_config.raw.get("erd_max_gas_per_transaction", MAX_GAS_LIMIT_PER_TRANSACTION)
+    return int(max_gas_limit)
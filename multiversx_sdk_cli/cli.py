@@ -32,7 +32,7 @@ import multiversx_sdk_cli.version
 from multiversx_sdk_cli import config, errors, utils, ux
 from multiversx_sdk_cli.cli_shared import set_proxy_from_config_if_not_provided
 from multiversx_sdk_cli.config_env import get_address_hrp
-from multiversx_sdk_cli.constants import LOG_LEVELS, SDK_PATH
+from multiversx_sdk_cli.constants import LOG_LEVELS, OUTPUT_FORMATS, SDK_PATH
 
 logger = logging.getLogger("cli")
 
@@ -73,6 +73,7 @@ def _do_main(cli_args: list[str]):
             handlers=[RichHandler(show_time=False, rich_tracebacks=True)],
         )
 
+    utils.set_output_format(args.output_format)
     verify_deprecated_entries_in_config_file()
     default_hrp = get_address_hrp()
     LibraryConfig.default_address_hrp = default_hrp
@@ -121,6 +122,13 @@ See:
         choices=LOG_LEVELS,
         help="default: %(default)s",
     )
+    parser.add_argument(
+        "--output-format",
+        type=str,
+        default="json",
+        choices=OUTPUT_FORMATS,
+        help="how JSON output is formatted (default: %(default)s); compact, jsonl and orjson are faster and smaller",
+    )
 
     subparsers = parser.add_subparsers()
     commands: list[Any] = []
@@ -171,18 +179,18 @@ def verify_deprecated_entries_in_config_file():
 
 def _handle_global_arguments(args: list[str]):
     """
-    Handle global arguments like --verbose and --log-level.
+    Handle global arguments like --verbose, --log-level and --output-format.
     """
-    log_level_arg = "--log-level"
-    if log_level_arg in args:
-        index = args.index(log_level_arg)
-        if index + 1 >= len(args):
-            raise ValueError(f"Argument {log_level_arg} must be followed by a log level value.")
-
-        log_arg = args.pop(index)
-        log_value = args.pop(index)
-        args.insert(0, log_value)
-        args.insert(0, log_arg)
+    for global_arg in ["--log-level", "--output-format"]:
+        if global_arg in args:
+            index = args.index(global_arg)
+            if index + 1 >= len(args):
+                raise ValueError(f"Argument {global_arg} must be followed by a value.")
+
+            arg = args.pop(index)
+            value = args.pop(index)
+            args.insert(0, value)
+            args.insert(0, arg)
 
     if "--verbose" in args:
         args.remove("--verbose")
@@ -1,25 +1,38 @@
+import json
 import logging
 import os
 from pathlib import Path
 from typing import Any
 
 from multiversx_sdk_cli import cli_shared, errors, utils, workstation
+from multiversx_sdk_cli.data_storage import (
+    DATA_STORE_FILENAME,
+    LEGACY_DATA_FILENAME,
+    DataStore,
+    to_stored_value,
+)
+from multiversx_sdk_cli.json_path import (
+    MISSING,
+    JsonPath,
+    evaluate_many,
+    iter_json_lines,
+)
 
 logger = logging.getLogger("cli.data")
 
-DATA_FILENAME = "mxpy.data-storage.json"
-
 
 def setup_parser(subparsers: Any) -> Any:
     parser = cli_shared.add_group_subparser(subparsers, "data", "Data manipulation omnitool")
     subparsers = parser.add_subparsers()
 
     sub = cli_shared.add_command_subparser(subparsers, "data", "parse", "Parses values from a given file")
-    sub.add_argument("--file", required=True, help="path of the file to parse")
+    sub.add_argument("--file", required=True, help="path of the file to parse (.json, or .jsonl for JSON Lines)")
     sub.add_argument(
         "--expression",
         required=True,
-        help="the Python-Dictionary expression to evaluate in order to extract the data",
+        action="append",
+        help="the path of the value to extract, e.g. data['contractAddress'], $.contractAddress or "
+        "$.results[*].hash; can be repeated, to extract many values in a single pass over the file",
     )
     sub.set_defaults(func=parse)
 
@@ -27,12 +40,7 @@ def setup_parser(subparsers: Any) -> Any:
     sub.add_argument("--key", required=True, help="the key")
     sub.add_argument("--value", required=True, help="the value to save")
     sub.add_argument("--partition", default="*", help="the storage partition (default: %(default)s)")
-    sub.add_argument(
-        "--use-global",
-        action="store_true",
-        default=False,
-        help="use the global storage (default: %(default)s)",
-    )
+    _add_use_global_arg(sub)
     sub.set_defaults(func=store)
 
     sub = cli_shared.add_command_subparser(
@@ -40,83 +48,125 @@ def setup_parser(subparsers: Any) -> Any:
     )
     sub.add_argument("--key", required=True, help="the key")
     sub.add_argument("--partition", default="*", help="the storage partition (default: %(default)s)")
+    _add_use_global_arg(sub)
+    sub.set_defaults(func=load)
+
+    sub = cli_shared.add_command_subparser(
+        subparsers, "data", "store-many", "Stores many key-value pairs within a partition, at once"
+    )
+    sub.add_argument("--file", required=True, help="a JSON file with the pairs to save, as an object: {key: value}")
+    sub.add_argument("--partition", default="*", help="the storage partition (default: %(default)s)")
+    _add_use_global_arg(sub)
+    sub.set_defaults(func=store_many)
+
+    sub = cli_shared.add_command_subparser(
+        subparsers, "data", "dump", "Dumps the key-value pairs of a storage partition (or of all the partitions)"
+    )
+    sub.add_argument("--partition", help="the storage partition (default: all)")
+    _add_use_global_arg(sub)
+    cli_shared.add_outfile_arg(sub)
+    sub.set_defaults(func=dump)
+
+    sub = cli_shared.add_command_subparser(
+        subparsers, "data", "import", "Imports key-value pairs from a JSON file, such as the one used by older versions"
+    )
+    sub.add_argument(
+        "--file",
+        help=f"a JSON file, as {{partition: {{key: value}}}} (default: {LEGACY_DATA_FILENAME} in the storage folder)",
+    )
+    _add_use_global_arg(sub)
+    sub.set_defaults(func=import_data)
+
+    parser.epilog = cli_shared.build_group_epilog(subparsers)
+    return subparsers
+
+
+def _add_use_global_arg(sub: Any):
     sub.add_argument(
         "--use-global",
         action="store_true",
         default=False,
         help="use the global storage (default: %(default)s)",
     )
-    sub.set_defaults(func=load)
-
-    parser.epilog = cli_shared.build_group_epilog(subparsers)
-    return subparsers
 
 
 def parse(args: Any):
     file = Path(args.file).expanduser()
-    expression: str = args.expression
+    paths = [JsonPath.compile(expression) for expression in args.expression]
     suffix = file.suffix
-    data = None
 
     if suffix == ".json":
         data = utils.read_json_file(str(file))
+        for value in evaluate_many(paths, data):
+            print(value)
+    elif suffix == ".jsonl":
+        # One output line per document: the value (or the list of values, if many expressions).
+        with open(file) as f:
+            for document in iter_json_lines(f):
+                values = [_to_json_value(value) for value in evaluate_many(paths, document)]
+                print(json.dumps(values if len(values) > 1 else values[0], cls=utils.BasicEncoder))
     else:
         raise errors.BadUsage(f"File isn't parsable: {file}")
 
-    try:
-        result = eval(expression, {"data": data})
-    except KeyError:
-        result = ""
 
-    print(result)
+def _to_json_value(value: Any) -> Any:
+    return None if value is MISSING else value
 
 
 def store(args: Any):
     logger.warning("Never use this command to store sensitive information! Data is unencrypted.")
 
     key = args.key
-    value = args.value
     partition = args.partition
-    use_global = args.use_global
 
-    data = _read_file(use_global)
-    if partition not in data:
-        data[partition] = dict()
-
-    data_in_partition = data[partition]
-    data_in_partition[key] = value
-    _write_file(use_global, data)
+    with _open_store(args.use_global) as store:
+        store.store(partition, key, args.value)
 
     logger.info(f"Data has been stored at key = '{key}', in partition = '{partition}'.")
 
 
+def store_many(args: Any):
+    logger.warning("Never use this command to store sensitive information! Data is unencrypted.")
+
+    pairs = utils.read_json_file(Path(args.file).expanduser())
+    if not isinstance(pairs, dict):
+        raise errors.BadUserInput(f"Expected a JSON object (key: value) in {args.file}")
+
+    with _open_store(args.use_global) as store:
+        store.store_many(args.partition, ((key, to_stored_value(value)) for key, value in pairs.items()))
+
+    logger.info(f"{len(pairs)} entries have been stored in partition = '{args.partition}'.")
+
+
 def load(args: Any):
-    key = args.key
-    partition = args.partition
-    use_global = args.use_global
+    with _open_store(args.use_global, read_only=True) as store:
+        value = store.load(args.partition, args.key)
+
+    print(value or "")
+
+
+def dump(args: Any):
+    with _open_store(args.use_global, read_only=True) as store:
+        data = store.dump(args.partition)
 
-    data = _read_file(use_global)
-    data_in_partition = data.get(partition, dict())
-    value = data_in_partition.get(key, "")
-    print(value)
+    utils.dump_out_json(data, args.outfile)
 
 
-def _read_file(use_global: bool) -> dict[str, Any]:
-    filename = _get_filename(use_global)
+def import_data(args: Any):
+    folder = _get_folder(args.use_global)
+    file = Path(args.file).expanduser() if args.file else folder / LEGACY_DATA_FILENAME
 
-    if not os.path.isfile(filename):
-        return dict()
-    data: dict[str, Any] = utils.read_json_file(filename)
-    return data
+    with _open_store(args.use_global) as store:
+        num_imported = store.import_json(file)
 
+    logger.info(f"Imported {num_imported} entries from {file}.")
 
-def _write_file(use_global: bool, data: dict[str, Any]):
-    filename = _get_filename(use_global)
 
-    utils.write_json_file(str(filename), data)
+def _open_store(use_global: bool, read_only: bool = False) -> DataStore:
+    return DataStore(_get_folder(use_global) / DATA_STORE_FILENAME, read_only=read_only)
 
 
-def _get_filename(use_global: bool):
+def _get_folder(use_global: bool) -> Path:
     if use_global:
-        return workstation.get_tools_folder() / DATA_FILENAME
-    return Path(os.getcwd()) / DATA_FILENAME
+        return workstation.get_tools_folder()
+    return Path(os.getcwd())
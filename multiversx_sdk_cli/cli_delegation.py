@@ -6,9 +6,9 @@ from multiversx_sdk import (
     DelegationController,
     DelegationTransactionsOutcomeParser,
     ProxyNetworkProvider,
+    Transaction,
     ValidatorPublicKey,
     ValidatorsController,
-    ValidatorsSigners,
 )
 
 from multiversx_sdk_cli import cli_shared, errors, utils
@@ -19,7 +19,10 @@ from multiversx_sdk_cli.args_validation import (
     validate_proxy_argument,
     validate_receiver_args,
 )
+from multiversx_sdk_cli.chunking import split_amount, split_items_into_chunks
 from multiversx_sdk_cli.config import get_config_for_network_providers
+from multiversx_sdk_cli.validator_keys import ValidatorKeysFile
+from multiversx_sdk_cli.validators_signing import sign_message_with_validator_keys
 
 
 def setup_parser(args: list[str], subparsers: Any) -> Any:
@@ -72,6 +75,7 @@ def setup_parser(args: list[str], subparsers: Any) -> Any:
         help="bech32 address of the delegation contract",
     )
     _add_common_arguments(args, sub)
+    cli_shared.add_nodes_per_transaction_arg(sub)
     sub.set_defaults(func=add_new_nodes)
 
     # remove nodes
@@ -90,6 +94,7 @@ def setup_parser(args: list[str], subparsers: Any) -> Any:
         help="address of the delegation contract",
     )
     _add_common_arguments(args, sub)
+    cli_shared.add_nodes_per_transaction_arg(sub)
     sub.set_defaults(func=remove_nodes)
 
     # stake nodes
@@ -108,6 +113,7 @@ def setup_parser(args: list[str], subparsers: Any) -> Any:
         help="bech32 address of the delegation contract",
     )
     _add_common_arguments(args, sub)
+    cli_shared.add_nodes_per_transaction_arg(sub)
     sub.set_defaults(func=stake_nodes)
 
     # unbond nodes
@@ -125,6 +131,7 @@ def setup_parser(args: list[str], subparsers: Any) -> Any:
         help="address of the delegation contract",
     )
     _add_common_arguments(args, sub)
+    cli_shared.add_nodes_per_transaction_arg(sub)
     sub.set_defaults(func=unbond_nodes)
 
     # unstake nodes
@@ -142,6 +149,7 @@ def setup_parser(args: list[str], subparsers: Any) -> Any:
         help="address of the delegation contract",
     )
     _add_common_arguments(args, sub)
+    cli_shared.add_nodes_per_transaction_arg(sub)
     sub.set_defaults(func=unstake_nodes)
 
     # unjail nodes
@@ -159,6 +167,7 @@ def setup_parser(args: list[str], subparsers: Any) -> Any:
         help="address of the delegation contract",
     )
     _add_common_arguments(args, sub)
+    cli_shared.add_nodes_per_transaction_arg(sub)
     sub.set_defaults(func=unjail_nodes)
 
     # delegate
@@ -465,46 +474,51 @@ def add_new_nodes(args: Any):
     )
 
     public_keys, signed_messages = _get_public_keys_and_signed_messages(args)
+    nodes = list(zip(public_keys, signed_messages))
 
+    delegation_contract = Address.new_from_bech32(args.delegation_contract)
     delegation = _get_delegation_controller(args)
-    tx = delegation.create_transaction_for_adding_nodes(
-        sender=sender,
-        nonce=sender.nonce,
-        delegation_contract=Address.new_from_bech32(args.delegation_contract),
-        public_keys=public_keys,
-        signed_messages=signed_messages,
-        guardian=guardian_and_relayer_data.guardian_address,
-        relayer=guardian_and_relayer_data.relayer_address,
-        gas_limit=args.gas_limit,
-        gas_price=args.gas_price,
+
+    chunks = split_items_into_chunks(
+        args,
+        nodes,
+        lambda chunk: delegation.factory.create_transaction_for_adding_nodes(
+            sender=sender.address,
+            delegation_contract=delegation_contract,
+            public_keys=[public_key for public_key, _ in chunk],
+            signed_messages=[signed_message for _, signed_message in chunk],
+        ).gas_limit,
     )
 
-    cli_shared.alter_transaction_and_sign_again_if_needed(
+    transactions: list[Transaction] = []
+    for index, chunk in enumerate(chunks):
+        tx = delegation.create_transaction_for_adding_nodes(
+            sender=sender,
+            nonce=sender.nonce + index,
+            delegation_contract=delegation_contract,
+            public_keys=[public_key for public_key, _ in chunk],
+            signed_messages=[signed_message for _, signed_message in chunk],
+            guardian=guardian_and_relayer_data.guardian_address,
+            relayer=guardian_and_relayer_data.relayer_address,
+            gas_limit=args.gas_limit,
+            gas_price=args.gas_price,
+        )
+        transactions.append(tx)
+
+    cli_shared.alter_transactions_and_send_or_simulate(
         args=args,
-        tx=tx,
+        transactions=transactions,
         sender=sender,
         guardian_and_relayer_data=guardian_and_relayer_data,
     )
 
-    cli_shared.send_or_simulate(tx, args)
-
 
 def _get_public_keys_and_signed_messages(args: Any) -> tuple[list[ValidatorPublicKey], list[bytes]]:
-    validators_file_path = Path(args.validators_pem).expanduser()
-    validators_file = ValidatorsSigners.new_from_pem(validators_file_path)
-    signers = validators_file.get_signers()
+    with ValidatorKeysFile(Path(args.validators_pem)) as keys_file:
+        secret_keys = keys_file.get_secret_keys()
 
     pubkey = Address.new_from_bech32(args.delegation_contract).get_public_key()
-
-    public_keys: list[ValidatorPublicKey] = []
-    signed_messages: list[bytes] = []
-    for signer in signers:
-        signed_message = signer.sign(pubkey)
-
-        public_keys.append(signer.secret_key.generate_public_key())
-        signed_messages.append(signed_message)
-
-    return public_keys, signed_messages
+    return sign_message_with_validator_keys(secret_keys, pubkey)
 
 
 def remove_nodes(args: Any):
@@ -519,35 +533,47 @@ def remove_nodes(args: Any):
 
     public_keys = _load_validators_public_keys(args)
 
+    delegation_contract = Address.new_from_bech32(args.delegation_contract)
     delegation = _get_delegation_controller(args)
-    tx = delegation.create_transaction_for_removing_nodes(
-        sender=sender,
-        nonce=sender.nonce,
-        delegation_contract=Address.new_from_bech32(args.delegation_contract),
-        public_keys=public_keys,
-        guardian=guardian_and_relayer_data.guardian_address,
-        relayer=guardian_and_relayer_data.relayer_address,
-        gas_limit=args.gas_limit,
-        gas_price=args.gas_price,
+
+    chunks = split_items_into_chunks(
+        args,
+        public_keys,
+        lambda chunk: delegation.factory.create_transaction_for_removing_nodes(
+            sender=sender.address,
+            delegation_contract=delegation_contract,
+            public_keys=chunk,
+        ).gas_limit,
     )
 
-    cli_shared.alter_transaction_and_sign_again_if_needed(
+    transactions: list[Transaction] = []
+    for index, chunk in enumerate(chunks):
+        tx = delegation.create_transaction_for_removing_nodes(
+            sender=sender,
+            nonce=sender.nonce + index,
+            delegation_contract=delegation_contract,
+            public_keys=chunk,
+            guardian=guardian_and_relayer_data.guardian_address,
+            relayer=guardian_and_relayer_data.relayer_address,
+            gas_limit=args.gas_limit,
+            gas_price=args.gas_price,
+        )
+        transactions.append(tx)
+
+    cli_shared.alter_transactions_and_send_or_simulate(
         args=args,
-        tx=tx,
+        transactions=transactions,
         sender=sender,
         guardian_and_relayer_data=guardian_and_relayer_data,
     )
 
-    cli_shared.send_or_simulate(tx, args)
-
 
 def _load_validators_public_keys(args: Any) -> list[ValidatorPublicKey]:
     if args.bls_keys:
         return _parse_public_bls_keys(args.bls_keys)
 
-    validators_file_path = Path(args.validators_pem).expanduser()
-    validators_file = ValidatorsSigners.new_from_pem(validators_file_path)
-    return validators_file.get_public_keys()
+    with ValidatorKeysFile(Path(args.validators_pem)) as keys_file:
+        return keys_file.get_public_keys()
 
 
 def _parse_public_bls_keys(public_bls_keys: str) -> list[ValidatorPublicKey]:
@@ -572,27 +598,40 @@ def stake_nodes(args: Any):
 
     public_keys = _load_validators_public_keys(args)
 
+    delegation_contract = Address.new_from_bech32(args.delegation_contract)
     delegation = _get_delegation_controller(args)
-    tx = delegation.create_transaction_for_staking_nodes(
-        sender=sender,
-        nonce=sender.nonce,
-        delegation_contract=Address.new_from_bech32(args.delegation_contract),
-        public_keys=public_keys,
-        guardian=guardian_and_relayer_data.guardian_address,
-        relayer=guardian_and_relayer_data.relayer_address,
-        gas_limit=args.gas_limit,
-        gas_price=args.gas_price,
+
+    chunks = split_items_into_chunks(
+        args,
+        public_keys,
+        lambda chunk: delegation.factory.create_transaction_for_staking_nodes(
+            sender=sender.address,
+            delegation_contract=delegation_contract,
+            public_keys=chunk,
+        ).gas_limit,
     )
 
-    cli_shared.alter_transaction_and_sign_again_if_needed(
+    transactions: list[Transaction] = []
+    for index, chunk in enumerate(chunks):
+        tx = delegation.create_transaction_for_staking_nodes(
+            sender=sender,
+            nonce=sender.nonce + index,
+            delegation_contract=delegation_contract,
+            public_keys=chunk,
+            guardian=guardian_and_relayer_data.guardian_address,
+            relayer=guardian_and_relayer_data.relayer_address,
+            gas_limit=args.gas_limit,
+            gas_price=args.gas_price,
+        )
+        transactions.append(tx)
+
+    cli_shared.alter_transactions_and_send_or_simulate(
         args=args,
-        tx=tx,
+        transactions=transactions,
         sender=sender,
         guardian_and_relayer_data=guardian_and_relayer_data,
     )
 
-    cli_shared.send_or_simulate(tx, args)
-
 
 def _check_if_either_bls_keys_or_validators_file_are_provided(args: Any):
     bls_keys = args.bls_keys
@@ -614,27 +653,40 @@ def unbond_nodes(args: Any):
 
     public_keys = _load_validators_public_keys(args)
 
+    delegation_contract = Address.new_from_bech32(args.delegation_contract)
     delegation = _get_delegation_controller(args)
-    tx = delegation.create_transaction_for_unbonding_nodes(
-        sender=sender,
-        nonce=sender.nonce,
-        delegation_contract=Address.new_from_bech32(args.delegation_contract),
-        public_keys=public_keys,
-        guardian=guardian_and_relayer_data.guardian_address,
-        relayer=guardian_and_relayer_data.relayer_address,
-        gas_limit=args.gas_limit,
-        gas_price=args.gas_price,
+
+    chunks = split_items_into_chunks(
+        args,
+        public_keys,
+        lambda chunk: delegation.factory.create_transaction_for_unbonding_nodes(
+            sender=sender.address,
+            delegation_contract=delegation_contract,
+            public_keys=chunk,
+        ).gas_limit,
     )
 
-    cli_shared.alter_transaction_and_sign_again_if_needed(
+    transactions: list[Transaction] = []
+    for index, chunk in enumerate(chunks):
+        tx = delegation.create_transaction_for_unbonding_nodes(
+            sender=sender,
+            nonce=sender.nonce + index,
+            delegation_contract=delegation_contract,
+            public_keys=chunk,
+            guardian=guardian_and_relayer_data.guardian_address,
+            relayer=guardian_and_relayer_data.relayer_address,
+            gas_limit=args.gas_limit,
+            gas_price=args.gas_price,
+        )
+        transactions.append(tx)
+
+    cli_shared.alter_transactions_and_send_or_simulate(
         args=args,
-        tx=tx,
+        transactions=transactions,
         sender=sender,
         guardian_and_relayer_data=guardian_and_relayer_data,
     )
 
-    cli_shared.send_or_simulate(tx, args)
-
 
 def unstake_nodes(args: Any):
     _check_if_either_bls_keys_or_validators_file_are_provided(args)
@@ -648,27 +700,40 @@ def unstake_nodes(args: Any):
 
     public_keys = _load_validators_public_keys(args)
 
+    delegation_contract = Address.new_from_bech32(args.delegation_contract)
     delegation = _get_delegation_controller(args)
-    tx = delegation.create_transaction_for_unstaking_nodes(
-        sender=sender,
-        nonce=sender.nonce,
-        delegation_contract=Address.new_from_bech32(args.delegation_contract),
-        public_keys=public_keys,
-        guardian=guardian_and_relayer_data.guardian_address,
-        relayer=guardian_and_relayer_data.relayer_address,
-        gas_limit=args.gas_limit,
-        gas_price=args.gas_price,
+
+    chunks = split_items_into_chunks(
+        args,
+        public_keys,
+        lambda chunk: delegation.factory.create_transaction_for_unstaking_nodes(
+            sender=sender.address,
+            delegation_contract=delegation_contract,
+            public_keys=chunk,
+        ).gas_limit,
     )
 
-    cli_shared.alter_transaction_and_sign_again_if_needed(
+    transactions: list[Transaction] = []
+    for index, chunk in enumerate(chunks):
+        tx = delegation.create_transaction_for_unstaking_nodes(
+            sender=sender,
+            nonce=sender.nonce + index,
+            delegation_contract=delegation_contract,
+            public_keys=chunk,
+            guardian=guardian_and_relayer_data.guardian_address,
+            relayer=guardian_and_relayer_data.relayer_address,
+            gas_limit=args.gas_limit,
+            gas_price=args.gas_price,
+        )
+        transactions.append(tx)
+
+    cli_shared.alter_transactions_and_send_or_simulate(
         args=args,
-        tx=tx,
+        transactions=transactions,
         sender=sender,
         guardian_and_relayer_data=guardian_and_relayer_data,
     )
 
-    cli_shared.send_or_simulate(tx, args)
-
 
 def unjail_nodes(args: Any):
     _check_if_either_bls_keys_or_validators_file_are_provided(args)
@@ -684,28 +749,43 @@ def unjail_nodes(args: Any):
 
     public_keys = _load_validators_public_keys(args)
 
+    delegation_contract = Address.new_from_bech32(args.delegation_contract)
     delegation = _get_delegation_controller(args)
-    tx = delegation.create_transaction_for_unjailing_nodes(
-        sender=sender,
-        nonce=sender.nonce,
-        delegation_contract=Address.new_from_bech32(args.delegation_contract),
-        public_keys=public_keys,
-        amount=int(args.value),
-        guardian=guardian_and_relayer_data.guardian_address,
-        relayer=guardian_and_relayer_data.relayer_address,
-        gas_limit=args.gas_limit,
-        gas_price=args.gas_price,
-    )
 
-    cli_shared.alter_transaction_and_sign_again_if_needed(
+    chunks = split_items_into_chunks(
+        args,
+        public_keys,
+        lambda chunk: delegation.factory.create_transaction_for_unjailing_nodes(
+            sender=sender.address,
+            delegation_contract=delegation_contract,
+            public_keys=chunk,
+            amount=int(args.value),
+        ).gas_limit,
+    )
+    amounts = split_amount(int(args.value), chunks)
+
+    transactions: list[Transaction] = []
+    for index, chunk in enumerate(chunks):
+        tx = delegation.create_transaction_for_unjailing_nodes(
+            sender=sender,
+            nonce=sender.nonce + index,
+            delegation_contract=delegation_contract,
+            public_keys=chunk,
+            amount=amounts[index],
+            guardian=guardian_and_relayer_data.guardian_address,
+            relayer=guardian_and_relayer_data.relayer_address,
+            gas_limit=args.gas_limit,
+            gas_price=args.gas_price,
+        )
+        transactions.append(tx)
+
+    cli_shared.alter_transactions_and_send_or_simulate(
         args=args,
-        tx=tx,
+        transactions=transactions,
         sender=sender,
         guardian_and_relayer_data=guardian_and_relayer_data,
     )
 
-    cli_shared.send_or_simulate(tx, args)
-
 
 def delegate(args: Any):
     validate_arguments(args)
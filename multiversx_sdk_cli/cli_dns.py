@@ -1,23 +1,28 @@
+from pathlib import Path
 from typing import Any
 
 from multiversx_sdk import ProxyNetworkProvider
 from rich.console import Console
 from rich.table import Table
 
-from multiversx_sdk_cli import cli_shared
+from multiversx_sdk_cli import cli_shared, utils
 from multiversx_sdk_cli.config import get_config_for_network_providers
 from multiversx_sdk_cli.constants import ADDRESS_ZERO_HEX
 from multiversx_sdk_cli.dns import (
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_NUM_RESOLVE_WORKERS,
     compute_dns_address_for_shard_id,
     dns_address_for_name,
     name_hash,
     register,
     registration_cost,
     resolve,
+    resolve_many,
     validate_name,
     version,
 )
 from multiversx_sdk_cli.errors import ArgumentsNotProvidedError
+from multiversx_sdk_cli.pooled_proxy import PooledProxyNetworkProvider
 
 
 def setup_parser(args: list[str], subparsers: Any) -> Any:
@@ -41,7 +46,24 @@ def setup_parser(args: list[str], subparsers: Any) -> Any:
     sub.set_defaults(func=register)
 
     sub = cli_shared.add_command_subparser(subparsers, "dns", "resolve", "Find the address for a name")
-    _add_name_arg(sub)
+    sub.add_argument("name", nargs="?", help="the name for which to check")
+    sub.add_argument(
+        "--names-file",
+        help="a file holding many names to resolve, one per line; the output is a JSON object (name to address)",
+    )
+    sub.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_NUM_RESOLVE_WORKERS,
+        help="the number of concurrent queries, when resolving a file of names (default: %(default)s)",
+    )
+    sub.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=DEFAULT_DNS_CACHE_TTL,
+        help="for how many seconds to reuse the locally cached results, when resolving a file of names; "
+        "0 disables the cache (default: %(default)s)",
+    )
     cli_shared.add_proxy_arg(sub)
     sub.set_defaults(func=dns_resolve)
 
@@ -138,12 +160,33 @@ def _ensure_proxy_is_provided(args: Any):
 def dns_resolve(args: Any):
     _ensure_proxy_is_provided(args)
 
+    if args.names_file:
+        _resolve_names_file(args)
+        return
+    if not args.name:
+        raise ArgumentsNotProvidedError("either a name or '--names-file' must be provided")
+
     config = get_config_for_network_providers()
     addr = resolve(args.name, ProxyNetworkProvider(url=args.proxy, config=config))
     if addr.to_hex() != ADDRESS_ZERO_HEX:
         print(addr.to_bech32())
 
 
+def _resolve_names_file(args: Any):
+    lines = Path(args.names_file).expanduser().read_text().splitlines()
+    names = [line.strip() for line in lines if line.strip()]
+
+    config = get_config_for_network_providers()
+    with PooledProxyNetworkProvider(url=args.proxy, config=config, pool_size=args.concurrency) as proxy:
+        addresses = resolve_many(names, proxy, args.proxy, num_workers=args.concurrency, cache_ttl=args.cache_ttl)
+
+    result = {
+        name: (address.to_bech32() if address.to_hex() != ADDRESS_ZERO_HEX else "")
+        for name, address in addresses.items()
+    }
+    utils.dump_out_json(result)
+
+
 def dns_validate_name(args: Any):
     _ensure_proxy_is_provided(args)
 
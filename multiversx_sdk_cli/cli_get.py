@@ -1,19 +1,64 @@
+import json
 import logging
-from typing import Any, Optional
+import sys
+from pathlib import Path
+from typing import Any, Iterator, Optional
 
 from multiversx_sdk import Address
 from multiversx_sdk import NetworkProviderError as SDKNetworkProviderError
 from multiversx_sdk import ProxyNetworkProvider, Token, TokenComputer
+from multiversx_sdk.abi import Abi
 
-from multiversx_sdk_cli import cli_shared
+from multiversx_sdk_cli import cli_shared, storage_streaming
+from multiversx_sdk_cli.account_watching import (
+    DEFAULT_MAX_INTERVAL_IN_ROUNDS,
+    AccountWatcher,
+    watch,
+)
+from multiversx_sdk_cli.bulk_fetching import (
+    DEFAULT_NUM_WORKERS,
+    RateLimiter,
+    RecordsWriter,
+    create_records_writer,
+    fetch_concurrently,
+)
 from multiversx_sdk_cli.config import get_config_for_network_providers
 from multiversx_sdk_cli.config_env import MxpyEnv
 from multiversx_sdk_cli.errors import (
     ArgumentsNotProvidedError,
     BadUsage,
+    BadUserInput,
     NetworkProviderError,
 )
-from multiversx_sdk_cli.utils import dump_out_json
+from multiversx_sdk_cli.pooled_proxy import (
+    PooledApiNetworkProvider,
+    PooledProxyNetworkProvider,
+)
+from multiversx_sdk_cli.storage_entries import (
+    KEY_PLACEHOLDER_PATTERN,
+    StorageKey,
+    StorageValueDecoder,
+    expand_key_template,
+    fetch_storage_entry,
+    parse_range,
+    read_addresses,
+)
+from multiversx_sdk_cli.transactions_history import (
+    DEFAULT_NUM_PREFETCHED_PAGES,
+    DEFAULT_PAGE_SIZE,
+    HISTORY_INTEGER_FIELDS,
+    HISTORY_RECORD_FIELDS,
+    MAX_LISTING_WINDOW,
+    HistoryCursor,
+    TransactionsHistory,
+    parse_time,
+    to_history_record,
+)
+from multiversx_sdk_cli.transactions_lookup import (
+    TRANSACTION_RECORD_FIELDS,
+    TransactionsLookup,
+)
+from multiversx_sdk_cli.utils import BasicEncoder, dump_out_json
 
 logger = logging.getLogger("cli.get")
 
@@ -33,14 +78,86 @@ def setup_parser(subparsers: Any) -> Any:
         required=False,
         help="whether to only fetch the balance of the address",
     )
+    sub.add_argument(
+        "--watch",
+        action="store_true",
+        default=False,
+        help="keep polling the account (or the accounts of --addresses-file) and output the changes "
+        "(nonce, balance, tokens, storage) as JSON Lines events; polls every round while the accounts change, "
+        "less often otherwise",
+    )
+    sub.add_argument("--addresses-file", type=str, help="a file with an address on each line, for --watch")
+    sub.add_argument("--with-tokens", action="store_true", default=False, help="also watch the tokens, for --watch")
+    sub.add_argument("--with-storage", action="store_true", default=False, help="also watch the storage, for --watch")
+    sub.add_argument(
+        "--max-interval",
+        type=float,
+        help=f"the maximum time between polls, in seconds, for --watch "
+        f"(default: {DEFAULT_MAX_INTERVAL_IN_ROUNDS} rounds)",
+    )
+    sub.add_argument("--polls", type=int, help="stop after this many polls, for --watch (default: never stop)")
     sub.set_defaults(func=get_account)
 
+    sub = cli_shared.add_command_subparser(
+        subparsers,
+        "get",
+        "accounts",
+        "Get a snapshot of many accounts (nonce, balance, username) and, optionally, of their tokens. "
+        "The accounts are fetched concurrently and saved as they arrive; an interrupted snapshot can be resumed.",
+    )
+    sub.add_argument(
+        "--file",
+        required=True,
+        help="a file with an address on each line, optionally followed by token identifiers (separated by spaces)",
+    )
+    sub.add_argument(
+        "--token",
+        action="append",
+        default=[],
+        help="a token identifier to fetch for every address (e.g. FNG-123456, NFT-987654-0a); can be repeated",
+    )
+    sub.add_argument("--outfile", required=True, help="where to save the snapshot")
+    sub.add_argument(
+        "--format", choices=["jsonl", "csv"], default="jsonl", help="the format of the snapshot (default: %(default)s)"
+    )
+    _add_concurrency_args(sub)
+    sub.add_argument(
+        "--resume",
+        action="store_true",
+        default=False,
+        help="continue an interrupted run: keep the entries already saved to the outfile, fetch only the others",
+    )
+    _add_proxy_arg(sub)
+    sub.set_defaults(func=get_accounts)
+
     sub = cli_shared.add_command_subparser(
         subparsers, "get", "storage", "Get the storage (key-value pairs) of an account."
     )
     _add_alias_arg(sub)
     _add_address_arg(sub)
     _add_proxy_arg(sub)
+    sub.add_argument(
+        "--stream",
+        action="store_true",
+        default=False,
+        help="output the key-value pairs one per line (JSON Lines) as they are received, with the keys decoded "
+        "(readable prefix, rest); meant for very large contracts",
+    )
+    sub.add_argument(
+        "--prefix",
+        type=str,
+        help="only the keys starting with this prefix (text, or hex if starting with 0x); implies --stream",
+    )
+    sub.add_argument(
+        "--snapshot",
+        type=str,
+        help="also save the (filtered) pairs to this file (gzipped JSON Lines); implies --stream",
+    )
+    sub.add_argument(
+        "--diff",
+        type=str,
+        help="only output the keys added, modified or removed since this snapshot; implies --stream",
+    )
     sub.set_defaults(func=get_storage)
 
     sub = cli_shared.add_command_subparser(
@@ -49,7 +166,24 @@ def setup_parser(subparsers: Any) -> Any:
     _add_alias_arg(sub)
     _add_address_arg(sub)
     _add_proxy_arg(sub)
-    sub.add_argument("--key", type=str, required=True, help="the storage key to read from")
+    sub.add_argument(
+        "--key",
+        type=str,
+        required=True,
+        action="append",
+        help="the storage key to read from; can be repeated. A key can hold placeholders: {address} (replaced by "
+        "each of --addresses-file), {index} (replaced by each of --range, as u32) and {0x...} (raw bytes)",
+    )
+    sub.add_argument("--addresses-file", type=str, help="a file with an address on each line, for {address}")
+    sub.add_argument("--range", type=str, help="the indices for {index}, as start:end (inclusive)")
+    sub.add_argument(
+        "--value-type",
+        type=str,
+        help="decode the values, given their type, as in an ABI (e.g. BigUint, Address, List<u64>, "
+        "or a custom type of --abi)",
+    )
+    sub.add_argument("--abi", type=str, help="the ABI file declaring the custom type of --value-type")
+    _add_concurrency_args(sub)
     sub.set_defaults(func=get_key)
 
     sub = cli_shared.add_command_subparser(subparsers, "get", "token", "Get a token of an account.")
@@ -64,11 +198,79 @@ def setup_parser(subparsers: Any) -> Any:
     )
     sub.set_defaults(func=get_token)
 
-    sub = cli_shared.add_command_subparser(subparsers, "get", "transaction", "Get a transaction from the network.")
+    sub = cli_shared.add_command_subparser(
+        subparsers,
+        "get",
+        "transaction",
+        "Get a transaction from the network. Given a file of hashes, many transactions are fetched concurrently, "
+        "and their outcome (status, gas used, fee, return values) is saved as a table.",
+    )
     _add_proxy_arg(sub)
-    sub.add_argument("--hash", type=str, required=True, help="the transaction hash")
+    sub.add_argument("--hash", type=str, help="the transaction hash")
+    sub.add_argument("--hashes-file", type=str, help="a file with a transaction hash on each line")
+    sub.add_argument("--outfile", type=str, help="where to save the outcome of the transactions (with --hashes-file)")
+    sub.add_argument(
+        "--format", choices=["jsonl", "csv"], default="jsonl", help="the format of the outfile (default: %(default)s)"
+    )
+    sub.add_argument(
+        "--wait",
+        action="store_true",
+        default=False,
+        help="wait for the pending transactions to be completed (with --hashes-file)",
+    )
+    sub.add_argument(
+        "--timeout",
+        type=int,
+        default=100,
+        help="how long to wait for a pending transaction, in seconds (default: %(default)s)",
+    )
+    sub.add_argument(
+        "--abi",
+        type=str,
+        help="the ABI of the contract, to decode the return values and the events (with --hashes-file)",
+    )
+    _add_concurrency_args(sub)
     sub.set_defaults(func=get_transaction)
 
+    sub = cli_shared.add_command_subparser(
+        subparsers,
+        "get",
+        "transactions",
+        "Export the transaction history of an account (oldest first), with the function names and the token "
+        "transfers decoded. The pages are fetched from the API in parallel; an interrupted export can be resumed.",
+    )
+    _add_alias_arg(sub)
+    _add_address_arg(sub)
+    sub.add_argument("--from", dest="start", type=str, help="the start time (Unix timestamp or ISO 8601 date, UTC)")
+    sub.add_argument("--to", dest="end", type=str, help="the end time (Unix timestamp or ISO 8601 date, UTC)")
+    sub.add_argument("--outfile", required=True, help="where to save the history")
+    sub.add_argument(
+        "--format",
+        choices=["csv", "jsonl", "parquet"],
+        default="csv",
+        help="the format of the history (default: %(default)s); parquet requires pyarrow",
+    )
+    sub.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help="the number of transactions per request (default: %(default)s)",
+    )
+    sub.add_argument(
+        "--prefetch",
+        type=int,
+        default=DEFAULT_NUM_PREFETCHED_PAGES,
+        help="the number of pages fetched in parallel (default: %(default)s)",
+    )
+    sub.add_argument(
+        "--resume",
+        action="store_true",
+        default=False,
+        help="continue an interrupted export: keep the transactions already saved, fetch only the newer ones",
+    )
+    sub.add_argument("--api", type=str, help="the API url (e.g. https://api.multiversx.com)")
+    sub.set_defaults(func=get_transactions)
+
     sub = cli_shared.add_command_subparser(subparsers, "get", "network-config", "Get the network configuration.")
     _add_proxy_arg(sub)
     sub.set_defaults(func=get_network_config)
@@ -96,6 +298,21 @@ def _add_address_arg(sub: Any):
     sub.add_argument("--address", type=str, help="the bech32 address")
 
 
+def _add_concurrency_args(sub: Any):
+    sub.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_NUM_WORKERS,
+        help="the number of concurrent requests (default: %(default)s)",
+    )
+    sub.add_argument(
+        "--rate-limit",
+        type=float,
+        default=0,
+        help="the maximum number of requests per second (default: unlimited)",
+    )
+
+
 def _add_proxy_arg(sub: Any):
     sub.add_argument("--proxy", type=str, help="the proxy url")
 
@@ -104,12 +321,20 @@ def get_account(args: Any):
     if args.alias and args.address:
         raise BadUsage("Provide either '--alias' or '--address'")
 
+    if args.watch and args.addresses_file:
+        watch_accounts(args, read_addresses(Path(args.addresses_file)))
+        return
+
     if args.address:
         address = Address.new_from_bech32(args.address)
     else:
         hrp = cli_shared.get_address_hrp_with_fallback(args)
         address = _get_address_from_alias_or_config(args.alias, hrp)
 
+    if args.watch:
+        watch_accounts(args, [address])
+        return
+
     proxy = _get_proxy(args)
 
     logger.info(f"Fetching details about {address.to_bech32()}")
@@ -121,6 +346,108 @@ def get_account(args: Any):
         dump_out_json(response.raw)
 
 
+ACCOUNT_SNAPSHOT_FIELDS = ["address", "token", "nonce", "balance", "username", "isGuarded"]
+
+
+def get_accounts(args: Any):
+    if args.concurrency < 1:
+        raise BadUsage("--concurrency must be a positive number")
+
+    _get_proxy(args)
+    outfile = Path(args.outfile).expanduser()
+
+    with RecordsWriter(outfile, args.format, ACCOUNT_SNAPSHOT_FIELDS, resume=args.resume) as writer:
+        done = {(record["address"], record["token"]) for record in writer.existing_records}
+        if done:
+            logger.info(f"Resuming: {len(done)} entries already saved.")
+
+        items = (item for item in _read_account_snapshot_items(Path(args.file), args.token) if item not in done)
+        failures: list[dict[str, str]] = []
+        num_fetched = 0
+
+        config = get_config_for_network_providers()
+        with PooledProxyNetworkProvider(url=args.proxy, config=config, pool_size=args.concurrency) as proxy:
+
+            def fetch(item: tuple[str, str]) -> dict[str, Any]:
+                return _fetch_account_snapshot_record(proxy, *item)
+
+            results = fetch_concurrently(items, fetch, args.concurrency, RateLimiter(args.rate_limit))
+
+            for result in results:
+                if result.error:
+                    address, token = result.item
+                    failures.append({"address": address, "token": token, "error": str(result.error)})
+                    continue
+
+                writer.write(result.value)
+                num_fetched += 1
+
+    if failures:
+        logger.warning(f"Could not fetch {len(failures)} entries. Run again with --resume to retry them.")
+
+    dump_out_json({"numFetched": num_fetched, "numSkipped": len(done), "failures": failures})
+
+
+def _read_account_snapshot_items(path: Path, tokens: list[str]) -> Iterator[tuple[str, str]]:
+    with open(path.expanduser()) as f:
+        for line_number, line in enumerate(f, start=1):
+            parts = line.replace(",", " ").split()
+            if not parts or parts[0].startswith("#"):
+                continue
+
+            address = parts[0]
+            try:
+                Address.new_from_bech32(address)
+            except Exception:
+                raise BadUserInput(f"invalid address on line {line_number}: {address}")
+
+            yield address, ""
+            for token in parts[1:] + tokens:
+                yield address, token
+
+
+def _fetch_account_snapshot_record(proxy: ProxyNetworkProvider, address: str, token: str) -> dict[str, Any]:
+    if token:
+        token_computer = TokenComputer()
+        identifier = token_computer.extract_identifier_from_extended_identifier(token)
+        nonce = token_computer.extract_nonce_from_extended_identifier(token)
+        amount = proxy.get_token_of_account(Address.new_from_bech32(address), Token(identifier, nonce))
+        return {"address": address, "token": token, "balance": str(amount.amount)}
+
+    account = proxy.get_account(Address.new_from_bech32(address))
+    return {
+        "address": address,
+        "token": "",
+        "nonce": account.nonce,
+        "balance": str(account.balance),
+        "username": account.username,
+        "isGuarded": account.is_guarded,
+    }
+
+
+def watch_accounts(args: Any, addresses: list[Address]):
+    _get_proxy(args)
+
+    round_duration = cli_shared.get_network_config(args.proxy).round_duration / 1000
+    max_interval = args.max_interval or round_duration * DEFAULT_MAX_INTERVAL_IN_ROUNDS
+
+    def on_events(events: list[dict[str, Any]]):
+        for event in events:
+            sys.stdout.write(json.dumps(event) + "\n")
+        sys.stdout.flush()
+
+    logger.info(f"Watching {len(addresses)} accounts. Press Ctrl+C to stop.")
+    config = get_config_for_network_providers()
+
+    with PooledProxyNetworkProvider(url=args.proxy, config=config) as proxy:
+        watcher = AccountWatcher(proxy, addresses, with_tokens=args.with_tokens, with_storage=args.with_storage)
+
+        try:
+            watch(watcher, round_duration, max(max_interval, round_duration), on_events, num_polls=args.polls)
+        except KeyboardInterrupt:
+            logger.info("Stopped watching.")
+
+
 def get_storage(args: Any):
     if args.alias and args.address:
         raise BadUsage("Provide either '--alias' or '--address'")
@@ -133,12 +460,41 @@ def get_storage(args: Any):
 
     proxy = _get_proxy(args)
 
+    if args.stream or args.prefix or args.snapshot or args.diff:
+        stream_storage(args, address)
+        return
+
     logger.info(f"Fetching details about {address.to_bech32()}")
     response = proxy.get_account_storage(address)
 
     dump_out_json(response.raw)
 
 
+def stream_storage(args: Any, address: Address):
+    prefix = storage_streaming.parse_key_prefix(args.prefix) if args.prefix else None
+    previous = storage_streaming.load_snapshot(Path(args.diff).expanduser(), prefix) if args.diff else None
+
+    logger.info(f"Streaming the storage of {address.to_bech32()}")
+    config = get_config_for_network_providers()
+
+    with PooledProxyNetworkProvider(url=args.proxy, config=config) as proxy:
+        pairs = storage_streaming.fetch_storage_pairs(proxy, address)
+        pairs = storage_streaming.filter_by_prefix(pairs, prefix)
+
+        if args.snapshot:
+            pairs = storage_streaming.save_snapshot(pairs, Path(args.snapshot).expanduser())
+
+        records: Iterator[dict[str, Any]]
+        if previous is not None:
+            records = storage_streaming.diff_storage(pairs, previous)
+        else:
+            records = ({"key": key, "value": value} for key, value in pairs)
+
+        for record in records:
+            record["decodedKey"] = storage_streaming.decode_key(record["key"])
+            sys.stdout.write(json.dumps(record) + "\n")
+
+
 def get_key(args: Any):
     if args.alias and args.address:
         raise BadUsage("Provide either '--alias' or '--address'")
@@ -151,15 +507,59 @@ def get_key(args: Any):
 
     proxy = _get_proxy(args)
 
+    is_template = any(KEY_PLACEHOLDER_PATTERN.search(key) for key in args.key)
+    if len(args.key) > 1 or is_template or args.value_type:
+        get_keys(args, address)
+        return
+
     logger.info(f"Fetching details about {address.to_bech32()}")
     try:
-        response = proxy.get_account_storage_entry(address, args.key)
+        response = proxy.get_account_storage_entry(address, args.key[0])
     except SDKNetworkProviderError as e:
         raise NetworkProviderError(e.url, e.data)
 
     dump_out_json(response.raw)
 
 
+def get_keys(args: Any, address: Address):
+    if args.concurrency < 1:
+        raise BadUsage("--concurrency must be a positive number")
+
+    addresses = read_addresses(Path(args.addresses_file)) if args.addresses_file else []
+    indices = parse_range(args.range) if args.range else range(0)
+    abi_path = Path(args.abi).expanduser() if args.abi else None
+    decoder = StorageValueDecoder(args.value_type, abi_path) if args.value_type else None
+
+    keys = (key for template in args.key for key in expand_key_template(template, addresses, indices))
+
+    logger.info(f"Fetching storage entries of {address.to_bech32()}")
+    config = get_config_for_network_providers()
+
+    with PooledProxyNetworkProvider(url=args.proxy, config=config, pool_size=args.concurrency) as proxy:
+
+        def fetch(key: StorageKey) -> bytes:
+            return fetch_storage_entry(proxy, address, key.key)
+
+        for result in fetch_concurrently(keys, fetch, args.concurrency, RateLimiter(args.rate_limit)):
+            record: dict[str, Any] = {"key": result.item.name, "keyHex": result.item.key.hex()}
+
+            if result.error:
+                record["error"] = str(result.error)
+            else:
+                record["value"] = result.value.hex()
+                if decoder:
+                    record["decodedValue"] = _decode_storage_value(decoder, result.value)
+
+            sys.stdout.write(json.dumps(record, cls=BasicEncoder) + "\n")
+
+
+def _decode_storage_value(decoder: StorageValueDecoder, value: bytes) -> Any:
+    try:
+        return decoder.decode(value)
+    except Exception as error:
+        return {"error": f"cannot decode: {error}"}
+
+
 def get_token(args: Any):
     if args.alias and args.address:
         raise BadUsage("Provide either '--alias' or '--address'")
@@ -185,6 +585,13 @@ def get_token(args: Any):
 
 
 def get_transaction(args: Any):
+    if bool(args.hash) == bool(args.hashes_file):
+        raise BadUsage("Provide either '--hash' or '--hashes-file'")
+
+    if args.hashes_file:
+        get_transactions_outcome(args)
+        return
+
     proxy = _get_proxy(args)
     try:
         response = proxy.get_transaction(args.hash)
@@ -196,6 +603,98 @@ def get_transaction(args: Any):
     dump_out_json(response.raw)
 
 
+def get_transactions_outcome(args: Any):
+    if not args.outfile:
+        raise BadUsage("--outfile is required with --hashes-file")
+    if args.concurrency < 1:
+        raise BadUsage("--concurrency must be a positive number")
+
+    _get_proxy(args)
+    hashes = _read_transaction_hashes(Path(args.hashes_file))
+    abi = Abi.load(Path(args.abi).expanduser()) if args.abi else None
+    outfile = Path(args.outfile).expanduser()
+    num_failed = 0
+
+    config = get_config_for_network_providers()
+    with PooledProxyNetworkProvider(url=args.proxy, config=config, pool_size=args.concurrency) as proxy:
+        lookup = TransactionsLookup(proxy, abi, args.wait, args.timeout)
+
+        with RecordsWriter(outfile, args.format, TRANSACTION_RECORD_FIELDS) as writer:
+            results = fetch_concurrently(hashes, lookup.fetch, args.concurrency, RateLimiter(args.rate_limit))
+
+            for result in results:
+                if result.error:
+                    writer.write({"hash": result.item, "error": str(result.error)})
+                    num_failed += 1
+                    continue
+
+                writer.write(lookup.to_record(result.value))
+
+    if num_failed:
+        logger.warning(f"Could not fetch {num_failed} transactions (see the 'error' field).")
+
+    dump_out_json({"numTransactions": len(hashes), "numFailed": num_failed})
+
+
+def _read_transaction_hashes(path: Path) -> list[str]:
+    hashes: list[str] = []
+
+    with open(path.expanduser()) as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            hash = line.split()[0]
+            try:
+                bytes.fromhex(hash)
+            except ValueError:
+                raise BadUserInput(f"invalid transaction hash on line {line_number}: {hash}")
+
+            hashes.append(hash)
+
+    return hashes
+
+
+def get_transactions(args: Any):
+    if args.alias and args.address:
+        raise BadUsage("Provide either '--alias' or '--address'")
+    if not args.api:
+        raise ArgumentsNotProvidedError("'--api' was not provided")
+    if not 0 < args.page_size <= MAX_LISTING_WINDOW:
+        raise BadUsage(f"--page-size must be between 1 and {MAX_LISTING_WINDOW}")
+    if args.prefetch < 1:
+        raise BadUsage("--prefetch must be a positive number")
+
+    if args.address:
+        address = Address.new_from_bech32(args.address)
+    else:
+        hrp = cli_shared.get_address_hrp_with_fallback(args)
+        address = _get_address_from_alias_or_config(args.alias, hrp)
+
+    start = parse_time(args.start) if args.start else 0
+    end = parse_time(args.end) if args.end else 0
+    outfile = Path(args.outfile).expanduser()
+    num_saved = 0
+
+    with create_records_writer(
+        outfile, args.format, HISTORY_RECORD_FIELDS, args.resume, HISTORY_INTEGER_FIELDS
+    ) as writer:
+        cursor = HistoryCursor.from_records(writer.existing_records)
+        if writer.existing_records:
+            logger.info(f"Resuming: {len(writer.existing_records)} transactions already saved.")
+
+        config = get_config_for_network_providers()
+        with PooledApiNetworkProvider(url=args.api, config=config, pool_size=args.prefetch) as api:
+            history = TransactionsHistory(api, address, start, end, args.page_size, args.prefetch)
+
+            for transaction in history.fetch(cursor):
+                writer.write(to_history_record(address, transaction))
+                num_saved += 1
+
+    dump_out_json({"numSaved": num_saved, "numSkipped": len(writer.existing_records)})
+
+
 def get_network_config(args: Any):
     proxy = _get_proxy(args)
     config = proxy.get_network_config()
@@ -1,9 +1,13 @@
 import logging
+from pathlib import Path
 from typing import Any
 
-from multiversx_sdk import LedgerApp
-
-from multiversx_sdk_cli import cli_shared
+from multiversx_sdk_cli import cli_shared, utils
+from multiversx_sdk_cli.ledger_session import LedgerSession
+from multiversx_sdk_cli.transactions import (
+    load_transactions_from_jsonl,
+    save_transactions_to_jsonl,
+)
 
 logger = logging.getLogger("cli.ledger")
 
@@ -30,18 +34,46 @@ def setup_parser(subparsers: Any) -> Any:
     )
     sub.set_defaults(func=print_version)
 
+    sub = cli_shared.add_command_subparser(
+        subparsers,
+        "ledger",
+        "sign-transactions",
+        "Sign a batch of transactions (JSON Lines) on the device, within a single connection",
+    )
+    sub.add_argument("--infile", required=True, help="the file holding the transactions, one per line (JSON Lines)")
+    sub.add_argument("--outfile", required=True, help="where to save the signed transactions (JSON Lines)")
+    sub.add_argument(
+        "--address-index",
+        type=int,
+        default=0,
+        help="the index of the address used for signing (default: %(default)s)",
+    )
+    sub.set_defaults(func=sign_transactions)
+
     return subparsers
 
 
 def print_addresses(args: Any):
-    ledger_app = LedgerApp()
-    for i in range(args.num_addresses):
-        address = ledger_app.get_address(i)
-        print("account index = %d | address index = %d | address: %s" % (0, i, address))
-    ledger_app.close()
+    with LedgerSession() as session:
+        for i, address in enumerate(session.get_addresses(0, args.num_addresses)):
+            print("account index = %d | address index = %d | address: %s" % (0, i, address.to_bech32()))
 
 
 def print_version(args: Any):
-    ledger_app = LedgerApp()
-    print("MultiversX App version: " + ledger_app.get_version())
-    ledger_app.close()
+    with LedgerSession() as session:
+        print("MultiversX App version: " + session.get_version())
+
+
+def sign_transactions(args: Any):
+    with open(Path(args.infile).expanduser()) as f:
+        transactions = load_transactions_from_jsonl(f)
+
+    with LedgerSession() as session:
+        session.sign_transactions(transactions, args.address_index)
+        report = session.get_latency_report()
+
+    with open(Path(args.outfile).expanduser(), "w") as f:
+        save_transactions_to_jsonl(transactions, f)
+
+    logger.info(f"Signed transactions saved: {args.outfile}")
+    utils.dump_out_json(report)
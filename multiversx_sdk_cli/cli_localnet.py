@@ -29,6 +29,7 @@ def setup_parser(args: list[str], subparsers: Any) -> Any:
         "Set up a localnet (runs 'prerequisites', 'build' and 'config' in one go)",
     )
     add_argument_configfile(sub)
+    add_argument_no_cache(sub)
     sub.set_defaults(func=localnet_setup)
 
     # New
@@ -83,6 +84,7 @@ def setup_parser(args: list[str], subparsers: Any) -> Any:
         "Configure a localnet (required before starting it the first time or after clean)",
     )
     add_argument_configfile(sub)
+    add_argument_no_cache(sub)
     sub.set_defaults(func=localnet_config)
 
     # Clean
@@ -107,6 +109,15 @@ def add_argument_configfile(parser: Any):
     )
 
 
+def add_argument_no_cache(parser: Any):
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Do not use (nor save) cached workspace templates; configure the localnet from scratch",
+    )
+
+
 def localnet_new(args: Any):
     logger.info("New localnet (creating configuration file)...")
 
@@ -148,7 +159,7 @@ def localnet_config(args: Any):
     logger.info("Configuring localnet...")
     guard_configfile(args)
 
-    step_config.configure(configfile=args.configfile)
+    step_config.configure(configfile=args.configfile, use_cache=not args.no_cache)
 
     ux.show_message("Localnet configured. In order to start it, run:\n\n$ mxpy localnet start")
 
@@ -167,7 +178,7 @@ def localnet_setup(args: Any):
     step_prerequisites.fetch_prerequisites(configfile=args.configfile)
     step_build_software.build(configfile=args.configfile, software_components=["node", "seednode", "proxy"])
     step_clean.clean(configfile=args.configfile)
-    step_config.configure(configfile=args.configfile)
+    step_config.configure(configfile=args.configfile, use_cache=not args.no_cache)
 
     ux.show_message("Localnet setup complete. In order to start it, run:\n\n$ mxpy localnet start")
 
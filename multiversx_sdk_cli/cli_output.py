@@ -5,7 +5,6 @@ from typing import Any, Optional, Union
 
 from multiversx_sdk import Address, Transaction, TransactionOnNetwork
 
-from multiversx_sdk_cli import utils
 from multiversx_sdk_cli.utils import ISerializable
 
 logger = logging.getLogger("cli.output")
@@ -52,13 +51,14 @@ class CLIOutputBuilder:
         return self
 
     def build(self) -> dict[str, Any]:
-        output: dict[str, Any] = OrderedDict()
+        output: dict[str, Any] = {}
 
         if self.emitted_transaction:
-            emitted_transaction_dict = self.emitted_transaction.to_dictionary()
+            emitted_transaction_dict = _without_fields(
+                self.emitted_transaction.to_dictionary(), self.emitted_transaction_omitted_fields
+            )
             emitted_transaction_hash = self.emitted_transaction_hash or ""
             emitted_transaction_data = self.emitted_transaction.data.decode()
-            utils.omit_fields(emitted_transaction_dict, self.emitted_transaction_omitted_fields)
 
             output["emittedTransaction"] = emitted_transaction_dict
             output["emittedTransactionData"] = emitted_transaction_data
@@ -69,9 +69,10 @@ class CLIOutputBuilder:
             output["contractAddress"] = contract_address
 
         if self.transaction_on_network:
-            transaction_on_network_dict = self.transaction_on_network.raw
-            utils.omit_fields(transaction_on_network_dict, self.transaction_on_network_omitted_fields)
-            output["transactionOnNetwork"] = transaction_on_network_dict
+            # The raw response is not copied (nor altered), unless some of its fields are omitted.
+            output["transactionOnNetwork"] = _without_fields(
+                self.transaction_on_network.raw, self.transaction_on_network_omitted_fields
+            )
 
         if self.simulation_results:
             output["simulation"] = self.simulation_results
@@ -120,3 +121,9 @@ Output example:
 {description}
 """
         return description_wrapped
+
+
+def _without_fields(data: dict[str, Any], fields: list[str]) -> dict[str, Any]:
+    if not fields:
+        return data
+    return {key: value for key, value in data.items() if key not in fields}
@@ -14,8 +14,8 @@ from multiversx_sdk import (
     Account,
     Address,
     ApiNetworkProvider,
-    GasLimitEstimator,
     LedgerAccount,
+    NetworkConfig,
     ProxyNetworkProvider,
     Token,
     TokenComputer,
@@ -23,8 +23,9 @@ from multiversx_sdk import (
     Transaction,
     TransactionComputer,
 )
+from multiversx_sdk.core.interfaces import IGasLimitEstimator
 
-from multiversx_sdk_cli import config, utils
+from multiversx_sdk_cli import config, fees, guardian_data_cache, utils
 from multiversx_sdk_cli.cli_output import CLIOutputBuilder
 from multiversx_sdk_cli.cli_password import (
     load_guardian_password,
@@ -53,11 +54,22 @@ from multiversx_sdk_cli.errors import (
     UnknownWalletAliasError,
     WalletError,
 )
+from multiversx_sdk_cli.fees import FeeParameters, LocalGasLimitEstimator
+from multiversx_sdk_cli.gas_estimation import (
+    GAS_ESTIMATES_CACHE_FILE,
+    CachingGasLimitEstimator,
+    GasEstimatesCache,
+    SimulatingGasLimitEstimator,
+)
 from multiversx_sdk_cli.guardian_relayer_data import GuardianRelayerData
 from multiversx_sdk_cli.interfaces import IAccount
+from multiversx_sdk_cli.prefetch import prefetcher
 from multiversx_sdk_cli.signing_wrapper import SigningWrapper
 from multiversx_sdk_cli.simulation import Simulator
-from multiversx_sdk_cli.transactions import send_and_wait_for_result
+from multiversx_sdk_cli.transactions import (
+    send_and_wait_for_result,
+    send_and_wait_for_results,
+)
 from multiversx_sdk_cli.utils import log_explorer_transaction
 from multiversx_sdk_cli.ux import confirm_continuation
 
@@ -268,6 +280,15 @@ def add_relayed_v3_wallet_args(args: list[str], sub: Any):
     )
 
 
+def add_nodes_per_transaction_arg(sub: Any):
+    sub.add_argument(
+        "--nodes-per-transaction",
+        type=int,
+        required=False,
+        help="the max number of nodes per transaction; if not provided, nodes are split into as many transactions as needed to fit the network's max gas per transaction",
+    )
+
+
 def add_proxy_arg(sub: Any):
     sub.add_argument("--proxy", type=str, help="🔗 the URL of the proxy")
 
@@ -470,9 +491,7 @@ def get_address_hrp_with_fallback(args: Any) -> str:
 
 
 def _get_hrp_from_proxy(args: Any) -> str:
-    network_provider_config = config.get_config_for_network_providers()
-    proxy = ProxyNetworkProvider(url=args.proxy, config=network_provider_config)
-    network_config = proxy.get_network_config()
+    network_config = get_network_config(args.proxy)
     hrp: str = network_config.raw.get("erd_address_hrp", "")
     return hrp
 
@@ -591,11 +610,21 @@ def _get_guardian_data(address: str, proxy_url: str) -> Union[dict[str, str], No
 
 
 def _fetch_guardian_data(address: str, proxy_url: str) -> dict[str, Any]:
+    return prefetcher.get(("guardian_data", proxy_url, address), _do_fetch_guardian_data, address, proxy_url)
+
+
+def _do_fetch_guardian_data(address: str, proxy_url: str) -> dict[str, Any]:
+    cached = guardian_data_cache.get_guardian_data(proxy_url, address)
+    if cached is not None:
+        return cached
+
     network_provider_config = config.get_config_for_network_providers()
     proxy = ProxyNetworkProvider(url=proxy_url, config=network_provider_config)
 
     response = proxy.do_get_generic(f"/address/{address}/guardian-data").to_dictionary()
     guardian_data: dict[str, Any] = response.get("guardianData", {})
+
+    guardian_data_cache.put_guardian_data(proxy_url, address, guardian_data)
     return guardian_data
 
 
@@ -667,11 +696,38 @@ def get_chain_id(proxy_url: str, chain_id: Optional[str] = None) -> str:
     return _fetch_chain_id(proxy_url)
 
 
-@cache
 def _fetch_chain_id(proxy_url: str) -> str:
+    return get_network_config(proxy_url).chain_id
+
+
+def get_network_config(proxy_url: str) -> NetworkConfig:
+    """The network config (HRP, chain ID, gas parameters etc.) is fetched at most once, possibly in advance (see `_prefetch_network_config`)."""
+    return prefetcher.get(("network_config", proxy_url), _do_fetch_network_config, proxy_url)
+
+
+def _do_fetch_network_config(proxy_url: str) -> NetworkConfig:
     network_provider_config = config.get_config_for_network_providers()
     proxy = ProxyNetworkProvider(url=proxy_url, config=network_provider_config)
-    return proxy.get_network_config().chain_id
+    network_config = proxy.get_network_config()
+
+    fees.save_fee_parameters(FeeParameters.new_from_network_config(network_config))
+    return network_config
+
+
+def _prefetch_network_config(args: Any):
+    """
+    For commands that create transactions, the network config (needed for the HRP and the chain ID) is fetched
+    in the background, while the wallets are being loaded. The reads that depend on the sender (nonce, guardian)
+    are issued concurrently in `_fetch_nonce_and_prefetch`.
+    """
+    if not getattr(args, "proxy", None):
+        return
+
+    needs_hrp = not getattr(args, "hrp", None)
+    needs_chain_id = not getattr(args, "chain", None)
+
+    if needs_hrp or needs_chain_id:
+        prefetcher.submit(("network_config", args.proxy), _do_fetch_network_config, args.proxy)
 
 
 def add_broadcast_args(sub: Any, simulate: bool = True):
@@ -707,15 +763,18 @@ def send_or_simulate(tx: Transaction, args: Any, dump_output: bool = True) -> CL
     output_builder.set_emitted_transaction(tx)
     outfile = args.outfile if hasattr(args, "outfile") else None
 
+    if send_wait_result or send_only:
+        guardian_data_cache.forget_changed_guardian_data([tx])
+
     hash = b""
     try:
         if send_wait_result:
-            _confirm_continuation_if_required(tx)
+            confirm_continuation_if_required(tx)
 
             transaction_on_network = send_and_wait_for_result(tx, proxy, args.timeout)
             output_builder.set_awaited_transaction(transaction_on_network)
         elif send_only:
-            _confirm_continuation_if_required(tx)
+            confirm_continuation_if_required(tx)
 
             hash = proxy.send_transaction(tx)
             output_builder.set_emitted_transaction_hash(hash.hex())
@@ -739,30 +798,127 @@ def send_or_simulate(tx: Transaction, args: Any, dump_output: bool = True) -> CL
     return output_builder
 
 
-def _confirm_continuation_if_required(tx: Transaction) -> None:
+def send_or_simulate_many(
+    transactions: list[Transaction], args: Any, dump_output: bool = True
+) -> list[CLIOutputBuilder]:
+    """Like `send_or_simulate`, but for a batch of transactions, which are broadcast (and awaited) together.
+    For a single transaction, the output is the same as the one of `send_or_simulate`; otherwise, it is a list."""
+    if len(transactions) == 1:
+        return [send_or_simulate(transactions[0], args, dump_output)]
+
+    network_provider_config = config.get_config_for_network_providers()
+    proxy = ProxyNetworkProvider(url=args.proxy, config=network_provider_config)
+
+    is_set_wait_result = hasattr(args, "wait_result") and args.wait_result
+    is_set_send = hasattr(args, "send") and args.send
+    is_set_simulate = hasattr(args, "simulate") and args.simulate
+
+    send_wait_result = is_set_wait_result and is_set_send and not is_set_simulate
+    send_only = is_set_send and not (is_set_wait_result or is_set_simulate)
+    simulate = is_set_simulate and not (send_only or send_wait_result)
+
+    output_builders = [CLIOutputBuilder().set_emitted_transaction(tx) for tx in transactions]
+    outfile = args.outfile if hasattr(args, "outfile") else None
+
+    if send_wait_result or send_only:
+        guardian_data_cache.forget_changed_guardian_data(transactions)
+
+    hashes: list[bytes] = []
+    try:
+        if send_wait_result:
+            confirm_continuation_if_required(*transactions)
+
+            transactions_on_network = send_and_wait_for_results(transactions, proxy, args.timeout)
+            for output_builder, transaction_on_network in zip(output_builders, transactions_on_network):
+                if transaction_on_network:
+                    output_builder.set_awaited_transaction(transaction_on_network)
+        elif send_only:
+            confirm_continuation_if_required(*transactions)
+
+            _, hashes = proxy.send_transactions(transactions)
+            for output_builder, hash in zip(output_builders, hashes):
+                output_builder.set_emitted_transaction_hash(hash.hex())
+        elif simulate:
+            simulator = Simulator(proxy)
+            for output_builder, tx in zip(output_builders, transactions):
+                output_builder.set_simulation_results(simulator.run(tx))
+    finally:
+        outputs = [output_builder.build() for output_builder in output_builders]
+
+        if dump_output:
+            utils.dump_out_json(outputs, outfile=outfile)
+
+        if send_only and hashes:
+            cli_config = MxpyEnv.from_active_env()
+            for output in outputs:
+                if not output["emittedTransactionHash"]:
+                    continue
+
+                log_explorer_transaction(
+                    chain=output["emittedTransaction"]["chainID"],
+                    transaction_hash=output["emittedTransactionHash"],
+                    explorer_url=cli_config.explorer_url,
+                )
+
+    return output_builders
+
+
+def confirm_continuation_if_required(*transactions: Transaction) -> None:
     env = MxpyEnv.from_active_env()
 
     if env.ask_confirmation:
-        transaction = tx.to_dictionary()
+        for tx in transactions:
+            transaction = tx.to_dictionary()
+
+            # decode the data field from base64 if it exists
+            data = base64.b64decode(transaction.get("data", "")).decode()
+            transaction["data"] = data if data else ""
 
-        # decode the data field from base64 if it exists
-        data = base64.b64decode(transaction.get("data", "")).decode()
-        transaction["data"] = data if data else ""
+            utils.dump_out_json(transaction)
 
-        utils.dump_out_json(transaction)
-        confirm_continuation("You are about to send the above transaction. Do you want to continue?")
+        if len(transactions) == 1:
+            confirm_continuation("You are about to send the above transaction. Do you want to continue?")
+        else:
+            confirm_continuation(
+                f"You are about to send the above {len(transactions)} transactions. Do you want to continue?"
+            )
 
 
 def prepare_sender(args: Any):
     """Returns the sender's account.
     If no account was provided, will raise an exception."""
+    _prefetch_network_config(args)
     sender = prepare_account(args)
-    sender.nonce = (
-        int(args.nonce) if args.nonce is not None else get_current_nonce_for_address(sender.address, args.proxy)
-    )
+    sender.nonce = int(args.nonce) if args.nonce is not None else _fetch_nonce_and_prefetch(sender.address, args)
     return sender
 
 
+def _fetch_nonce_and_prefetch(address: Address, args: Any) -> int:
+    """
+    While fetching the nonce, the guardian data and the network config (if needed later on) are fetched concurrently.
+    They are memoized, thus the subsequent calls of `_get_guardian_data` and `get_chain_id` return immediately.
+    """
+    if args.proxy:
+        if _may_need_guardian_data_from_network(args):
+            key = ("guardian_data", args.proxy, address.to_bech32())
+            prefetcher.submit(key, _do_fetch_guardian_data, address.to_bech32(), args.proxy)
+        if not getattr(args, "chain", None):
+            prefetcher.submit(("network_config", args.proxy), _do_fetch_network_config, args.proxy)
+
+    return get_current_nonce_for_address(address, args.proxy)
+
+
+def _may_need_guardian_data_from_network(args: Any) -> bool:
+    # Only commands that accept guardian arguments look up the guardian (and only if it isn't provided explicitly).
+    if not hasattr(args, "guardian_pem"):
+        return False
+
+    provided = [
+        getattr(args, name, None) for name in ["guardian", "guardian_pem", "guardian_keyfile", "guardian_ledger"]
+    ]
+    return not any(provided)
+
+
 def prepare_guardian(args: Any) -> tuple[Union[IAccount, None], Union[Address, None]]:
     """Reurns a tuple containing the guardians's account and the account's address.
     If no account or address were provided, will return (None, None)."""
@@ -823,23 +979,58 @@ def set_proxy_from_config_if_not_provided(args: Any) -> None:
             args.proxy = env.proxy_url
 
 
-def initialize_gas_limit_estimator(args: Any) -> Union[GasLimitEstimator, None]:
+def initialize_gas_limit_estimator(args: Any) -> Union[IGasLimitEstimator, None]:
+    """
+    Plain transfers and fixed-cost system calls are computed locally, from the network's fee parameters
+    (cached on disk, thus available offline). Other transactions are simulated, if a proxy is provided.
+    """
     # if gas limit is provided, we don't need GasLimitEstimator
     if hasattr(args, "gas_limit") and args.gas_limit:
         return None
 
-    # if proxy is not provided, we can't use GasLimitEstimator
-    if hasattr(args, "proxy") and not args.proxy:
-        return None
+    proxy_url = getattr(args, "proxy", None)
+    chain_id = getattr(args, "chain", None)
+    fee_parameters = fees.load_fee_parameters(chain_id) if chain_id else None
 
     if hasattr(args, "gas_limit_multiplier") and args.gas_limit_multiplier:
         multiplier: float = args.gas_limit_multiplier
     else:
         multiplier = config.get_gas_limit_multiplier_from_config()
 
+    # without a proxy, transactions cannot be simulated
+    if not proxy_url:
+        return LocalGasLimitEstimator(fee_parameters, gas_multiplier=multiplier) if fee_parameters else None
+
+    if fee_parameters is None:
+        fee_parameters = FeeParameters.new_from_network_config(get_network_config(proxy_url))
+
+    fallback = _initialize_simulating_gas_limit_estimator(proxy_url, multiplier)
+    return LocalGasLimitEstimator(fee_parameters, fallback=fallback, gas_multiplier=multiplier)
+
+
+def _initialize_simulating_gas_limit_estimator(proxy_url: str, multiplier: float) -> SimulatingGasLimitEstimator:
     network_provider_config = config.get_config_for_network_providers()
-    proxy = ProxyNetworkProvider(url=args.proxy, config=network_provider_config)
-    return GasLimitEstimator(network_provider=proxy, gas_multiplier=multiplier)
+    proxy = ProxyNetworkProvider(url=proxy_url, config=network_provider_config)
+
+    safety_margin = config.get_gas_estimation_safety_margin_from_config()
+
+    cache_size = config.get_gas_estimation_cache_size_from_config()
+    if cache_size <= 0:
+        return SimulatingGasLimitEstimator(
+            network_provider=proxy, gas_multiplier=multiplier, safety_margin=safety_margin
+        )
+
+    return CachingGasLimitEstimator(
+        network_provider=proxy,
+        cache=get_gas_estimates_cache(cache_size),
+        gas_multiplier=multiplier,
+        safety_margin=safety_margin,
+    )
+
+
+@cache
+def get_gas_estimates_cache(max_size: int) -> GasEstimatesCache:
+    return GasEstimatesCache(GAS_ESTIMATES_CACHE_FILE, max_size)
 
 
 def set_options_for_hash_signing_if_needed(
@@ -863,6 +1054,44 @@ def alter_transaction_and_sign_again_if_needed(
     sender: IAccount,
     guardian_and_relayer_data: GuardianRelayerData,
 ):
+    altered = _alter_transaction_if_needed(args, tx, guardian_and_relayer_data)
+
+    if altered:
+        # sign only if something was altered
+        _sign_transaction(tx, sender, guardian_and_relayer_data)
+    else:
+        # sign only with guardian/relayer if needed
+        _sign_transaction(tx, None, guardian_and_relayer_data)
+
+
+def alter_transactions_and_send_or_simulate(
+    args: Any,
+    transactions: list[Transaction],
+    sender: IAccount,
+    guardian_and_relayer_data: GuardianRelayerData,
+):
+    """Same as `alter_transaction_and_sign_again_if_needed` (followed by `send_or_simulate`), for a batch of transactions. Guarded transactions are co-signed together."""
+    for tx in transactions:
+        altered = _alter_transaction_if_needed(args, tx, guardian_and_relayer_data)
+
+        if altered:
+            # sign only with the sender; guardian & relayer sign below, for the whole batch
+            _sign_transaction(tx, sender)
+
+    signer = SigningWrapper()
+    signer.sign_transactions(
+        transactions=transactions,
+        guardian_and_relayer=guardian_and_relayer_data,
+    )
+
+    send_or_simulate_many(transactions, args)
+
+
+def _alter_transaction_if_needed(
+    args: Any,
+    tx: Transaction,
+    guardian_and_relayer_data: GuardianRelayerData,
+) -> bool:
     initial_tx = deepcopy(tx)
 
     set_options_for_hash_signing_if_needed(
@@ -871,19 +1100,12 @@ def alter_transaction_and_sign_again_if_needed(
         relayer=guardian_and_relayer_data.relayer,
     )
 
-    altered = _alter_version_and_options_if_provided(
+    return _alter_version_and_options_if_provided(
         args=args,
         initial_tx=initial_tx,
         transaction=tx,
     )
 
-    if altered:
-        # sign only if something was altered
-        _sign_transaction(tx, sender, guardian_and_relayer_data)
-    else:
-        # sign only with guardian/relayer if needed
-        _sign_transaction(tx, None, guardian_and_relayer_data)
-
 
 def _alter_version_and_options_if_provided(
     args: Any,
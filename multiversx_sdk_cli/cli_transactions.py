@@ -1,15 +1,23 @@
+import json
 import logging
+import os
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Optional
 
 from multiversx_sdk import (
+    Account,
     Address,
     ProxyNetworkProvider,
     TransactionComputer,
     TransfersController,
+    UserPEM,
+    UserSecretKey,
+    UserWallet,
 )
+from multiversx_sdk.core.errors import NotEnoughGasError
 
-from multiversx_sdk_cli import cli_shared, utils
+from multiversx_sdk_cli import cli_shared, guardian_data_cache, stream_signing, utils
 from multiversx_sdk_cli.args_validation import (
     ensure_relayer_wallet_args_are_provided,
     validate_broadcast_args,
@@ -19,11 +27,41 @@ from multiversx_sdk_cli.args_validation import (
     validate_receiver_args,
 )
 from multiversx_sdk_cli.cli_output import CLIOutputBuilder
+from multiversx_sdk_cli.cli_password import load_password
 from multiversx_sdk_cli.config import get_config_for_network_providers
-from multiversx_sdk_cli.errors import BadUsage, IncorrectWalletError, NoWalletProvided
+from multiversx_sdk_cli.errors import (
+    BadUsage,
+    IncorrectWalletError,
+    NoWalletProvided,
+    WalletError,
+)
+from multiversx_sdk_cli.fees import FeeCalculator, FeeParameters, load_fee_parameters
 from multiversx_sdk_cli.guardian_relayer_data import GuardianRelayerData
+from multiversx_sdk_cli.pooled_proxy import PooledProxyNetworkProvider
+from multiversx_sdk_cli.relaying import (
+    BatchRelayer,
+    broadcast_relayed,
+    build_report,
+    load_relay_items,
+    save_rejects,
+)
 from multiversx_sdk_cli.signing_wrapper import SigningWrapper
-from multiversx_sdk_cli.transactions import load_transaction_from_file
+from multiversx_sdk_cli.simulation import (
+    DEFAULT_NUM_SIMULATION_WORKERS,
+    BatchSimulationReport,
+    BatchSimulator,
+)
+from multiversx_sdk_cli.transactions import (
+    load_transaction_from_file,
+    load_transactions_from_jsonl,
+    save_transactions_to_jsonl,
+    send_transactions_in_chunks,
+)
+from multiversx_sdk_cli.transactions_batch import (
+    TransactionsBatchReader,
+    TransactionsBatchWriter,
+    is_transactions_batch,
+)
 
 logger = logging.getLogger("cli.transactions")
 
@@ -55,7 +93,7 @@ def setup_parser(args: list[str], subparsers: Any) -> Any:
         "send",
         f"Send a previously saved transaction.{CLIOutputBuilder.describe()}",
     )
-    cli_shared.add_infile_arg(sub, what="a previously saved transaction")
+    cli_shared.add_infile_arg(sub, what="a previously saved transaction, or a batch of signed transactions")
     cli_shared.add_outfile_arg(sub, what="the hash")
     cli_shared.add_proxy_arg(sub)
     sub.set_defaults(func=send_transaction)
@@ -67,12 +105,31 @@ def setup_parser(args: list[str], subparsers: Any) -> Any:
         f"Sign a previously saved transaction.{CLIOutputBuilder.describe()}",
     )
     cli_shared.add_wallet_args(args=args, sub=sub)
-    cli_shared.add_infile_arg(sub, what="a previously saved transaction")
-    cli_shared.add_outfile_arg(sub, what="the signed transaction")
+    cli_shared.add_infile_arg(
+        sub, what="a previously saved transaction, or a batch (see `tx pack`); with --stream, JSON Lines; - for stdin"
+    )
+    cli_shared.add_outfile_arg(sub, what="the signed transaction or batch")
     cli_shared.add_broadcast_args(sub)
     cli_shared.add_proxy_arg(sub)
     cli_shared.add_guardian_wallet_args(args, sub)
     cli_shared.add_relayed_v3_wallet_args(args, sub)
+    sub.add_argument(
+        "--stream",
+        action="store_true",
+        default=False,
+        help="sign many transactions (JSON Lines), each one for its sender, and output them as JSON Lines, "
+        "incrementally; the senders' keys are all the entries of --pem, or the keystores in --keystores-map",
+    )
+    sub.add_argument(
+        "--keystores-map",
+        help="🔑 a JSON file mapping addresses to keystore files (sharing the same password), for --stream",
+    )
+    sub.add_argument(
+        "--concurrency",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="the number of signing processes, for --stream (default: the number of CPUs)",
+    )
     sub.set_defaults(func=sign_transaction)
 
     sub = cli_shared.add_command_subparser(
@@ -82,12 +139,92 @@ def setup_parser(args: list[str], subparsers: Any) -> Any:
         f"Relay a previously saved transaction.{CLIOutputBuilder.describe()}",
     )
     cli_shared.add_relayed_v3_wallet_args(args, sub)
-    cli_shared.add_infile_arg(sub, what="a previously saved transaction")
-    cli_shared.add_outfile_arg(sub, what="the relayer signed transaction")
+    cli_shared.add_infile_arg(sub, what="a previously saved transaction, or a batch (see `tx pack`)")
+    cli_shared.add_outfile_arg(sub, what="the relayer signed transaction or batch")
     cli_shared.add_broadcast_args(sub)
     cli_shared.add_proxy_arg(sub)
     sub.set_defaults(func=relay_transaction)
 
+    sub = cli_shared.add_command_subparser(
+        subparsers,
+        "tx",
+        "relay-batch",
+        "Relay many inner transactions, signed by their senders: each one is validated (relayer, signatures), "
+        "then signed by the relayer. Outputs a status report for each transaction; the rejected ones are also "
+        "saved to a separate file.",
+    )
+    cli_shared.add_relayed_v3_wallet_args(args, sub)
+    sub.add_argument(
+        "--infile",
+        required=True,
+        help="a directory of previously saved transactions (*.json), a JSON Lines file or a batch (see `tx pack`)",
+    )
+    cli_shared.add_outfile_arg(sub, what="the report")
+    sub.add_argument(
+        "--rejects-file",
+        help="where to save the rejected transactions, as JSON Lines (default: next to the input, *.rejects.jsonl)",
+    )
+    cli_shared.add_broadcast_args(sub, simulate=False)
+    cli_shared.add_proxy_arg(sub)
+    sub.set_defaults(func=relay_transactions)
+
+    sub = cli_shared.add_command_subparser(
+        subparsers,
+        "tx",
+        "simulate-batch",
+        "Simulate many previously saved transactions, concurrently. The results are streamed (JSON Lines), "
+        "then an aggregated report is printed: gas used, failures (grouped by return message) and fees. "
+        "If the results are streamed to stdout, the report is printed to stderr.",
+    )
+    sub.add_argument("--infile", required=True, help="the file holding the transactions, one per line (JSON Lines)")
+    cli_shared.add_outfile_arg(sub, what="the simulation results, one per line")
+    sub.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_NUM_SIMULATION_WORKERS,
+        help="the number of concurrent simulations (default: %(default)s)",
+    )
+    cli_shared.add_proxy_arg(sub)
+    sub.set_defaults(func=simulate_transactions)
+
+    sub = cli_shared.add_command_subparser(
+        subparsers,
+        "tx",
+        "fee",
+        "Compute the fees of previously saved transactions, locally. Once the network config of a chain has been "
+        "fetched (by any command), this works offline.",
+    )
+    sub.add_argument("--infile", required=True, help="the file holding the transactions, one per line (JSON Lines)")
+    cli_shared.add_outfile_arg(sub)
+    sub.add_argument(
+        "--proxy", type=str, help="🔗 the URL of the proxy (default: use the cached network config of the chain)"
+    )
+    sub.set_defaults(func=compute_fees)
+
+    sub = cli_shared.add_command_subparser(
+        subparsers,
+        "tx",
+        "pack",
+        "Pack previously saved transactions into a compact, indexed, binary batch, "
+        "which can be signed, relayed and sent as a whole (by `tx sign`, `tx relay` and `tx send`).",
+    )
+    sub.add_argument("--infile", required=True, help="the file holding the transactions, one per line (JSON Lines)")
+    sub.add_argument("--outfile", required=True, help="where to save the batch")
+    sub.add_argument("--compress", action="store_true", default=False, help="compress the batch (requires `zstandard`)")
+    sub.set_defaults(func=pack_transactions)
+
+    sub = cli_shared.add_command_subparser(
+        subparsers,
+        "tx",
+        "unpack",
+        "Unpack a batch of transactions (or only some of them, looked up by hash or nonce) as JSON Lines.",
+    )
+    sub.add_argument("--infile", required=True, help="the batch")
+    cli_shared.add_outfile_arg(sub, what="the transactions, one per line")
+    sub.add_argument("--hash", action="append", default=[], help="only the transaction with this hash (repeatable)")
+    sub.add_argument("--nonce", type=int, help="only the transactions with this nonce")
+    sub.set_defaults(func=unpack_transactions)
+
     parser.epilog = cli_shared.build_group_epilog(subparsers)
     return subparsers
 
@@ -163,6 +300,10 @@ def create_transaction(args: Any):
 def send_transaction(args: Any):
     validate_proxy_argument(args)
 
+    if is_transactions_batch(args.infile.buffer):
+        send_transactions_batch(args)
+        return
+
     tx = load_transaction_from_file(args.infile)
     output = CLIOutputBuilder()
 
@@ -170,7 +311,8 @@ def send_transaction(args: Any):
     proxy = ProxyNetworkProvider(url=args.proxy, config=config)
 
     try:
-        cli_shared._confirm_continuation_if_required(tx)
+        cli_shared.confirm_continuation_if_required(tx)
+        guardian_data_cache.forget_changed_guardian_data([tx])
 
         tx_hash = proxy.send_transaction(tx)
         output.set_emitted_transaction_hash(tx_hash.hex())
@@ -179,9 +321,49 @@ def send_transaction(args: Any):
         utils.dump_out_json(output, outfile=args.outfile)
 
 
+def send_transactions_batch(args: Any):
+    reader = TransactionsBatchReader(args.infile.buffer)
+    transactions = list(reader)
+
+    config = get_config_for_network_providers()
+    proxy = ProxyNetworkProvider(url=args.proxy, config=config)
+
+    cli_shared.confirm_continuation_if_required(*transactions)
+    guardian_data_cache.forget_changed_guardian_data(transactions)
+
+    hashes: list[bytes] = []
+    failed_requests: list[dict[str, Any]] = []
+
+    try:
+        for start, chunk_hashes, error in send_transactions_in_chunks(transactions, proxy):
+            hashes.extend(chunk_hashes)
+            if error:
+                failed_requests.append({"first": start, "last": start + len(chunk_hashes) - 1, "error": error})
+    finally:
+        num_sent = len([hash for hash in hashes if hash])
+        logger.info(f"Sent {num_sent} of {len(transactions)} transactions.")
+
+        output = {
+            "numTransactions": len(transactions),
+            "numSent": num_sent,
+            "hashes": [hash.hex() for hash in hashes],
+            "rejected": [index for index, hash in enumerate(hashes) if not hash],
+            "failedRequests": failed_requests,
+        }
+        utils.dump_out_json(output, outfile=args.outfile)
+
+
 def sign_transaction(args: Any):
+    if args.stream:
+        sign_transactions_stream(args)
+        return
+
     validate_broadcast_args(args)
 
+    if is_transactions_batch(args.infile.buffer):
+        sign_transactions_batch(args)
+        return
+
     tx = load_transaction_from_file(args.infile)
 
     try:
@@ -225,19 +407,268 @@ def sign_transaction(args: Any):
     cli_shared.send_or_simulate(tx, args)
 
 
+def sign_transactions_batch(args: Any):
+    if args.send or args.simulate:
+        raise BadUsage("A batch cannot be sent by `tx sign`; sign it, then use `tx send`")
+
+    reader = TransactionsBatchReader(args.infile.buffer)
+    transactions = list(reader)
+
+    try:
+        sender = cli_shared.prepare_account(args)
+    except:
+        logger.info("No sender wallet provided. Will not sign for the senders.")
+        sender = None
+
+    relayer = cli_shared.load_relayer_account(args)
+    guardian = cli_shared.load_guardian_account(args)
+    tx_computer = TransactionComputer()
+
+    for index, tx in enumerate(transactions):
+        if sender and sender.address != tx.sender:
+            raise IncorrectWalletError(f"Sender's wallet does not match the sender of transaction {index}.")
+        if relayer and relayer.address != tx.relayer:
+            raise IncorrectWalletError(f"Relayer's wallet does not match the relayer of transaction {index}.")
+        if guardian and guardian.address != tx.guardian:
+            raise IncorrectWalletError(f"Guardian's wallet does not match the guardian of transaction {index}.")
+        if guardian and not tx_computer.has_options_set_for_guarded_transaction(tx):
+            raise BadUsage(f"Guardian wallet provided but transaction {index} has incorrect options")
+
+    guardian_and_relayer = GuardianRelayerData(
+        guardian=guardian,
+        relayer=relayer,
+        guardian_service_url=args.guardian_service_url,
+        guardian_2fa_code=args.guardian_2fa_code,
+    )
+
+    signer = SigningWrapper()
+    signer.sign_transactions(transactions=transactions, sender=sender, guardian_and_relayer=guardian_and_relayer)
+
+    _save_transactions_batch(transactions, args.outfile, compress=reader.is_compressed)
+
+
+def sign_transactions_stream(args: Any):
+    if args.send or args.simulate:
+        raise BadUsage("--stream cannot be used with --send or --simulate")
+    if args.guardian_pem or args.guardian_keyfile or args.guardian_ledger:
+        raise BadUsage("--stream only signs for the senders; guardian wallets are not supported")
+    if args.relayer_pem or args.relayer_keyfile or args.relayer_ledger:
+        raise BadUsage("--stream only signs for the senders; relayer wallets are not supported")
+    if args.ledger:
+        raise BadUsage("--stream does not support Ledger devices")
+    if args.concurrency < 1:
+        raise BadUsage("--concurrency must be a positive number")
+
+    secret_keys = _load_secret_keys_for_stream_signing(args)
+    stream_signing.sign_transactions_stream(args.infile, args.outfile, secret_keys, num_workers=args.concurrency)
+
+
+def _load_secret_keys_for_stream_signing(args: Any) -> list[UserSecretKey]:
+    if args.pem:
+        return [entry.secret_key for entry in UserPEM.from_file_all(Path(args.pem).expanduser())]
+
+    if args.keystores_map:
+        map_path = Path(args.keystores_map).expanduser()
+        keystores: dict[str, str] = utils.read_json_file(map_path)
+        password = load_password(args)
+        secret_keys: list[UserSecretKey] = []
+
+        for address, keystore in keystores.items():
+            try:
+                secret_key = UserWallet.load_secret_key(map_path.parent / Path(keystore).expanduser(), password)
+            except Exception as e:
+                raise WalletError(f"Cannot load the keystore of {address}: {e}")
+
+            if secret_key.generate_public_key().to_address().to_bech32() != address:
+                raise WalletError(f"The keystore of {address} holds another key")
+            secret_keys.append(secret_key)
+
+        return secret_keys
+
+    if args.keyfile or args.sender:
+        account = cli_shared.prepare_account(args)
+        if not isinstance(account, Account):
+            raise BadUsage("--stream only supports PEM files and keystores")
+        return [account.secret_key]
+
+    raise NoWalletProvided()
+
+
 def relay_transaction(args: Any):
     ensure_relayer_wallet_args_are_provided(args)
     validate_broadcast_args(args)
 
-    tx = load_transaction_from_file(args.infile)
-
     relayer = cli_shared.load_relayer_account(args)
     if relayer is None:
         raise NoWalletProvided()
 
+    if is_transactions_batch(args.infile.buffer):
+        relay_transactions_batch(args, relayer)
+        return
+
+    tx = load_transaction_from_file(args.infile)
+
     if tx.relayer != relayer.address:
         raise IncorrectWalletError("Relayer wallet does not match the relayer's address set in the transaction.")
 
     tx.relayer_signature = relayer.sign_transaction(tx)
 
     cli_shared.send_or_simulate(tx, args)
+
+
+def relay_transactions(args: Any):
+    ensure_relayer_wallet_args_are_provided(args)
+    if args.send:
+        validate_proxy_argument(args)
+
+    infile = Path(args.infile).expanduser()
+    rejects_file = Path(args.rejects_file).expanduser() if args.rejects_file else _get_default_rejects_file(infile)
+
+    relayer = cli_shared.load_relayer_account(args)
+    if relayer is None:
+        raise NoWalletProvided()
+
+    items = load_relay_items(infile)
+    BatchRelayer(relayer).relay(items)
+
+    try:
+        if args.send:
+            config = get_config_for_network_providers()
+            proxy = ProxyNetworkProvider(url=args.proxy, config=config)
+            broadcast_relayed(items, proxy)
+    finally:
+        num_rejected = save_rejects(items, rejects_file)
+        if num_rejected:
+            logger.warning(f"{num_rejected} of {len(items)} transactions were rejected, see: {rejects_file}")
+
+        # Unless sent, the relayed transactions are part of the report (to be sent later).
+        utils.dump_out_json(build_report(items, with_transactions=not args.send), outfile=args.outfile)
+
+
+def _get_default_rejects_file(infile: Path) -> Path:
+    infile = infile.resolve()
+    return infile.parent / f"{infile.stem}.rejects.jsonl"
+
+
+def relay_transactions_batch(args: Any, relayer: Any):
+    if args.send or args.simulate:
+        raise BadUsage("A batch cannot be sent by `tx relay`; relay it, then use `tx send`")
+
+    reader = TransactionsBatchReader(args.infile.buffer)
+    transactions = list(reader)
+
+    for index, tx in enumerate(transactions):
+        if tx.relayer != relayer.address:
+            raise IncorrectWalletError(f"Relayer wallet does not match the relayer of transaction {index}.")
+
+        tx.relayer_signature = relayer.sign_transaction(tx)
+
+    _save_transactions_batch(transactions, args.outfile, compress=reader.is_compressed)
+
+
+def _save_transactions_batch(transactions: list[Any], outfile: Any, compress: bool):
+    # The batch is binary: write to the underlying buffer of the (text) output file, if any.
+    stream: BinaryIO = getattr(outfile, "buffer", outfile)
+
+    with TransactionsBatchWriter(stream, compress=compress) as writer:
+        for tx in transactions:
+            writer.write(tx)
+
+    logger.info(f"Saved a batch of {len(transactions)} transactions.")
+
+
+def pack_transactions(args: Any):
+    with open(Path(args.infile).expanduser()) as f:
+        transactions = load_transactions_from_jsonl(f)
+
+    with open(Path(args.outfile).expanduser(), "wb") as f:
+        _save_transactions_batch(transactions, f, compress=args.compress)
+
+
+def unpack_transactions(args: Any):
+    with open(Path(args.infile).expanduser(), "rb") as f:
+        reader = TransactionsBatchReader(f)
+
+        if args.hash or args.nonce is not None:
+            transactions = [tx for tx in map(reader.get_by_hash, map(bytes.fromhex, args.hash)) if tx]
+            if args.nonce is not None:
+                transactions += reader.get_by_nonce(args.nonce)
+        else:
+            transactions = list(reader)
+
+    save_transactions_to_jsonl(transactions, args.outfile)
+
+
+def simulate_transactions(args: Any):
+    validate_proxy_argument(args)
+    if args.concurrency < 1:
+        raise BadUsage("--concurrency must be a positive number")
+
+    with open(Path(args.infile).expanduser()) as f:
+        transactions = load_transactions_from_jsonl(f)
+
+    network_config = cli_shared.get_network_config(args.proxy)
+    report = BatchSimulationReport()
+
+    config = get_config_for_network_providers()
+    with PooledProxyNetworkProvider(url=args.proxy, config=config, pool_size=args.concurrency) as proxy:
+        simulator = BatchSimulator(proxy, network_config, num_workers=args.concurrency)
+
+        for result in simulator.run(transactions):
+            report.add(result)
+            args.outfile.write(json.dumps(result, cls=utils.BasicEncoder) + "\n")
+            args.outfile.flush()
+
+    logger.info(f"Simulated {report.num_transactions} transactions, {report.num_failures} failed.")
+
+    # When the results (JSON Lines) are written to stdout, the report goes to stderr, so that stdout stays valid JSONL.
+    report_file = sys.stderr if args.outfile is sys.stdout else sys.stdout
+    utils.dump_out_json(report, outfile=report_file)
+
+
+def compute_fees(args: Any):
+    with open(Path(args.infile).expanduser()) as f:
+        transactions = load_transactions_from_jsonl(f)
+
+    calculators: dict[str, FeeCalculator] = {}
+    entries: list[dict[str, Any]] = []
+    total_fee = 0
+
+    for index, tx in enumerate(transactions):
+        if tx.chain_id not in calculators:
+            calculators[tx.chain_id] = FeeCalculator(_get_fee_parameters(tx.chain_id, args.proxy))
+
+        calculator = calculators[tx.chain_id]
+        entry: dict[str, Any] = {
+            "index": index,
+            "sender": tx.sender.to_bech32(),
+            "nonce": tx.nonce,
+            "gasLimit": tx.gas_limit,
+            "computedGasLimit": calculator.compute_gas_limit(tx),
+            "gasPrice": tx.gas_price,
+        }
+
+        try:
+            fee = calculator.compute_fee(tx)
+            entry["fee"] = str(fee)
+            total_fee += fee
+        except NotEnoughGasError as error:
+            entry["fee"] = None
+            entry["error"] = str(error)
+
+        entries.append(entry)
+
+    utils.dump_out_json({"transactions": entries, "totalFee": str(total_fee)}, outfile=args.outfile)
+
+
+def _get_fee_parameters(chain_id: str, proxy_url: Optional[str]) -> FeeParameters:
+    if proxy_url:
+        fee_parameters = FeeParameters.new_from_network_config(cli_shared.get_network_config(proxy_url))
+        if fee_parameters.chain_id != chain_id:
+            raise BadUsage(f"The transactions are for chain {chain_id}, but the proxy is for {fee_parameters.chain_id}")
+        return fee_parameters
+
+    cached_fee_parameters = load_fee_parameters(chain_id)
+    if cached_fee_parameters is None:
+        raise BadUsage(f"The network config of chain {chain_id} is not known yet. Please provide --proxy (once).")
+    return cached_fee_parameters
@@ -2,12 +2,13 @@ import logging
 from pathlib import Path
 from typing import Any
 
-from multiversx_sdk import ValidatorPEM, ValidatorSecretKey, ValidatorSigner
+from multiversx_sdk import ValidatorPEM, ValidatorSigner
 
 from multiversx_sdk_cli import cli_shared, utils
 from multiversx_sdk_cli.errors import BadUserInput
 from multiversx_sdk_cli.sign_verify import SignedMessage, sign_message_by_validator
 from multiversx_sdk_cli.ux import show_critical_error, show_message
+from multiversx_sdk_cli.validators_signing import generate_validator_keys
 
 logger = logging.getLogger("cli.validator_wallet")
 
@@ -32,6 +33,19 @@ def setup_parser(args: list[str], subparsers: Any) -> Any:
         type=str,
         required=True,
     )
+    sub.add_argument(
+        "--count",
+        type=int,
+        default=1,
+        help="the number of keys to generate; when greater than 1, a multi-key PEM file is created, "
+        "along with an index of the public keys (<outfile>.index.json) (default: %(default)s)",
+    )
+    sub.add_argument(
+        "--node-keys-folder",
+        type=str,
+        help="if provided, each key is also saved in its own file (validators/validatorKey{NN}.pem), "
+        "following the layout of the localnet wallets",
+    )
     sub.set_defaults(func=create_new_wallet)
 
     sub = cli_shared.add_command_subparser(subparsers, "validator-wallet", "sign-message", "Sign a message.")
@@ -77,18 +91,44 @@ def setup_parser(args: list[str], subparsers: Any) -> Any:
 
 def create_new_wallet(args: Any):
     path = Path(args.outfile).expanduser().resolve()
+    count = args.count
 
     if path.exists():
         raise BadUserInput(f"File already exists, will not overwrite: {str(path)}")
+    if count < 1:
+        raise BadUserInput("--count must be a positive number")
 
-    secret_key = ValidatorSecretKey.generate()
-    public_key = secret_key.generate_public_key()
-    validator_pem = ValidatorPEM(label=public_key.hex(), secret_key=secret_key)
-    validator_pem.save(path)
+    keys = generate_validator_keys(count)
+    pems = [ValidatorPEM(label=public_key.hex(), secret_key=secret_key) for secret_key, public_key in keys]
+
+    if count == 1:
+        pems[0].save(path)
+    else:
+        utils.write_file(path, "\n".join(pem.to_text() for pem in pems) + "\n")
+        index_path = _get_index_path(path)
+        utils.write_json_file(index_path, [{"index": i, "publicKey": pem.label} for i, pem in enumerate(pems)])
+        logger.info(f"Index of public keys saved: {str(index_path)}")
+
+    if args.node_keys_folder:
+        _save_node_keys(Path(args.node_keys_folder).expanduser().resolve(), pems)
 
     logger.info(f"Validator wallet saved: {str(path)}")
 
 
+def _get_index_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.index.json")
+
+
+def _save_node_keys(folder: Path, pems: list[ValidatorPEM]):
+    validators_folder = folder / "validators"
+    utils.ensure_folder(validators_folder)
+
+    for i, pem in enumerate(pems):
+        pem.save(validators_folder / "validatorKey{:02}.pem".format(i))
+
+    logger.info(f"Node keys saved: {str(validators_folder)}")
+
+
 def sign_message(args: Any):
     path = Path(args.pem).expanduser().resolve()
     validator_signer = ValidatorSigner.from_pem_file(path, args.index)
@@ -3,6 +3,7 @@ from typing import Any
 
 from multiversx_sdk import (
     Address,
+    Transaction,
     ValidatorPublicKey,
     ValidatorsController,
     ValidatorsSigners,
@@ -15,6 +16,8 @@ from multiversx_sdk_cli.args_validation import (
     validate_nonce_args,
     validate_receiver_args,
 )
+from multiversx_sdk_cli.chunking import split_amount, split_items_into_chunks
+from multiversx_sdk_cli.validator_keys import ValidatorKeysFile
 
 
 def setup_parser(args: list[str], subparsers: Any) -> Any:
@@ -40,6 +43,7 @@ def setup_parser(args: list[str], subparsers: Any) -> Any:
         required=not (utils.is_arg_present(args, "--validators-pem")),
         help="Stake value for top up",
     )
+    cli_shared.add_nodes_per_transaction_arg(sub)
     sub.set_defaults(func=do_stake)
 
     sub = cli_shared.add_command_subparser(subparsers, "validator", "unstake", "Unstake value")
@@ -146,6 +150,7 @@ def _add_nodes_arg(sub: Any):
         required=True,
         help="the public keys of the nodes as CSV (addrA,addrB)",
     )
+    cli_shared.add_nodes_per_transaction_arg(sub)
 
 
 def validate_args(args: Any) -> None:
@@ -168,6 +173,7 @@ def do_stake(args: Any):
     rewards_address = Address.new_from_bech32(args.reward_address) if args.reward_address else None
 
     controller = _get_validators_controller(args)
+    transactions: list[Transaction] = []
 
     if args.top_up:
         tx = controller.create_transaction_for_topping_up(
@@ -179,27 +185,42 @@ def do_stake(args: Any):
             gas_limit=args.gas_limit,
             gas_price=args.gas_price,
         )
+        transactions.append(tx)
     else:
         validators_signers = _load_validators_signers(args.validators_pem)
-        tx = controller.create_transaction_for_staking(
-            sender=sender,
-            nonce=sender.nonce,
-            validators_file=validators_signers,
-            amount=native_amount,
-            rewards_address=rewards_address,
-            guardian=guardian_and_relayer_data.guardian_address,
-            relayer=guardian_and_relayer_data.relayer_address,
-            gas_limit=args.gas_limit,
-            gas_price=args.gas_price,
-        )
 
-    cli_shared.alter_transaction_and_sign_again_if_needed(
+        chunks = split_items_into_chunks(
+            args,
+            validators_signers.get_signers(),
+            lambda chunk: controller.factory.create_transaction_for_staking(
+                sender=sender.address,
+                validators_file=ValidatorsSigners(list(chunk)),
+                amount=native_amount,
+                rewards_address=rewards_address,
+            ).gas_limit,
+        )
+        amounts = split_amount(native_amount, chunks)
+
+        for index, chunk in enumerate(chunks):
+            tx = controller.create_transaction_for_staking(
+                sender=sender,
+                nonce=sender.nonce + index,
+                validators_file=ValidatorsSigners(list(chunk)),
+                amount=amounts[index],
+                rewards_address=rewards_address,
+                guardian=guardian_and_relayer_data.guardian_address,
+                relayer=guardian_and_relayer_data.relayer_address,
+                gas_limit=args.gas_limit,
+                gas_price=args.gas_price,
+            )
+            transactions.append(tx)
+
+    cli_shared.alter_transactions_and_send_or_simulate(
         args=args,
-        tx=tx,
+        transactions=transactions,
         sender=sender,
         guardian_and_relayer_data=guardian_and_relayer_data,
     )
-    cli_shared.send_or_simulate(tx, args)
 
 
 def _get_validators_controller(args: Any) -> ValidatorsController:
@@ -209,8 +230,8 @@ def _get_validators_controller(args: Any) -> ValidatorsController:
 
 
 def _load_validators_signers(validators_pem: str) -> ValidatorsSigners:
-    validators_file_path = Path(validators_pem).expanduser()
-    return ValidatorsSigners.new_from_pem(validators_file_path)
+    with ValidatorKeysFile(Path(validators_pem)) as keys_file:
+        return ValidatorsSigners(keys_file.get_signers())
 
 
 def _parse_public_bls_keys(public_bls_keys: str) -> list[ValidatorPublicKey]:
@@ -235,23 +256,34 @@ def do_unstake(args: Any):
     keys = _parse_public_bls_keys(args.nodes_public_keys)
     controller = _get_validators_controller(args)
 
-    tx = controller.create_transaction_for_unstaking(
-        sender=sender,
-        nonce=sender.nonce,
-        public_keys=keys,
-        guardian=guardian_and_relayer_data.guardian_address,
-        relayer=guardian_and_relayer_data.relayer_address,
-        gas_limit=args.gas_limit,
-        gas_price=args.gas_price,
+    chunks = split_items_into_chunks(
+        args,
+        keys,
+        lambda chunk: controller.factory.create_transaction_for_unstaking(
+            sender=sender.address,
+            public_keys=list(chunk),
+        ).gas_limit,
     )
 
-    cli_shared.alter_transaction_and_sign_again_if_needed(
+    transactions: list[Transaction] = []
+    for index, chunk in enumerate(chunks):
+        tx = controller.create_transaction_for_unstaking(
+            sender=sender,
+            nonce=sender.nonce + index,
+            public_keys=list(chunk),
+            guardian=guardian_and_relayer_data.guardian_address,
+            relayer=guardian_and_relayer_data.relayer_address,
+            gas_limit=args.gas_limit,
+            gas_price=args.gas_price,
+        )
+        transactions.append(tx)
+
+    cli_shared.alter_transactions_and_send_or_simulate(
         args=args,
-        tx=tx,
+        transactions=transactions,
         sender=sender,
         guardian_and_relayer_data=guardian_and_relayer_data,
     )
-    cli_shared.send_or_simulate(tx, args)
 
 
 def do_unjail(args: Any):
@@ -267,24 +299,38 @@ def do_unjail(args: Any):
     keys = _parse_public_bls_keys(args.nodes_public_keys)
 
     controller = _get_validators_controller(args)
-    tx = controller.create_transaction_for_unjailing(
-        sender=sender,
-        nonce=sender.nonce,
-        public_keys=keys,
-        amount=native_amount,
-        guardian=guardian_and_relayer_data.guardian_address,
-        relayer=guardian_and_relayer_data.relayer_address,
-        gas_limit=args.gas_limit,
-        gas_price=args.gas_price,
+
+    chunks = split_items_into_chunks(
+        args,
+        keys,
+        lambda chunk: controller.factory.create_transaction_for_unjailing(
+            sender=sender.address,
+            public_keys=list(chunk),
+            amount=native_amount,
+        ).gas_limit,
     )
+    amounts = split_amount(native_amount, chunks)
 
-    cli_shared.alter_transaction_and_sign_again_if_needed(
+    transactions: list[Transaction] = []
+    for index, chunk in enumerate(chunks):
+        tx = controller.create_transaction_for_unjailing(
+            sender=sender,
+            nonce=sender.nonce + index,
+            public_keys=list(chunk),
+            amount=amounts[index],
+            guardian=guardian_and_relayer_data.guardian_address,
+            relayer=guardian_and_relayer_data.relayer_address,
+            gas_limit=args.gas_limit,
+            gas_price=args.gas_price,
+        )
+        transactions.append(tx)
+
+    cli_shared.alter_transactions_and_send_or_simulate(
         args=args,
-        tx=tx,
+        transactions=transactions,
         sender=sender,
         guardian_and_relayer_data=guardian_and_relayer_data,
     )
-    cli_shared.send_or_simulate(tx, args)
 
 
 def do_unbond(args: Any):
@@ -299,23 +345,34 @@ def do_unbond(args: Any):
     keys = _parse_public_bls_keys(args.nodes_public_keys)
     controller = _get_validators_controller(args)
 
-    tx = controller.create_transaction_for_unbonding(
-        sender=sender,
-        nonce=sender.nonce,
-        public_keys=keys,
-        guardian=guardian_and_relayer_data.guardian_address,
-        relayer=guardian_and_relayer_data.relayer_address,
-        gas_limit=args.gas_limit,
-        gas_price=args.gas_price,
+    chunks = split_items_into_chunks(
+        args,
+        keys,
+        lambda chunk: controller.factory.create_transaction_for_unbonding(
+            sender=sender.address,
+            public_keys=list(chunk),
+        ).gas_limit,
     )
 
-    cli_shared.alter_transaction_and_sign_again_if_needed(
+    transactions: list[Transaction] = []
+    for index, chunk in enumerate(chunks):
+        tx = controller.create_transaction_for_unbonding(
+            sender=sender,
+            nonce=sender.nonce + index,
+            public_keys=list(chunk),
+            guardian=guardian_and_relayer_data.guardian_address,
+            relayer=guardian_and_relayer_data.relayer_address,
+            gas_limit=args.gas_limit,
+            gas_price=args.gas_price,
+        )
+        transactions.append(tx)
+
+    cli_shared.alter_transactions_and_send_or_simulate(
         args=args,
-        tx=tx,
+        transactions=transactions,
         sender=sender,
         guardian_and_relayer_data=guardian_and_relayer_data,
     )
-    cli_shared.send_or_simulate(tx, args)
 
 
 def change_reward_address(args: Any):
@@ -389,23 +446,34 @@ def do_unstake_nodes(args: Any):
     keys = _parse_public_bls_keys(args.nodes_public_keys)
     controller = _get_validators_controller(args)
 
-    tx = controller.create_transaction_for_unstaking_nodes(
-        sender=sender,
-        nonce=sender.nonce,
-        public_keys=keys,
-        guardian=guardian_and_relayer_data.guardian_address,
-        relayer=guardian_and_relayer_data.relayer_address,
-        gas_limit=args.gas_limit,
-        gas_price=args.gas_price,
+    chunks = split_items_into_chunks(
+        args,
+        keys,
+        lambda chunk: controller.factory.create_transaction_for_unstaking_nodes(
+            sender=sender.address,
+            public_keys=list(chunk),
+        ).gas_limit,
     )
 
-    cli_shared.alter_transaction_and_sign_again_if_needed(
+    transactions: list[Transaction] = []
+    for index, chunk in enumerate(chunks):
+        tx = controller.create_transaction_for_unstaking_nodes(
+            sender=sender,
+            nonce=sender.nonce + index,
+            public_keys=list(chunk),
+            guardian=guardian_and_relayer_data.guardian_address,
+            relayer=guardian_and_relayer_data.relayer_address,
+            gas_limit=args.gas_limit,
+            gas_price=args.gas_price,
+        )
+        transactions.append(tx)
+
+    cli_shared.alter_transactions_and_send_or_simulate(
         args=args,
-        tx=tx,
+        transactions=transactions,
         sender=sender,
         guardian_and_relayer_data=guardian_and_relayer_data,
     )
-    cli_shared.send_or_simulate(tx, args)
 
 
 def do_unstake_tokens(args: Any):
@@ -451,23 +519,34 @@ def do_unbond_nodes(args: Any):
     keys = _parse_public_bls_keys(args.nodes_public_keys)
     controller = _get_validators_controller(args)
 
-    tx = controller.create_transaction_for_unbonding_nodes(
-        sender=sender,
-        nonce=sender.nonce,
-        public_keys=keys,
-        guardian=guardian_and_relayer_data.guardian_address,
-        relayer=guardian_and_relayer_data.relayer_address,
-        gas_limit=args.gas_limit,
-        gas_price=args.gas_price,
+    chunks = split_items_into_chunks(
+        args,
+        keys,
+        lambda chunk: controller.factory.create_transaction_for_unbonding_nodes(
+            sender=sender.address,
+            public_keys=list(chunk),
+        ).gas_limit,
     )
 
-    cli_shared.alter_transaction_and_sign_again_if_needed(
+    transactions: list[Transaction] = []
+    for index, chunk in enumerate(chunks):
+        tx = controller.create_transaction_for_unbonding_nodes(
+            sender=sender,
+            nonce=sender.nonce + index,
+            public_keys=list(chunk),
+            guardian=guardian_and_relayer_data.guardian_address,
+            relayer=guardian_and_relayer_data.relayer_address,
+            gas_limit=args.gas_limit,
+            gas_price=args.gas_price,
+        )
+        transactions.append(tx)
+
+    cli_shared.alter_transactions_and_send_or_simulate(
         args=args,
-        tx=tx,
+        transactions=transactions,
         sender=sender,
         guardian_and_relayer_data=guardian_and_relayer_data,
     )
-    cli_shared.send_or_simulate(tx, args)
 
 
 def do_unbond_tokens(args: Any):
@@ -541,20 +620,31 @@ def do_restake_unstaked_nodes(args: Any):
     keys = _parse_public_bls_keys(args.nodes_public_keys)
     controller = _get_validators_controller(args)
 
-    tx = controller.create_transaction_for_restaking_unstaked_nodes(
-        sender=sender,
-        nonce=sender.nonce,
-        public_keys=keys,
-        guardian=guardian_and_relayer_data.guardian_address,
-        relayer=guardian_and_relayer_data.relayer_address,
-        gas_limit=args.gas_limit,
-        gas_price=args.gas_price,
+    chunks = split_items_into_chunks(
+        args,
+        keys,
+        lambda chunk: controller.factory.create_transaction_for_restaking_unstaked_nodes(
+            sender=sender.address,
+            public_keys=list(chunk),
+        ).gas_limit,
     )
 
-    cli_shared.alter_transaction_and_sign_again_if_needed(
+    transactions: list[Transaction] = []
+    for index, chunk in enumerate(chunks):
+        tx = controller.create_transaction_for_restaking_unstaked_nodes(
+            sender=sender,
+            nonce=sender.nonce + index,
+            public_keys=list(chunk),
+            guardian=guardian_and_relayer_data.guardian_address,
+            relayer=guardian_and_relayer_data.relayer_address,
+            gas_limit=args.gas_limit,
+            gas_price=args.gas_price,
+        )
+        transactions.append(tx)
+
+    cli_shared.alter_transactions_and_send_or_simulate(
         args=args,
-        tx=tx,
+        transactions=transactions,
         sender=sender,
         guardian_and_relayer_data=guardian_and_relayer_data,
     )
-    cli_shared.send_or_simulate(tx, args)
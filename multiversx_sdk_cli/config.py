@@ -1,11 +1,12 @@
 import os
 from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import Any, ContextManager
 
 from multiversx_sdk import NetworkProviderConfig
 
 from multiversx_sdk_cli import errors, utils
+from multiversx_sdk_cli.config_files import update_json_file
 from multiversx_sdk_cli.constants import LOG_LEVELS, SDK_PATH
 from multiversx_sdk_cli.ux import show_warning
 
@@ -45,22 +46,20 @@ def get_value(name: str) -> str:
 
 def set_value(name: str, value: Any):
     _guard_valid_name(name)
-    data = read_file()
-    active_config = data.get("active", "default")
-    data.setdefault("configurations", {})
-    data["configurations"].setdefault(active_config, {})
-    data["configurations"][active_config][name] = value
-    write_file(data)
+    with update_file() as data:
+        active_config = data.get("active", "default")
+        data.setdefault("configurations", {})
+        data["configurations"].setdefault(active_config, {})
+        data["configurations"][active_config][name] = value
 
 
 def delete_value(name: str):
     _guard_valid_config_deletion(name)
-    data = read_file()
-    active_config = data.get("active", "default")
-    data.setdefault("configurations", {})
-    data["configurations"].setdefault(active_config, {})
-    del data["configurations"][active_config][name]
-    write_file(data)
+    with update_file() as data:
+        active_config = data.get("active", "default")
+        data.setdefault("configurations", {})
+        data["configurations"].setdefault(active_config, {})
+        del data["configurations"][active_config][name]
 
 
 def get_active() -> dict[str, Any]:
@@ -74,33 +73,30 @@ def get_active() -> dict[str, Any]:
 
 
 def set_active(name: str):
-    data = read_file()
-    _guard_valid_config_name(data, name)
-    data["active"] = name
-    write_file(data)
+    with update_file() as data:
+        _guard_valid_config_name(data, name)
+        data["active"] = name
 
 
 def create_new_config(name: str, template: str):
-    data = read_file()
-    _guard_config_unique(data, name)
-    new_config = {}
-    if template:
-        _guard_valid_config_name(data, template)
-        new_config = data["configurations"][template]
+    with update_file() as data:
+        _guard_config_unique(data, name)
+        new_config = {}
+        if template:
+            _guard_valid_config_name(data, template)
+            new_config = data["configurations"][template]
 
-    data["active"] = name
-    data.setdefault("configurations", {})
-    data["configurations"][name] = new_config
-    write_file(data)
+        data["active"] = name
+        data.setdefault("configurations", {})
+        data["configurations"][name] = new_config
 
 
 def delete_config(name: str):
     _guard_valid_config_deletion(name)
-    data = read_file()
-    data["configurations"].pop(name, None)
-    if data["active"] == name:
-        data["active"] = "default"
-    write_file(data)
+    with update_file() as data:
+        data["configurations"].pop(name, None)
+        if data["active"] == name:
+            data["active"] = "default"
 
 
 def _guard_valid_name(name: str):
@@ -139,6 +135,9 @@ def get_defaults() -> dict[str, Any]:
         "github_api_token": "",
         "log_level": "info",
         "gas_limit_multiplier": "1.0",
+        "guardian_data_cache_ttl": "0",
+        "gas_estimation_cache_size": "0",
+        "gas_estimation_safety_margin": "1.1",
     }
 
 
@@ -147,6 +146,21 @@ def get_gas_limit_multiplier_from_config() -> float:
     return float(value)
 
 
+def get_guardian_data_cache_ttl_from_config() -> int:
+    value = get_value("guardian_data_cache_ttl")
+    return int(value)
+
+
+def get_gas_estimation_cache_size_from_config() -> int:
+    value = get_value("gas_estimation_cache_size")
+    return int(value)
+
+
+def get_gas_estimation_safety_margin_from_config() -> float:
+    value = get_value("gas_estimation_safety_margin")
+    return float(value)
+
+
 def get_log_level_from_config() -> str:
     log_level = get_value("log_level")
     if log_level not in LOG_LEVELS:
@@ -178,9 +192,14 @@ def read_file() -> dict[str, Any]:
     return dict()
 
 
-def write_file(data: dict[str, Any]):
-    config_path = resolve_config_path()
-    utils.write_json_file(str(config_path), data)
+def update_file() -> ContextManager[dict[str, Any]]:
+    """Changes the config file (under a lock), then drops the snapshot held by this process."""
+    return update_json_file(resolve_config_path(), _drop_snapshot)
+
+
+def _drop_snapshot():
+    read_file.cache_clear()
+    get_value.cache_clear()
 
 
 def get_dependency_directory(key: str, tag: str) -> Path:
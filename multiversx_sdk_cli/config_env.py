@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import Any, ContextManager
 
+from multiversx_sdk_cli.config_files import update_json_file
 from multiversx_sdk_cli.constants import SDK_PATH
 from multiversx_sdk_cli.errors import (
     EnvironmentAlreadyExistsError,
@@ -11,7 +12,7 @@ from multiversx_sdk_cli.errors import (
     InvalidEnvironmentValue,
     UnknownEnvironmentError,
 )
-from multiversx_sdk_cli.utils import read_json_file, write_json_file
+from multiversx_sdk_cli.utils import read_json_file
 
 LOCAL_ENV_PATH = Path("env.mxpy.json").resolve()
 GLOBAL_ENV_PATH = SDK_PATH / "env.mxpy.json"
@@ -143,38 +144,44 @@ def resolve_env_path() -> Path:
 
 def set_value(name: str, value: str, env_name: str):
     _guard_valid_name(name)
-    data = read_env_file()
+    with update_file() as data:
+        envs = data.get("environments", {})
+        env = envs.get(env_name, None)
+        if env is None:
+            raise UnknownEnvironmentError(env_name)
 
-    envs = data.get("environments", {})
-    env = envs.get(env_name, None)
-    if env is None:
-        raise UnknownEnvironmentError(env_name)
+        env[name] = value
+        envs[env_name] = env
+        data["environments"] = envs
 
-    env[name] = value
-    envs[env_name] = env
-    data["environments"] = envs
-    write_file(data)
 
+def update_file() -> ContextManager[dict[str, Any]]:
+    """Changes the env file (under a lock), then drops the snapshot held by this process."""
+    return update_json_file(resolve_env_path(), _drop_snapshot)
 
-def write_file(data: dict[str, Any]):
-    env_path = resolve_env_path()
-    write_json_file(str(env_path), data)
+
+def _drop_snapshot():
+    read_env_file.cache_clear()
+    get_value.cache_clear()
+    get_address_hrp.cache_clear()
+    get_proxy_url.cache_clear()
+    get_explorer_url.cache_clear()
+    get_confirmation_setting.cache_clear()
+    MxpyEnv.from_active_env.cache_clear()
 
 
 def delete_value(name: str, env_name: str):
     """Deletes a key-value pair of the active env."""
     _guard_valid_env_deletion(name)
-    data = read_env_file()
+    with update_file() as data:
+        envs = data.get("environments", {})
+        env = envs.get(env_name, None)
+        if env is None:
+            raise UnknownEnvironmentError(env_name)
 
-    envs = data.get("environments", {})
-    env = envs.get(env_name, None)
-    if env is None:
-        raise UnknownEnvironmentError(env_name)
-
-    del env[name]
-    envs[env_name] = env
-    data["environments"] = envs
-    write_file(data)
+        del env[name]
+        envs[env_name] = env
+        data["environments"] = envs
 
 
 def _guard_valid_env_deletion(name: str):
@@ -183,10 +190,9 @@ def _guard_valid_env_deletion(name: str):
 
 
 def set_active(name: str):
-    data = read_env_file()
-    _guard_valid_env_name(data, name)
-    data["active"] = name
-    write_file(data)
+    with update_file() as data:
+        _guard_valid_env_name(data, name)
+        data["active"] = name
 
 
 def _guard_valid_env_name(env: Any, name: str):
@@ -196,17 +202,16 @@ def _guard_valid_env_name(env: Any, name: str):
 
 
 def create_new_env(name: str, template: str):
-    data = read_env_file()
-    _guard_env_unique(data, name)
-    new_env = {}
-    if template:
-        _guard_valid_env_name(data, template)
-        new_env = data["environments"][template]
+    with update_file() as data:
+        _guard_env_unique(data, name)
+        new_env = {}
+        if template:
+            _guard_valid_env_name(data, template)
+            new_env = data["environments"][template]
 
-    data["active"] = name
-    data.setdefault("environments", {})
-    data["environments"][name] = new_env
-    write_file(data)
+        data["active"] = name
+        data.setdefault("environments", {})
+        data["environments"][name] = new_env
 
 
 def _guard_env_unique(env: Any, name: str):
@@ -217,8 +222,7 @@ def _guard_env_unique(env: Any, name: str):
 
 def delete_env(name: str):
     _guard_valid_env_deletion(name)
-    data = read_env_file()
-    data["environments"].pop(name, None)
-    if data["active"] == name:
-        data["active"] = "default"
-    write_file(data)
+    with update_file() as data:
+        data["environments"].pop(name, None)
+        if data["active"] == name:
+            data["active"] = "default"
@@ -0,0 +1,69 @@
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from multiversx_sdk_cli import utils
+
+# The config files (mxpy.json, env.mxpy.json, wallets.mxpy.json) are read once per process: their readers are memoized.
+# Changes go through `update_json_file`, which also drops the memoized snapshots, via `on_updated`.
+
+LOCK_FILE_SUFFIX = ".lock"
+
+
+@contextmanager
+def update_json_file(path: Path, on_updated: Callable[[], None]) -> Iterator[dict[str, Any]]:
+    """
+    Yields the content of the file, to be changed in place, then writes it back. Concurrent processes are serialized
+    by an exclusive lock (on a sibling file), and the content is read again under the lock (not taken from the
+    snapshot), so that no process overwrites the changes of another. The file is replaced atomically.
+    Nothing is written if the block raises.
+    """
+    utils.ensure_folder(path.parent)
+
+    with _exclusive_lock(path.with_name(path.name + LOCK_FILE_SUFFIX)):
+        data: dict[str, Any] = utils.read_json_file(path) if path.exists() else {}
+        yield data
+        _write_atomically(path, data)
+
+    on_updated()
+
+
+def _write_atomically(path: Path, data: dict[str, Any]):
+    fd, temporary_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        Path(temporary_path).unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def _exclusive_lock(lock_path: Path) -> Iterator[None]:
+    with open(lock_path, "a+") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            f.seek(0)
+            # Blocks (retrying every second, for up to 10 seconds).
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)  # type: ignore
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)  # type: ignore
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -1,7 +1,8 @@
 from functools import cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, ContextManager, Optional
 
+from multiversx_sdk_cli.config_files import update_json_file
 from multiversx_sdk_cli.constants import SDK_PATH
 from multiversx_sdk_cli.errors import (
     AliasAlreadyExistsError,
@@ -9,7 +10,7 @@ from multiversx_sdk_cli.errors import (
     InvalidAddressConfigValue,
     UnknownWalletAliasError,
 )
-from multiversx_sdk_cli.utils import read_json_file, write_json_file
+from multiversx_sdk_cli.utils import read_json_file
 
 LOCAL_WALLET_CONFIG_PATH = Path("wallets.mxpy.json").resolve()
 GLOBAL_WALLET_CONFIG_PATH = SDK_PATH / "wallets.mxpy.json"
@@ -92,30 +93,32 @@ def resolve_wallet_config_path() -> Path:
 def set_value(name: str, value: str, alias: str):
     """Sets a key-value pair in the specified wallet config."""
     _guard_valid_name(name)
-    data = read_wallet_config_file()
-    available_wallets = data.get("wallets", {})
+    with _update_file() as data:
+        available_wallets = data.get("wallets", {})
 
-    wallet = available_wallets.get(alias, None)
-    if wallet is None:
-        raise UnknownWalletAliasError(alias)
+        wallet = available_wallets.get(alias, None)
+        if wallet is None:
+            raise UnknownWalletAliasError(alias)
+
+        wallet[name] = value
+        available_wallets[alias] = wallet
+        data["wallets"] = available_wallets
 
-    wallet[name] = value
-    available_wallets[alias] = wallet
-    data["wallets"] = available_wallets
-    _write_file(data)
 
+def _update_file() -> ContextManager[dict[str, Any]]:
+    return update_json_file(resolve_wallet_config_path(), _drop_snapshot)
 
-def _write_file(data: dict[str, Any]):
-    env_path = resolve_wallet_config_path()
-    write_json_file(str(env_path), data)
+
+def _drop_snapshot():
+    read_wallet_config_file.cache_clear()
+    get_value.cache_clear()
 
 
 def switch_wallet(name: str):
     """Switches to the wallet configuration with the given name."""
-    data = read_wallet_config_file()
-    _guard_valid_wallet_name(data, name)
-    data["active"] = name
-    _write_file(data)
+    with _update_file() as data:
+        _guard_valid_wallet_name(data, name)
+        data["active"] = name
 
 
 def _guard_valid_wallet_name(env: Any, name: str):
@@ -126,17 +129,16 @@ def _guard_valid_wallet_name(env: Any, name: str):
 
 def create_new_wallet_config(name: str, path: Optional[str] = None):
     """Creates a new wallet config with the given name and sets it as the default wallet."""
-    data = read_wallet_config_file()
-    _guard_alias_unique(data, name)
-    new_wallet = {}
+    with _update_file() as data:
+        _guard_alias_unique(data, name)
+        new_wallet = {}
 
-    if path:
-        new_wallet["path"] = path
+        if path:
+            new_wallet["path"] = path
 
-    data["active"] = name
-    data.setdefault("wallets", {})
-    data["wallets"][name] = new_wallet
-    _write_file(data)
+        data["active"] = name
+        data.setdefault("wallets", {})
+        data["wallets"][name] = new_wallet
 
 
 def _guard_alias_unique(env: Any, name: str):
@@ -149,27 +151,25 @@ def delete_config_value(key: str, alias: str):
     """Deletes a key-value pair of the specified wallet config."""
     _guard_valid_name(key)
 
-    data = read_wallet_config_file()
-    available_wallets = data.get("wallets", {})
+    with _update_file() as data:
+        available_wallets = data.get("wallets", {})
 
-    wallet = available_wallets.get(alias, None)
-    if wallet is None:
-        raise UnknownWalletAliasError(alias)
+        wallet = available_wallets.get(alias, None)
+        if wallet is None:
+            raise UnknownWalletAliasError(alias)
 
-    del wallet[key]
-    available_wallets[alias] = wallet
-    data["wallets"] = available_wallets
-    _write_file(data)
+        del wallet[key]
+        available_wallets[alias] = wallet
+        data["wallets"] = available_wallets
 
 
 def delete_alias(name: str):
     """Deletes the wallet configuration with the given name."""
     _guard_valid_alias_deletion(name)
-    data = read_wallet_config_file()
-    data["wallets"].pop(name, None)
-    if data["active"] == name:
-        data["active"] = "default"
-    _write_file(data)
+    with _update_file() as data:
+        data["wallets"].pop(name, None)
+        if data["active"] == name:
+            data["active"] = "default"
 
 
 def _guard_valid_alias_deletion(name: str):
@@ -18,6 +18,7 @@ NUMBER_OF_SHARDS = 3
 
 DEFAULT_GAS_PRICE = 1000000000
 MIN_GAS_LIMIT = 50000
+MAX_GAS_LIMIT_PER_TRANSACTION = 600_000_000
 
 TCS_SERVICE_ID = "MultiversXTCSService"
 EXTRA_GAS_LIMIT_FOR_GUARDED_TRANSACTIONS = 50_000
@@ -33,3 +34,6 @@ MAINCHAIN_ADDRESS_HRP = "erd"
 SDK_PATH = Path("~/multiversx-sdk").expanduser().resolve()
 
 LOG_LEVELS = ["debug", "info", "warning", "error"]
+# "json" is indented; "compact" has no whitespace; "jsonl" is compact, with the items of a list on separate lines;
+# "orjson" is like "compact", but serialized by the (faster) orjson package, if installed.
+OUTPUT_FORMATS = ["json", "compact", "jsonl", "orjson"]
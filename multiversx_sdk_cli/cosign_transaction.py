@@ -7,9 +7,28 @@ from multiversx_sdk_cli.errors import GuardianServiceError
 
 
 def cosign_transaction(transaction: Transaction, service_url: str, guardian_code: str):
+    cosign_transactions([transaction], service_url, guardian_code)
+
+
+def cosign_transactions(transactions: list[Transaction], service_url: str, guardian_code: str):
+    """
+    Co-signs the transactions with the trusted cosigner service, in a single request: the 2FA code is only valid once,
+    thus it cannot be reused for follow-up requests.
+    """
+    signed = _request_cosignatures([tx.to_dictionary() for tx in transactions], service_url, guardian_code)
+    if len(signed) != len(transactions):
+        raise GuardianServiceError(f"expected {len(transactions)} co-signed transactions, got {len(signed)}")
+
+    for transaction, tx_as_dict in zip(transactions, signed):
+        transaction.guardian_signature = bytes.fromhex(tx_as_dict["guardianSignature"])
+
+
+def _request_cosignatures(
+    transactions: list[dict[str, Any]], service_url: str, guardian_code: str
+) -> list[dict[str, Any]]:
     payload = {
         "code": f"{guardian_code}",
-        "transactions": [transaction.to_dictionary()],
+        "transactions": transactions,
     }
 
     # we call sign-multiple-transactions to be allowed a bigger payload (e.g. deploying large contracts)
@@ -17,9 +36,8 @@ def cosign_transaction(transaction: Transaction, service_url: str, guardian_code
     response = requests.post(url, json=payload)
     check_for_guardian_error(response.json())
 
-    # we only send 1 transaction
-    tx_as_dict = response.json()["data"]["transactions"][0]
-    transaction.guardian_signature = bytes.fromhex(tx_as_dict["guardianSignature"])
+    signed: list[dict[str, Any]] = response.json()["data"]["transactions"]
+    return signed
 
 
 def check_for_guardian_error(response: dict[str, Any]):
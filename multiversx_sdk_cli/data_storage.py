@@ -0,0 +1,124 @@
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from multiversx_sdk_cli import errors, utils
+
+logger = logging.getLogger("data_storage")
+
+DATA_STORE_FILENAME = "mxpy.data-storage.sqlite"
+# The file used before the data was kept in SQLite; it's imported (once) when the store is created.
+LEGACY_DATA_FILENAME = "mxpy.data-storage.json"
+# How long to wait for a concurrent writer (e.g. another script) to release the database.
+LOCK_TIMEOUT_IN_SECONDS = 30
+
+
+class DataStore:
+    """
+    Key-value pairs, grouped in partitions, kept in a SQLite database. Each write only touches its own rows (indexed by
+    partition and key); concurrent processes are serialized by the database's own file locking.
+    """
+
+    def __init__(self, path: Path, read_only: bool = False) -> None:
+        """
+        The database (and its legacy import) is only created by writers. Opened for reading, a missing database is
+        not created: the legacy file (if any) is read into memory instead.
+        """
+        is_new = not path.exists()
+        self.path = path
+
+        if read_only and is_new:
+            self.connection = sqlite3.connect(":memory:")
+        elif read_only:
+            self.connection = sqlite3.connect(
+                f"{path.resolve().as_uri()}?mode=ro", uri=True, timeout=LOCK_TIMEOUT_IN_SECONDS
+            )
+        else:
+            self.connection = sqlite3.connect(path, timeout=LOCK_TIMEOUT_IN_SECONDS)
+
+        if read_only and not is_new:
+            return
+
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "partition TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, PRIMARY KEY (partition, key)"
+                ") WITHOUT ROWID"
+            )
+
+        legacy_file = path.with_name(LEGACY_DATA_FILENAME)
+        if is_new and legacy_file.is_file():
+            num_imported = self.import_json(legacy_file)
+            if not read_only:
+                logger.info(f"Imported {num_imported} entries from {legacy_file}.")
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self) -> "DataStore":
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
+
+    def store(self, partition: str, key: str, value: str):
+        self.store_many(partition, [(key, value)])
+
+    def store_many(self, partition: str, items: Iterable[tuple[str, str]]) -> int:
+        """Stores the pairs within a single transaction: either all of them are saved, or none."""
+        with self.connection:
+            cursor = self.connection.executemany(
+                "INSERT OR REPLACE INTO entries (partition, key, value) VALUES (?, ?, ?)",
+                ((partition, key, value) for key, value in items),
+            )
+            return cursor.rowcount
+
+    def load(self, partition: str, key: str) -> Optional[str]:
+        row = self.connection.execute(
+            "SELECT value FROM entries WHERE partition = ? AND key = ?", (partition, key)
+        ).fetchone()
+        return row[0] if row else None
+
+    def dump(self, partition: Optional[str] = None) -> dict[str, dict[str, str]]:
+        """Returns the pairs as {partition: {key: value}} (the layout of the legacy file)."""
+        if partition is None:
+            rows = self.connection.execute("SELECT partition, key, value FROM entries ORDER BY partition, key")
+        else:
+            rows = self.connection.execute(
+                "SELECT partition, key, value FROM entries WHERE partition = ? ORDER BY key", (partition,)
+            )
+
+        data: dict[str, dict[str, str]] = {}
+        for row_partition, key, value in rows:
+            data.setdefault(row_partition, {})[key] = value
+        return data
+
+    def import_json(self, path: Path) -> int:
+        """Imports a file in the legacy layout ({partition: {key: value}}), within a single transaction."""
+        try:
+            data = utils.read_json_file(path)
+        except (OSError, ValueError) as error:
+            raise errors.BadUserInput(f"Cannot read {path}: {error}")
+
+        if not isinstance(data, dict) or not all(isinstance(pairs, dict) for pairs in data.values()):
+            raise errors.BadUserInput(f"Unexpected layout of {path} (expected: {{partition: {{key: value}}}})")
+
+        with self.connection:
+            cursor = self.connection.executemany(
+                "INSERT OR REPLACE INTO entries (partition, key, value) VALUES (?, ?, ?)",
+                (
+                    (partition, key, to_stored_value(value))
+                    for partition, pairs in data.items()
+                    for key, value in pairs.items()
+                ),
+            )
+            return cursor.rowcount
+
+
+def to_stored_value(value: Any) -> str:
+    """Values are kept as text; other JSON values (numbers, objects) are kept as their JSON representation."""
+    if isinstance(value, str):
+        return value
+    return json.dumps(value)
@@ -1,3 +1,8 @@
+import logging
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from typing import Any, Protocol
 
 from Cryptodome.Hash import keccak
@@ -9,19 +14,25 @@ from multiversx_sdk import (
     TransfersController,
 )
 
-from multiversx_sdk_cli import cli_shared
+from multiversx_sdk_cli import cli_shared, utils
 from multiversx_sdk_cli.args_validation import (
     validate_broadcast_args,
     validate_chain_id_args,
     validate_transaction_args,
 )
 from multiversx_sdk_cli.config_env import get_address_hrp
-from multiversx_sdk_cli.constants import ADDRESS_ZERO_HEX
+from multiversx_sdk_cli.constants import ADDRESS_ZERO_HEX, SDK_PATH
+
+logger = logging.getLogger("dns")
 
 MaxNumShards = 256
 ShardIdentiferLen = 2
 InitialDNSAddress = bytes([1] * 32)
 
+DNS_CACHE_FILE = SDK_PATH / "dns_cache.json"
+DEFAULT_DNS_CACHE_TTL = 600
+DEFAULT_NUM_RESOLVE_WORKERS = 16
+
 
 # fmt: off
 class INetworkProvider(Protocol):
@@ -35,6 +46,45 @@ def resolve(name: str, proxy: INetworkProvider) -> Address:
 
     response = _query_contract(contract_address=dns_address, proxy=proxy, function="resolve", args=[name.encode()])
 
+    return _parse_resolve_response(response)
+
+
+def resolve_many(
+    names: list[str],
+    proxy: INetworkProvider,
+    proxy_url: str,
+    num_workers: int = DEFAULT_NUM_RESOLVE_WORKERS,
+    cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
+) -> dict[str, Address]:
+    """
+    Resolves many names at once. Names are grouped by their DNS contract, and the groups are queried concurrently.
+    Results are cached locally (per proxy URL), for `cache_ttl` seconds (0 disables the cache).
+    """
+    cache = _load_resolve_cache(proxy_url, cache_ttl)
+    result: dict[str, Address] = {name: Address.new_from_bech32(cache[name]) for name in names if name in cache}
+
+    names_by_shard: dict[int, list[str]] = defaultdict(list)
+    for name in dict.fromkeys(names):
+        if name not in result:
+            names_by_shard[_get_shard_id_for_name(name)].append(name)
+
+    num_pending = sum(len(group) for group in names_by_shard.values())
+    logger.info(f"Resolving {num_pending} names ({len(result)} cached), across {len(names_by_shard)} DNS contracts.")
+
+    def resolve_group(group: list[str]) -> dict[str, Address]:
+        return {name: resolve(name, proxy) for name in group}
+
+    with ThreadPoolExecutor(max_workers=max(num_workers, 1)) as executor:
+        for resolved in executor.map(resolve_group, names_by_shard.values()):
+            result.update(resolved)
+
+    if cache_ttl > 0 and num_pending:
+        _save_resolve_cache(proxy_url, {name: result[name] for group in names_by_shard.values() for name in group})
+
+    return {name: result[name] for name in names}
+
+
+def _parse_resolve_response(response: SmartContractQueryResponse) -> Address:
     if len(response.return_data_parts) == 0:
         return Address.new_from_hex(ADDRESS_ZERO_HEX, get_address_hrp())
 
@@ -42,6 +92,37 @@ def resolve(name: str, proxy: INetworkProvider) -> Address:
     return Address(result, get_address_hrp())
 
 
+def _load_resolve_cache(proxy_url: str, cache_ttl: int) -> dict[str, str]:
+    if cache_ttl <= 0 or not DNS_CACHE_FILE.is_file():
+        return {}
+
+    try:
+        entries: dict[str, Any] = utils.read_json_file(DNS_CACHE_FILE).get(proxy_url, {})
+    except (OSError, ValueError) as error:
+        logger.warning(f"Ignoring unreadable DNS cache: {error}")
+        return {}
+
+    now = time.time()
+    return {name: entry["address"] for name, entry in entries.items() if now - entry["timestamp"] < cache_ttl}
+
+
+def _save_resolve_cache(proxy_url: str, resolved: dict[str, Address]):
+    data: dict[str, Any] = {}
+
+    if DNS_CACHE_FILE.is_file():
+        try:
+            data = utils.read_json_file(DNS_CACHE_FILE)
+        except (OSError, ValueError):
+            data = {}
+
+    now = time.time()
+    entries = data.setdefault(proxy_url, {})
+    entries.update({name: {"address": address.to_bech32(), "timestamp": now} for name, address in resolved.items()})
+
+    utils.ensure_folder(DNS_CACHE_FILE.parent)
+    utils.write_json_file(DNS_CACHE_FILE, data)
+
+
 def validate_name(name: str, shard_id: int, proxy: INetworkProvider):
     dns_address = compute_dns_address_for_shard_id(shard_id)
 
@@ -101,10 +182,8 @@ def register(args: Any):
 
 
 def compute_all_dns_addresses() -> list[Address]:
-    addresses: list[Address] = []
-    for i in range(0, 256):
-        addresses.append(compute_dns_address_for_shard_id(i))
-    return addresses
+    hrp = get_address_hrp()
+    return [Address(pubkey, hrp) for pubkey in _get_dns_addresses_table()]
 
 
 def name_hash(name: str) -> bytes:
@@ -136,12 +215,27 @@ def version(shard_id: int, proxy: INetworkProvider) -> str:
 
 
 def dns_address_for_name(name: str) -> Address:
-    hash = name_hash(name)
-    shard_id = hash[31]
-    return compute_dns_address_for_shard_id(shard_id)
+    return compute_dns_address_for_shard_id(_get_shard_id_for_name(name))
+
+
+def _get_shard_id_for_name(name: str) -> int:
+    return name_hash(name)[31]
 
 
 def compute_dns_address_for_shard_id(shard_id: int) -> Address:
+    return Address(_get_dns_addresses_table()[shard_id], get_address_hrp())
+
+
+@cache
+def _get_dns_addresses_table() -> list[bytes]:
+    """
+    The public keys of the 256 DNS contracts never change: they are computed once per process. They are not loaded
+    from disk, since they are the receivers of value-carrying transactions (e.g. `dns register`).
+    """
+    return [_compute_dns_address_for_shard_id(shard_id).get_public_key() for shard_id in range(MaxNumShards)]
+
+
+def _compute_dns_address_for_shard_id(shard_id: int) -> Address:
     deployer_pubkey_prefix = InitialDNSAddress[: len(InitialDNSAddress) - ShardIdentiferLen]
 
     deployer_pubkey = deployer_pubkey_prefix + bytes([0, shard_id])
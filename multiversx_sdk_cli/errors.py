@@ -219,3 +219,8 @@ class WalletError(KnownError):
 class NetworkProviderError(KnownError):
     def __init__(self, url: str, error: str):
         super().__init__(f"Url = [{url}], error = {error}")
+
+
+class HistoryPagingError(KnownError):
+    def __init__(self, timestamp: int):
+        super().__init__(f"Cannot page past timestamp {timestamp}: too many transactions share it")
@@ -0,0 +1,300 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from multiversx_sdk import (
+    NetworkConfig,
+    Transaction,
+    TransactionComputer,
+    TransactionsFactoryConfig,
+)
+from multiversx_sdk.core.constants import (
+    DELEGATION_MANAGER_SC_ADDRESS_HEX,
+    ESDT_CONTRACT_ADDRESS_HEX,
+    EXTRA_GAS_LIMIT_FOR_GUARDED_TRANSACTIONS,
+    EXTRA_GAS_LIMIT_FOR_RELAYED_TRANSACTIONS,
+    STAKING_SMART_CONTRACT_ADDRESS_HEX,
+)
+from multiversx_sdk.core.interfaces import IGasLimitEstimator
+from multiversx_sdk.transfers.transfer_transactions_factory import (
+    ADDITIONAL_GAS_FOR_ESDT_NFT_TRANSFER,
+    ADDITIONAL_GAS_FOR_ESDT_TRANSFER,
+)
+
+from multiversx_sdk_cli import utils
+from multiversx_sdk_cli.constants import SDK_PATH
+from multiversx_sdk_cli.gas_estimation import (
+    ESDT_NFT_TRANSFER,
+    ESDT_TRANSFER,
+    MULTI_ESDT_NFT_TRANSFER,
+    get_effective_receiver_and_function,
+)
+
+logger = logging.getLogger("fees")
+
+FEE_PARAMETERS_FILE = SDK_PATH / "fee_parameters.json"
+
+# The fixed costs of system calls, as used by the transactions factories of the SDK (on top of the data movement gas).
+# Some of them are paid for each node (public key) the call refers to.
+GasCost = Callable[[TransactionsFactoryConfig, list[str]], int]
+
+ESDT_SYSTEM_CALLS_COSTS: dict[str, GasCost] = {
+    "issue": lambda config, _: config.gas_limit_issue,
+    "issueSemiFungible": lambda config, _: config.gas_limit_issue,
+    "issueNonFungible": lambda config, _: config.gas_limit_issue,
+    "registerMetaESDT": lambda config, _: config.gas_limit_issue,
+    "registerAndSetAllRoles": lambda config, _: config.gas_limit_issue,
+    "registerDynamic": lambda config, _: config.gas_limit_register_dynamic,
+    "registerAndSetAllRolesDynamic": lambda config, _: config.gas_limit_register_dynamic,
+    "setBurnRoleGlobally": lambda config, _: config.gas_limit_toggle_burn_role_globally,
+    "unsetBurnRoleGlobally": lambda config, _: config.gas_limit_toggle_burn_role_globally,
+    "setSpecialRole": lambda config, _: config.gas_limit_set_special_role,
+    "unSetSpecialRole": lambda config, _: config.gas_limit_set_special_role,
+    "pause": lambda config, _: config.gas_limit_pausing,
+    "unPause": lambda config, _: config.gas_limit_pausing,
+    "freeze": lambda config, _: config.gas_limit_freezing,
+    "unFreeze": lambda config, _: config.gas_limit_freezing,
+    "wipe": lambda config, _: config.gas_limit_wiping,
+    "freezeSingleNFT": lambda config, _: config.gas_limit_freeze_single_nft,
+    "unFreezeSingleNFT": lambda config, _: config.gas_limit_unfreeze_single_nft,
+    "wipeSingleNFT": lambda config, _: config.gas_limit_wipe_single_nft,
+    "changeToDynamic": lambda config, _: config.gas_limit_nft_change_to_dynamic,
+    "updateTokenID": lambda config, _: config.gas_limit_update_token_id,
+    "transferOwnership": lambda config, _: config.gas_limit_transfer_ownership,
+    "changeSFTToMetaESDT": lambda config, _: config.gas_limit_change_sft_to_meta_esdt,
+    "transferNFTCreateRole": lambda config, _: config.gas_limit_transfer_nft_create_role,
+    "stopNFTCreate": lambda config, _: config.gas_limit_stop_nft_create,
+}
+
+STAKING_SYSTEM_CALLS_COSTS: dict[str, GasCost] = {
+    # Without arguments, "stake" is a top-up. Otherwise, the first argument is the number of nodes.
+    "stake": lambda config, args: (
+        config.gas_limit_for_staking * int(args[0], 16) if args else config.gas_limit_for_topping_up
+    ),
+    "unStake": lambda config, args: config.gas_limit_for_unstaking * len(args),
+    "unJail": lambda config, args: config.gas_limit_for_unjailing * len(args),
+    "unBond": lambda config, args: config.gas_limit_for_unbonding * len(args),
+    "unStakeNodes": lambda config, args: config.gas_limit_for_unstaking_nodes * len(args),
+    "unBondNodes": lambda config, args: config.gas_limit_for_unbonding_nodes * len(args),
+    "reStakeUnStakedNodes": lambda config, args: config.gas_limit_for_restaking_unstaked_tokens * len(args),
+    "changeRewardAddress": lambda config, _: config.gas_limit_for_changing_rewards_address,
+    "claim": lambda config, _: config.gas_limit_for_claiming,
+    "unStakeTokens": lambda config, _: config.gas_limit_for_unstaking_tokens,
+    "unBondTokens": lambda config, _: config.gas_limit_for_unbonding_tokens,
+    "cleanRegisteredData": lambda config, _: config.gas_limit_for_cleaning_registered_data,
+}
+
+DELEGATION_MANAGER_CALLS_COSTS: dict[str, GasCost] = {
+    "makeNewContractFromValidatorData": lambda config, _: config.gas_limit_for_creating_delegation_contract_from_validator,
+    "mergeValidatorToDelegationWithWhitelist": lambda config, _: config.gas_limit_for_merging_validator_to_delegation,
+    "mergeValidatorToDelegationSameOwner": lambda config, _: config.gas_limit_for_merging_validator_to_delegation,
+}
+
+# Built-in functions called on the sender's own account.
+BUILTIN_CALLS_COSTS: dict[str, GasCost] = {
+    "ESDTLocalMint": lambda config, _: config.gas_limit_esdt_local_mint,
+    "ESDTLocalBurn": lambda config, _: config.gas_limit_esdt_local_burn,
+    "ESDTNFTUpdateAttributes": lambda config, _: config.gas_limit_esdt_nft_update_attributes,
+    "ESDTNFTAddQuantity": lambda config, _: config.gas_limit_esdt_nft_add_quantity,
+    "ESDTNFTBurn": lambda config, _: config.gas_limit_esdt_nft_burn,
+    "ESDTNFTAddURI": lambda config, _: config.gas_limit_esdt_nft_add_uri,
+    "ESDTModifyRoyalties": lambda config, _: config.gas_limit_esdt_modify_royalties,
+    "ESDTSetNewURIs": lambda config, _: config.gas_limit_set_new_uris,
+    "ESDTModifyCreator": lambda config, _: config.gas_limit_esdt_modify_creator,
+    "ESDTMetaDataUpdate": lambda config, _: config.gas_limit_esdt_metadata_update,
+    "ESDTMetaDataRecreate": lambda config, _: config.gas_limit_nft_metadata_recreate,
+    "SetGuardian": lambda config, _: config.gas_limit_set_guardian,
+    "GuardAccount": lambda config, _: config.gas_limit_guard_account,
+    "UnGuardAccount": lambda config, _: config.gas_limit_unguard_account,
+}
+
+SYSTEM_CALLS_COSTS: dict[str, dict[str, GasCost]] = {
+    ESDT_CONTRACT_ADDRESS_HEX: ESDT_SYSTEM_CALLS_COSTS,
+    STAKING_SMART_CONTRACT_ADDRESS_HEX: STAKING_SYSTEM_CALLS_COSTS,
+    DELEGATION_MANAGER_SC_ADDRESS_HEX: DELEGATION_MANAGER_CALLS_COSTS,
+}
+
+
+@dataclass
+class FeeParameters:
+    """The network parameters needed to compute gas limits and fees (a subset of the network config)."""
+
+    chain_id: str
+    min_gas_limit: int
+    gas_per_data_byte: int
+    gas_price_modifier: float
+    min_gas_price: int
+
+    @classmethod
+    def new_from_network_config(cls, network_config: NetworkConfig) -> "FeeParameters":
+        return cls(
+            chain_id=network_config.chain_id,
+            min_gas_limit=network_config.min_gas_limit,
+            gas_per_data_byte=network_config.gas_per_data_byte,
+            gas_price_modifier=network_config.gas_price_modifier,
+            min_gas_price=network_config.min_gas_price,
+        )
+
+    @classmethod
+    def new_from_dictionary(cls, data: dict[str, Any]) -> "FeeParameters":
+        return cls(
+            chain_id=data["chainID"],
+            min_gas_limit=int(data["minGasLimit"]),
+            gas_per_data_byte=int(data["gasPerDataByte"]),
+            gas_price_modifier=float(data["gasPriceModifier"]),
+            min_gas_price=int(data["minGasPrice"]),
+        )
+
+    def to_dictionary(self) -> dict[str, Any]:
+        return {
+            "chainID": self.chain_id,
+            "minGasLimit": self.min_gas_limit,
+            "gasPerDataByte": self.gas_per_data_byte,
+            "gasPriceModifier": self.gas_price_modifier,
+            "minGasPrice": self.min_gas_price,
+        }
+
+
+def load_fee_parameters(chain_id: str) -> Optional[FeeParameters]:
+    """Returns the fee parameters of a chain, as saved the last time its network config has been fetched."""
+    entry = _read_fee_parameters_file().get(chain_id)
+    if not entry:
+        return None
+
+    try:
+        return FeeParameters.new_from_dictionary(entry)
+    except (KeyError, ValueError, TypeError) as error:
+        logger.debug(f"Ignoring unreadable fee parameters of chain {chain_id}: {error}")
+        return None
+
+
+def save_fee_parameters(fee_parameters: FeeParameters):
+    """These parameters only change with protocol upgrades, so they are refreshed whenever the network config is fetched."""
+    data = _read_fee_parameters_file()
+    if data.get(fee_parameters.chain_id) == fee_parameters.to_dictionary():
+        return
+
+    data[fee_parameters.chain_id] = fee_parameters.to_dictionary()
+
+    try:
+        utils.ensure_folder(FEE_PARAMETERS_FILE.parent)
+        utils.write_json_file(FEE_PARAMETERS_FILE, data)
+    except OSError as error:
+        logger.debug(f"Could not save the fee parameters: {error}")
+
+
+def _read_fee_parameters_file() -> dict[str, Any]:
+    if not FEE_PARAMETERS_FILE.is_file():
+        return {}
+
+    try:
+        data: dict[str, Any] = utils.read_json_file(FEE_PARAMETERS_FILE)
+        return data
+    except (OSError, ValueError) as error:
+        logger.debug(f"Ignoring unreadable fee parameters file: {error}")
+        return {}
+
+
+class FeeCalculator:
+    """Computes gas limits and fees locally, without simulating the transactions."""
+
+    def __init__(self, fee_parameters: FeeParameters) -> None:
+        self.fee_parameters = fee_parameters
+        self.factory_config = TransactionsFactoryConfig(fee_parameters.chain_id)
+        self.transaction_computer = TransactionComputer()
+
+    def compute_fee(self, transaction: Transaction) -> int:
+        """Raises `NotEnoughGasError` if the gas limit does not cover the data movement."""
+        return self.transaction_computer.compute_transaction_fee(transaction, self.fee_parameters)
+
+    def compute_data_movement_gas(self, transaction: Transaction) -> int:
+        return self.fee_parameters.min_gas_limit + self.fee_parameters.gas_per_data_byte * len(transaction.data)
+
+    def compute_gas_limit(self, transaction: Transaction) -> Optional[int]:
+        """
+        Handles plain transfers (including token transfers to user accounts) and fixed-cost system calls.
+        For anything else (e.g. smart contract calls), the gas cannot be known in advance: returns None.
+        """
+        extra_gas = self._compute_extra_gas(transaction)
+        if extra_gas is None:
+            return None
+
+        gas_limit = self.compute_data_movement_gas(transaction) + extra_gas
+
+        if transaction.guardian:
+            gas_limit += EXTRA_GAS_LIMIT_FOR_GUARDED_TRANSACTIONS
+        if transaction.relayer:
+            gas_limit += EXTRA_GAS_LIMIT_FOR_RELAYED_TRANSACTIONS
+
+        return gas_limit
+
+    def _compute_extra_gas(self, transaction: Transaction) -> Optional[int]:
+        parts = transaction.data.decode(errors="replace").split("@")
+        function, args = parts[0], parts[1:]
+
+        try:
+            system_calls_costs = SYSTEM_CALLS_COSTS.get(transaction.receiver.to_hex())
+            if system_calls_costs is not None:
+                cost = system_calls_costs.get(function)
+                return cost(self.factory_config, args) if cost else None
+
+            if transaction.receiver.is_smart_contract():
+                return None
+            if not transaction.data:
+                return 0
+            if function in [ESDT_TRANSFER, ESDT_NFT_TRANSFER, MULTI_ESDT_NFT_TRANSFER]:
+                return self._compute_extra_gas_for_token_transfer(transaction, function, args)
+            if transaction.receiver == transaction.sender:
+                # Built-in functions are called on the sender's own account.
+                cost = BUILTIN_CALLS_COSTS.get(function)
+                return cost(self.factory_config, args) if cost else None
+        except (ValueError, IndexError):
+            return None
+
+        # A transfer with a message (to another user account).
+        return 0
+
+    def _compute_extra_gas_for_token_transfer(
+        self, transaction: Transaction, function: str, args: list[str]
+    ) -> Optional[int]:
+        receiver, inner_function = get_effective_receiver_and_function(transaction, function, args)
+        if inner_function or receiver.is_smart_contract():
+            return None
+
+        config = self.factory_config
+        if function == ESDT_TRANSFER:
+            return config.gas_limit_esdt_transfer + ADDITIONAL_GAS_FOR_ESDT_TRANSFER
+        if function == ESDT_NFT_TRANSFER:
+            return config.gas_limit_esdt_nft_transfer + ADDITIONAL_GAS_FOR_ESDT_NFT_TRANSFER
+
+        num_transfers = int(args[1], 16)
+        return config.gas_limit_multi_esdt_nft_transfer * num_transfers + ADDITIONAL_GAS_FOR_ESDT_NFT_TRANSFER
+
+
+class LocalGasLimitEstimator:
+    """
+    Computes the gas limit of plain transfers and fixed-cost system calls locally (see `FeeCalculator`).
+    Other transactions are handed over to the fallback estimator (which simulates them), if any.
+    Without a fallback, their gas limit (as computed by the transactions factory) is left as it is.
+    """
+
+    def __init__(
+        self,
+        fee_parameters: FeeParameters,
+        fallback: Optional[IGasLimitEstimator] = None,
+        gas_multiplier: float = 1.0,
+    ) -> None:
+        self.calculator = FeeCalculator(fee_parameters)
+        self.fallback = fallback
+        self.gas_multiplier = gas_multiplier
+
+    def estimate_gas_limit(self, transaction: Transaction) -> int:
+        gas_limit = self.calculator.compute_gas_limit(transaction)
+        if gas_limit is not None:
+            logger.debug(f"Gas limit computed locally: {gas_limit}")
+            return int(gas_limit * self.gas_multiplier)
+
+        if self.fallback:
+            return self.fallback.estimate_gas_limit(transaction)
+
+        return transaction.gas_limit
@@ -0,0 +1,201 @@
+import json
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from multiversx_sdk import Address, GasLimitEstimator, ProxyNetworkProvider, Transaction
+from multiversx_sdk.gas_estimator.errors import GasLimitEstimationError
+
+from multiversx_sdk_cli import utils
+from multiversx_sdk_cli.constants import ADDRESS_ZERO_HEX, SDK_PATH
+
+logger = logging.getLogger("gas_estimation")
+
+GAS_ESTIMATES_CACHE_FILE = SDK_PATH / "gas_estimates.json"
+
+# Built-in functions for token transfers; the contract call (if any) is wrapped within their arguments.
+ESDT_TRANSFER = "ESDTTransfer"
+ESDT_NFT_TRANSFER = "ESDTNFTTransfer"
+MULTI_ESDT_NFT_TRANSFER = "MultiESDTNFTTransfer"
+# Their gas depends on the code itself, not only on its size.
+NOT_CACHEABLE_FUNCTIONS = ["upgradeContract"]
+
+
+class GasEstimatesCache:
+    """A bounded (LRU) map from call shapes to estimated gas limits, persisted on disk."""
+
+    def __init__(self, path: Path, max_size: int) -> None:
+        self.path = path
+        self.max_size = max_size
+        self._entries: OrderedDict[str, int] = OrderedDict(self._load())
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[int]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, gas_limit: int):
+        with self._lock:
+            self._entries[key] = gas_limit
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+            self._save()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> list[tuple[str, int]]:
+        if not self.path.is_file():
+            return []
+
+        try:
+            return [(key, int(value)) for key, value in utils.read_json_file(self.path)]
+        except (OSError, ValueError, TypeError) as error:
+            logger.debug(f"Ignoring unreadable gas estimates cache: {error}")
+            return []
+
+    def _save(self):
+        try:
+            utils.ensure_folder(self.path.parent)
+            utils.write_json_file(self.path, list(self._entries.items()))
+        except OSError as error:
+            logger.debug(f"Could not save the gas estimates cache: {error}")
+
+
+class SimulatingGasLimitEstimator(GasLimitEstimator):
+    """
+    Simulates the transactions, then applies the safety margin (config: `gas_estimation_safety_margin`) on top of
+    the gas multiplier, since the actual execution may differ slightly from the simulation.
+    """
+
+    def __init__(
+        self,
+        network_provider: ProxyNetworkProvider,
+        gas_multiplier: Optional[float] = None,
+        safety_margin: float = 1.0,
+    ):
+        super().__init__(network_provider=network_provider, gas_multiplier=gas_multiplier)
+        self.proxy = network_provider
+        self.safety_margin = safety_margin
+
+    def estimate_gas_limit(self, transaction: Transaction) -> int:
+        return self._apply_margin(self._simulate(transaction))
+
+    def _simulate(self, transaction: Transaction) -> int:
+        try:
+            return self.proxy.estimate_transaction_cost(transaction).gas_limit
+        except Exception as e:
+            raise GasLimitEstimationError(e)
+
+    def _apply_margin(self, gas_limit: int) -> int:
+        return int(gas_limit * self.safety_margin * self.gas_multiplier)
+
+
+class CachingGasLimitEstimator(SimulatingGasLimitEstimator):
+    """
+    Reuses previous estimations for contract calls of the same shape: same contract code (hash), same function,
+    same argument sizes and same token transfers. Unseen shapes (and anything else) are simulated.
+    Since the code hash is part of the shape, a contract upgrade invalidates the previous estimations.
+    Calls whose gas depends on the argument values (not only on their sizes) may get a stale estimation, thus the cache
+    is opt-in (config: `gas_estimation_cache_size`), meant for batches of similar calls. Simulated, reused and
+    non-cacheable estimations all get the safety margin.
+    """
+
+    def __init__(
+        self,
+        network_provider: ProxyNetworkProvider,
+        cache: GasEstimatesCache,
+        gas_multiplier: Optional[float] = None,
+        safety_margin: float = 1.0,
+    ):
+        super().__init__(network_provider=network_provider, gas_multiplier=gas_multiplier, safety_margin=safety_margin)
+        self.cache = cache
+        self._code_hashes: dict[str, str] = {}
+
+    def estimate_gas_limit(self, transaction: Transaction) -> int:
+        key = self._get_call_shape(transaction)
+        if key is None:
+            return super().estimate_gas_limit(transaction)
+
+        gas_limit = self.cache.get(key)
+        if gas_limit is not None:
+            logger.debug(f"Reusing the gas estimation for call shape: {key}")
+            return self._apply_margin(gas_limit)
+
+        gas_limit = self._simulate(transaction)
+        self.cache.put(key, gas_limit)
+        return self._apply_margin(gas_limit)
+
+    def _get_call_shape(self, transaction: Transaction) -> Optional[str]:
+        parts = transaction.data.decode(errors="replace").split("@")
+        function, args = parts[0], parts[1:]
+        if not function or transaction.receiver.to_hex() == ADDRESS_ZERO_HEX:
+            return None
+        if function in NOT_CACHEABLE_FUNCTIONS:
+            # The code hash is about to change.
+            self._code_hashes.pop(transaction.receiver.to_bech32(), None)
+            return None
+
+        try:
+            receiver, inner_function = get_effective_receiver_and_function(transaction, function, args)
+            arg_sizes = [len(bytes.fromhex(arg)) for arg in args]
+        except (ValueError, IndexError):
+            return None
+
+        code_hash = self._get_code_hash(receiver)
+        if not code_hash:
+            return None
+
+        shape: list[Any] = [
+            self.proxy.url,
+            code_hash,
+            function,
+            inner_function,
+            arg_sizes,
+            transaction.value > 0,
+            transaction.guardian is not None,
+            transaction.relayer is not None,
+        ]
+        return json.dumps(shape, separators=(",", ":"))
+
+    def _get_code_hash(self, address: Address) -> str:
+        """Empty for user accounts (including inexistent ones)."""
+        if not address.is_smart_contract():
+            return ""
+
+        bech32 = address.to_bech32()
+        if bech32 not in self._code_hashes:
+            try:
+                self._code_hashes[bech32] = self.proxy.get_account(address).contract_code_hash.hex()
+            except Exception as error:
+                logger.debug(f"Could not fetch the code hash of {bech32}: {error}")
+                return ""
+
+        return self._code_hashes[bech32]
+
+
+def get_effective_receiver_and_function(
+    transaction: Transaction, function: str, args: list[str]
+) -> tuple[Address, str]:
+    """For token transfers, the actual receiver and the function called on it (if any) are found within the arguments."""
+    if function == ESDT_TRANSFER:
+        return transaction.receiver, _decode_function(args, 2)
+    if function == ESDT_NFT_TRANSFER:
+        return Address(bytes.fromhex(args[3]), transaction.receiver.hrp), _decode_function(args, 4)
+    if function == MULTI_ESDT_NFT_TRANSFER:
+        destination = Address(bytes.fromhex(args[0]), transaction.receiver.hrp)
+        num_transfers = int(args[1], 16)
+        return destination, _decode_function(args, 2 + 3 * num_transfers)
+    return transaction.receiver, ""
+
+
+def _decode_function(args: list[str], index: int) -> str:
+    return bytes.fromhex(args[index]).decode() if len(args) > index else ""
@@ -0,0 +1,96 @@
+import logging
+import time
+from typing import Any, Optional, Sequence
+
+from multiversx_sdk import Transaction
+
+from multiversx_sdk_cli import config, utils
+from multiversx_sdk_cli.constants import SDK_PATH
+
+logger = logging.getLogger("guardian_data_cache")
+
+GUARDIAN_DATA_CACHE_FILE = SDK_PATH / "guardian_data_cache.json"
+# Built-in functions that change the guardian data of the sender.
+GUARDIAN_CHANGING_FUNCTIONS = [b"SetGuardian", b"GuardAccount", b"UnGuardAccount"]
+
+
+def get_guardian_data(proxy_url: str, address: str) -> Optional[dict[str, Any]]:
+    """
+    Returns the cached guardian data of an account, if not expired. The cache is opt-in (config: `guardian_data_cache_ttl`),
+    since a guardian changed elsewhere (e.g. from a wallet) is only noticed once the entry expires.
+    """
+    ttl = config.get_guardian_data_cache_ttl_from_config()
+    if ttl <= 0:
+        return None
+
+    entry = _read_cache().get(_get_key(proxy_url, address))
+    if not entry or time.time() - entry["timestamp"] >= ttl:
+        return None
+
+    logger.debug(f"Using cached guardian data of {address}.")
+    guardian_data: dict[str, Any] = entry["guardianData"]
+    return guardian_data
+
+
+def put_guardian_data(proxy_url: str, address: str, guardian_data: dict[str, Any]):
+    """
+    Caches the guardian data of an account. A pending guardian becomes active at a given epoch,
+    thus such data (about to change) is never cached.
+    """
+    if config.get_guardian_data_cache_ttl_from_config() <= 0:
+        return
+
+    cache = _read_cache()
+    key = _get_key(proxy_url, address)
+
+    if guardian_data.get("pendingGuardian"):
+        cache.pop(key, None)
+    else:
+        cache[key] = {"guardianData": guardian_data, "timestamp": time.time()}
+
+    _write_cache(cache)
+
+
+def forget_changed_guardian_data(transactions: Sequence[Transaction]):
+    """
+    Drops the cached guardian data of the senders of guard / unguard / set-guardian transactions (on any network),
+    so that the transactions following them are not built using outdated guardian data. To be called before sending.
+    """
+    senders = {tx.sender.to_bech32() for tx in transactions if tx.data.split(b"@")[0] in GUARDIAN_CHANGING_FUNCTIONS}
+    if not senders or not GUARDIAN_DATA_CACHE_FILE.is_file():
+        return
+
+    cache = _read_cache()
+    stale_keys = [key for key in cache if key.rsplit("/", 1)[-1] in senders]
+    if not stale_keys:
+        return
+
+    for key in stale_keys:
+        logger.debug(f"Dropping the cached guardian data: {key}.")
+        del cache[key]
+
+    _write_cache(cache)
+
+
+def _read_cache() -> dict[str, Any]:
+    if not GUARDIAN_DATA_CACHE_FILE.is_file():
+        return {}
+
+    try:
+        data: dict[str, Any] = utils.read_json_file(GUARDIAN_DATA_CACHE_FILE)
+        return data
+    except (OSError, ValueError) as error:
+        logger.debug(f"Ignoring unreadable guardian data cache: {error}")
+        return {}
+
+
+def _write_cache(cache: dict[str, Any]):
+    try:
+        utils.ensure_folder(GUARDIAN_DATA_CACHE_FILE.parent)
+        utils.write_json_file(GUARDIAN_DATA_CACHE_FILE, cache)
+    except OSError as error:
+        logger.debug(f"Could not save the guardian data cache: {error}")
+
+
+def _get_key(proxy_url: str, address: str) -> str:
+    return f"{proxy_url.rstrip('/')}/{address}"
@@ -0,0 +1,126 @@
+import json
+import re
+from typing import Any, Iterator, TextIO, Union
+
+from multiversx_sdk_cli import errors
+
+# A path is made of segments, applied one after the other, starting from the root (`$` or `data`, optional):
+#   .name  ['name']  ["name"]  -> a field of an object
+#   [0]  [-1]                  -> an item of an array
+#   .*  [*]                    -> all the items (or values), and the path continues on each of them
+# E.g. "$.contractAddress", "data['emittedTransactionHash']", "results[*].hash", "$.logs.events[0].topics".
+ROOT_PATTERN = re.compile(r"\s*(\$|data(?=$|[.\[]))")
+SEGMENT_PATTERN = re.compile(
+    r"""\.(?P<name>[A-Za-z_][\w\-]*)"""
+    r"""|\.(?P<dot_wildcard>\*)"""
+    r"""|\[\s*(?P<index>-?\d+)\s*\]"""
+    r"""|\[\s*(?P<quoted>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")\s*\]"""
+    r"""|\[\s*(?P<bracket_wildcard>\*)\s*\]"""
+)
+LEADING_NAME_PATTERN = re.compile(r"[A-Za-z_][\w\-]*")
+
+
+class Wildcard:
+    pass
+
+
+WILDCARD = Wildcard()
+
+
+class Missing:
+    def __str__(self) -> str:
+        return ""
+
+
+# What a path evaluates to, when (part of) it does not exist.
+MISSING = Missing()
+
+Segment = Union[str, int, Wildcard]
+
+
+class JsonPath:
+    """A path expression, compiled once (into segments), then evaluated against any number of documents."""
+
+    def __init__(self, expression: str, segments: list[Segment]) -> None:
+        self.expression = expression
+        self.segments = segments
+        self.has_wildcard = any(isinstance(segment, Wildcard) for segment in segments)
+
+    @classmethod
+    def compile(cls, expression: str) -> "JsonPath":
+        expression = expression.strip()
+        position = 0
+        segments: list[Segment] = []
+
+        root = ROOT_PATTERN.match(expression)
+        if root:
+            position = root.end()
+        else:
+            name = LEADING_NAME_PATTERN.match(expression)
+            if name:
+                segments.append(name.group())
+                position = name.end()
+
+        while position < len(expression):
+            match = SEGMENT_PATTERN.match(expression, position)
+            if not match:
+                raise errors.BadUsage(f"Invalid path expression: {expression} (unexpected: {expression[position:]})")
+
+            segments.append(_to_segment(match))
+            position = match.end()
+
+        return cls(expression, segments)
+
+    def evaluate(self, data: Any) -> Any:
+        """Returns the value at the path (or MISSING). With wildcards, returns the list of all the values found."""
+        values = list(self._walk(data, 0))
+        if self.has_wildcard:
+            return values
+        return values[0] if values else MISSING
+
+    def _walk(self, value: Any, index: int) -> Iterator[Any]:
+        if index == len(self.segments):
+            yield value
+            return
+
+        segment = self.segments[index]
+
+        if isinstance(segment, Wildcard):
+            children = value.values() if isinstance(value, dict) else value if isinstance(value, list) else []
+            for child in children:
+                yield from self._walk(child, index + 1)
+        elif isinstance(segment, int):
+            if isinstance(value, list) and -len(value) <= segment < len(value):
+                yield from self._walk(value[segment], index + 1)
+        elif isinstance(value, dict) and segment in value:
+            yield from self._walk(value[segment], index + 1)
+
+
+def _to_segment(match: re.Match[str]) -> Segment:
+    if match.group("name") is not None:
+        return match.group("name")
+    if match.group("index") is not None:
+        return int(match.group("index"))
+    if match.group("quoted") is not None:
+        quoted = match.group("quoted")
+        # Single-quoted strings are re-quoted, so that the escapes are handled by the JSON parser.
+        if quoted.startswith("'"):
+            quoted = json.dumps(quoted[1:-1].replace("\\'", "'"))
+        return str(json.loads(quoted))
+    return WILDCARD
+
+
+def evaluate_many(paths: list[JsonPath], data: Any) -> list[Any]:
+    return [path.evaluate(data) for path in paths]
+
+
+def iter_json_lines(f: TextIO) -> Iterator[Any]:
+    """Yields the documents of a JSON Lines file, one at a time (blank lines are skipped)."""
+    for line_number, line in enumerate(f, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            yield json.loads(line)
+        except ValueError as error:
+            raise errors.BadUserInput(f"Invalid JSON on line {line_number}: {error}")
@@ -0,0 +1,92 @@
+import logging
+import statistics
+import time
+from typing import Any
+
+from multiversx_sdk import Address, LedgerApp, Transaction, TransactionComputer
+
+from multiversx_sdk_cli.errors import BadUsage, LedgerError
+
+logger = logging.getLogger("ledger_session")
+
+
+class LedgerSession:
+    """
+    Keeps a single connection (transport) to the Ledger device open for a batch of operations,
+    instead of reconnecting for each address or signature.
+    """
+
+    def __init__(self) -> None:
+        try:
+            self._app = LedgerApp()
+        except Exception as error:
+            raise LedgerError(str(error))
+
+        self._current_address_index: int = -1
+        self.latencies: list[float] = []
+
+    def __enter__(self) -> "LedgerSession":
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
+
+    def close(self):
+        self._app.close()
+
+    def get_version(self) -> str:
+        return self._app.get_version()
+
+    def get_addresses(self, start_index: int, num_addresses: int) -> list[Address]:
+        return [self.get_address(index) for index in range(start_index, start_index + num_addresses)]
+
+    def get_address(self, address_index: int) -> Address:
+        return Address.new_from_bech32(self._app.get_address(address_index))
+
+    def sign_transactions(self, transactions: list[Transaction], address_index: int) -> None:
+        """
+        Signs the transactions one after the other (each one must be confirmed on the device), in place.
+        The Ledger app signs the hash of the transaction, thus the corresponding options are applied, if missing.
+        """
+        address = self.get_address(address_index)
+        self._set_address(address_index)
+        transaction_computer = TransactionComputer()
+
+        for index, transaction in enumerate(transactions):
+            if transaction.sender != address:
+                raise BadUsage(
+                    f"transaction {index}: sender {transaction.sender.to_bech32()} is not {address.to_bech32()}"
+                )
+
+            if not transaction_computer.has_options_set_for_hash_signing(transaction):
+                if transaction.guardian_signature or transaction.relayer_signature:
+                    raise BadUsage(f"transaction {index}: cannot set the options for hash signing, co-signatures exist")
+                transaction_computer.apply_options_for_hash_signing(transaction)
+
+            serialized_transaction = transaction_computer.compute_bytes_for_signing(transaction, ignore_options=True)
+
+            logger.info(f"Confirm transaction {index + 1} of {len(transactions)} on the device.")
+            start = time.perf_counter()
+            signature = self._app.sign_transaction(serialized_transaction)
+            latency = time.perf_counter() - start
+
+            self.latencies.append(latency)
+            logger.info(f"Transaction {index + 1} signed in {latency:.2f}s.")
+            transaction.signature = bytes.fromhex(signature)
+
+    def get_latency_report(self) -> dict[str, Any]:
+        if not self.latencies:
+            return {"numSignatures": 0}
+
+        return {
+            "numSignatures": len(self.latencies),
+            "totalSeconds": round(sum(self.latencies), 3),
+            "meanSeconds": round(statistics.mean(self.latencies), 3),
+            "medianSeconds": round(statistics.median(self.latencies), 3),
+            "maxSeconds": round(max(self.latencies), 3),
+        }
+
+    def _set_address(self, address_index: int):
+        if self._current_address_index != address_index:
+            self._app.set_address(address_index)
+            self._current_address_index = address_index
@@ -14,13 +14,14 @@ from multiversx_sdk_cli.localnet import (
     nodes_setup_json,
     p2p_toml,
     wallets,
+    workspace_templates,
 )
 from multiversx_sdk_cli.localnet.config_root import ConfigRoot
 
 logger = logging.getLogger("localnet")
 
 
-def configure(configfile: Path):
+def configure(configfile: Path, use_cache: bool = True):
     logger.info("configure()")
 
     config = ConfigRoot.from_file(configfile)
@@ -32,6 +33,19 @@ def configure(configfile: Path):
 
     logger.info("Localnet folder is %s", config.root())
 
+    if not use_cache:
+        configure_workspace(config)
+        return
+
+    fingerprint = workspace_templates.compute_fingerprint(config)
+    if workspace_templates.instantiate(config, fingerprint):
+        return
+
+    configure_workspace(config)
+    workspace_templates.store(config, fingerprint)
+
+
+def configure_workspace(config: ConfigRoot):
     create_folders(config)
 
     # Validators and Observers
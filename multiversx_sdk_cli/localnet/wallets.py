@@ -12,7 +12,7 @@ MAX_NUM_NODES = 12
 
 
 def copy_all_to(destination: str):
-    shutil.copytree(_get_folder(), destination)
+    shutil.copytree(get_folder(), destination)
 
 
 def copy_validator_key_to(validator_index: int, destination: str):
@@ -68,11 +68,11 @@ def _guard_validator_index(validator_index: int):
 
 
 def _get_validators_folder():
-    return _get_folder().joinpath("validators")
+    return get_folder().joinpath("validators")
 
 
 def _get_observers_folder():
-    return _get_folder().joinpath("observers")
+    return get_folder().joinpath("observers")
 
 
 def get_users() -> Dict[str, Account]:
@@ -87,8 +87,8 @@ def get_users() -> Dict[str, Account]:
 
 
 def _get_users_folder():
-    return _get_folder().joinpath("users")
+    return get_folder().joinpath("users")
 
 
-def _get_folder():
+def get_folder():
     return get_tools_folder() / "testwallets" / "latest"
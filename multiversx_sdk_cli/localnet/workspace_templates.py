@@ -0,0 +1,159 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Any, List, Optional
+
+from multiversx_sdk_cli import utils, workstation
+from multiversx_sdk_cli.constants import SDK_PATH
+from multiversx_sdk_cli.localnet import wallets
+from multiversx_sdk_cli.localnet.config_root import ConfigRoot
+from multiversx_sdk_cli.version import get_version
+
+logger = logging.getLogger("localnet")
+
+TEMPLATES_FOLDER = SDK_PATH / "localnet_templates"
+MAX_NUM_TEMPLATES = 3
+HASHING_CHUNK_SIZE = 1024 * 1024
+
+
+def compute_fingerprint(config: ConfigRoot) -> str:
+    """
+    Fingerprints everything that shapes a configured localnet workspace: the localnet configuration (TOML),
+    the version of mxpy (which holds the patching logic), the node, seednode and proxy software
+    (binaries, libraries and configuration prototypes) and the test wallets.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(get_version().encode())
+    hasher.update(json.dumps(config.to_dictionary(), sort_keys=True, default=str).encode())
+
+    cmd_node = config.software.mx_chain_go.get_cmd_node_folder()
+    cmd_seednode = config.software.mx_chain_go.get_cmd_seednode_folder()
+    cmd_proxy = config.software.mx_chain_proxy_go.get_cmd_proxy_folder()
+
+    files: List[Path] = [cmd_node / "node", cmd_seednode / "seednode", cmd_proxy / "proxy"]
+    files += _list_libraries(cmd_node) + _list_libraries(cmd_seednode)
+    files += _list_files_recursively(config.software.mx_chain_go.get_node_config_folder())
+    files += _list_files_recursively(config.software.mx_chain_go.get_seednode_config_folder())
+    files += _list_files_recursively(config.software.mx_chain_proxy_go.get_proxy_config_folder())
+    files += _list_files_recursively(wallets.get_folder())
+
+    for file in files:
+        _update_with_file(hasher, file)
+
+    return hasher.hexdigest()
+
+
+def instantiate(config: ConfigRoot, fingerprint: str) -> bool:
+    """
+    Creates the localnet workspace from a cached template, if one exists for the given fingerprint.
+    Returns True on a cache hit, False otherwise.
+    """
+    template = _get_template_folder(fingerprint)
+    if not template.is_dir():
+        logger.info(f"No cached workspace template for fingerprint {fingerprint}.")
+        return False
+
+    logger.info(f"Instantiating localnet workspace from cached template: {template}")
+
+    copy_tree(template, config.root())
+    patch_start_time(config)
+
+    # Mark the template as recently used, so that it survives pruning.
+    os.utime(template)
+    return True
+
+
+def store(config: ConfigRoot, fingerprint: str):
+    """
+    Saves the (freshly configured) localnet workspace as a template. Concurrent jobs storing the same template are
+    tolerated: each one prepares a private copy, and only the first rename wins.
+    """
+    template = _get_template_folder(fingerprint)
+    if template.exists():
+        return
+
+    utils.ensure_folder(TEMPLATES_FOLDER)
+    staging = TEMPLATES_FOLDER / f"{fingerprint}.{os.getpid()}.tmp"
+    utils.remove_folder(staging)
+
+    try:
+        copy_tree(config.root(), staging)
+        os.rename(staging, template)
+        logger.info(f"Saved localnet workspace template: {template}")
+    except OSError as error:
+        logger.warning(f"Could not save localnet workspace template: {error}")
+    finally:
+        utils.remove_folder(staging)
+
+    _prune_templates()
+
+
+def patch_start_time(config: ConfigRoot):
+    """The genesis time is the only part of a workspace that must not be reused from a template."""
+    start_time = config.genesis_time()
+
+    for config_folder in config.all_nodes_config_folders():
+        nodes_setup_file = config_folder / "nodesSetup.json"
+        data = utils.read_json_file(nodes_setup_file)
+        data["startTime"] = start_time
+        utils.write_json_file(nodes_setup_file, data)
+
+
+def copy_tree(source: Path, destination: Path):
+    """Copies a folder, cloning the files (reflink / copy-on-write) where the filesystem allows it."""
+    command = _get_clone_command(source, destination)
+
+    if command:
+        try:
+            subprocess.run(command, check=True, capture_output=True)
+            return
+        except (OSError, subprocess.CalledProcessError) as error:
+            logger.debug(f"Could not clone {source} into {destination}, falling back to a regular copy: {error}")
+            utils.remove_folder(destination)
+
+    shutil.copytree(source, destination, symlinks=True)
+
+
+def _get_clone_command(source: Path, destination: Path) -> Optional[List[str]]:
+    if workstation.is_linux():
+        return ["cp", "-a", "--reflink=auto", str(source), str(destination)]
+    if workstation.is_osx():
+        return ["cp", "-c", "-R", str(source), str(destination)]
+    return None
+
+
+def _prune_templates():
+    templates = [folder for folder in TEMPLATES_FOLDER.iterdir() if folder.is_dir() and folder.suffix != ".tmp"]
+    templates.sort(key=lambda folder: folder.stat().st_mtime, reverse=True)
+
+    for template in templates[MAX_NUM_TEMPLATES:]:
+        logger.info(f"Removing stale localnet workspace template: {template}")
+        utils.remove_folder(template)
+
+
+def _get_template_folder(fingerprint: str) -> Path:
+    return TEMPLATES_FOLDER / fingerprint
+
+
+def _list_libraries(folder: Path) -> List[Path]:
+    return sorted(list(folder.glob("*.dylib")) + list(folder.glob("*.so")))
+
+
+def _list_files_recursively(folder: Path) -> List[Path]:
+    return sorted(path for path in folder.rglob("*") if path.is_file())
+
+
+def _update_with_file(hasher: Any, file: Path):
+    hasher.update(file.name.encode())
+
+    if not file.exists():
+        hasher.update(b"missing")
+        return
+
+    with open(file, "rb") as f:
+        while chunk := f.read(HASHING_CHUNK_SIZE):
+            hasher.update(chunk)
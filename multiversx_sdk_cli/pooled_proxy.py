@@ -0,0 +1,98 @@
+import logging
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+import requests
+from multiversx_sdk import (
+    ApiNetworkProvider,
+    NetworkProviderConfig,
+    NetworkProviderError,
+    ProxyNetworkProvider,
+)
+from requests.adapters import HTTPAdapter
+from urllib3 import Retry
+
+logger = logging.getLogger("pooled_proxy")
+
+DEFAULT_POOL_SIZE = 16
+STREAMING_CHUNK_SIZE = 64 * 1024
+
+TPooled = TypeVar("TPooled", bound="_PooledConnections")
+
+
+class _PooledConnections:
+    """
+    Keeps the HTTP connections of a network provider alive and shares them across requests (and threads).
+    Meant for bulk operations, where opening a new connection for each request would dominate the running time.
+    """
+
+    config: NetworkProviderConfig
+    _get_data: Callable[[Any, str], Any]
+    _extract_error_from_response: Callable[[Any], Any]
+
+    def __init__(self, url: str, config: Optional[NetworkProviderConfig] = None, pool_size: int = DEFAULT_POOL_SIZE):
+        super().__init__(url=url, config=config)  # type: ignore
+
+        retry_strategy = Retry(
+            total=self.config.requests_retry_options.retries,
+            backoff_factor=self.config.requests_retry_options.backoff_factor,
+            status_forcelist=self.config.requests_retry_options.status_forcelist,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry_strategy)
+
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def close(self):
+        self._session.close()
+
+    def __enter__(self: TPooled) -> TPooled:
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
+
+    def _do_get(self, url: str) -> Any:
+        logger.debug(f"GET {url}")
+        return self._do_request(url, lambda: self._session.get(url, **self.config.requests_options))
+
+    def _do_post(self, url: str, payload: Any) -> Any:
+        logger.debug(f"POST {url}")
+        return self._do_request(url, lambda: self._session.post(url, json=payload, **self.config.requests_options))
+
+    def _do_request(self, url: str, send: Callable[[], requests.Response]) -> Any:
+        try:
+            response = send()
+            response.raise_for_status()
+            parsed = response.json()
+            return self._get_data(parsed, url)
+        except requests.HTTPError as err:
+            error_data = self._extract_error_from_response(err.response)
+            raise NetworkProviderError(url, error_data)
+        except NetworkProviderError:
+            raise
+        except Exception as err:
+            raise NetworkProviderError(url, err)
+
+
+class PooledProxyNetworkProvider(_PooledConnections, ProxyNetworkProvider):
+    """A proxy network provider with pooled connections."""
+
+    def do_get_streamed(self, url: str) -> Iterator[bytes]:
+        """Like `do_get_generic`, but yields the raw body (not unwrapped), in chunks, as it arrives."""
+        url = f"{self.url}/{url}"
+        logger.debug(f"GET (streamed) {url}")
+
+        try:
+            with self._session.get(url, stream=True, **self.config.requests_options) as response:
+                response.raise_for_status()
+                yield from response.iter_content(STREAMING_CHUNK_SIZE)
+        except requests.HTTPError as err:
+            error_data = self._extract_error_from_response(err.response)
+            raise NetworkProviderError(url, error_data)
+        except Exception as err:
+            raise NetworkProviderError(url, err)
+
+
+class PooledApiNetworkProvider(_PooledConnections, ApiNetworkProvider):
+    """An API network provider with pooled connections (e.g. for paging through listings)."""
@@ -0,0 +1,63 @@
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, TypeVar
+
+logger = logging.getLogger("prefetch")
+
+T = TypeVar("T")
+
+
+class Prefetcher:
+    """
+    Runs independent network reads in the background, as early as possible, and memoizes their results.
+    A read requested while already in flight is awaited (not issued again). Failed reads are not memoized.
+    Each read runs on a daemon thread, so that a slow (or unreachable) network does not keep the process alive
+    once the command is done (only a few reads are prefetched per command).
+    """
+
+    def __init__(self) -> None:
+        self._futures: dict[Hashable, Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key: Hashable, func: Callable[..., T], *args: Any) -> "Future[T]":
+        with self._lock:
+            future = self._futures.get(key)
+
+            if future is None:
+                logger.debug(f"Prefetching: {key}")
+                future = Future()
+                self._futures[key] = future
+                threading.Thread(target=_run, args=(future, func, args), name="prefetch", daemon=True).start()
+
+            return future
+
+    def get(self, key: Hashable, func: Callable[..., T], *args: Any) -> T:
+        future = self.submit(key, func, *args)
+
+        try:
+            return future.result()
+        except Exception:
+            with self._lock:
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+            raise
+
+    def clear(self):
+        with self._lock:
+            self._futures.clear()
+
+
+def _run(future: "Future[Any]", func: Callable[..., Any], args: tuple[Any, ...]):
+    if not future.set_running_or_notify_cancel():
+        return
+
+    try:
+        result = func(*args)
+    except BaseException as error:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+prefetcher = Prefetcher()
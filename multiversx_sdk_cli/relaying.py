@@ -0,0 +1,191 @@
+import json
+import logging
+from pathlib import Path
+from typing import Any, Optional
+
+from multiversx_sdk import Address, Transaction, TransactionComputer, UserVerifier
+
+from multiversx_sdk_cli import guardian_data_cache
+from multiversx_sdk_cli.interfaces import IAccount
+from multiversx_sdk_cli.transactions import (
+    INetworkProvider,
+    send_transactions_in_chunks,
+)
+from multiversx_sdk_cli.transactions_batch import (
+    TransactionsBatchReader,
+    is_transactions_batch,
+)
+
+logger = logging.getLogger("relaying")
+
+STATUS_REJECTED = "rejected"
+STATUS_RELAYED = "relayed"
+STATUS_SENT = "sent"
+STATUS_NOT_ACCEPTED = "notAccepted"
+# The request holding the transaction failed (e.g. network error).
+STATUS_NOT_SENT = "notSent"
+
+
+class RelayItem:
+    def __init__(self, source: str, transaction: Optional[Transaction] = None, error: str = "") -> None:
+        self.source = source
+        self.transaction = transaction
+        self.status = STATUS_REJECTED if error else ""
+        self.error = error
+        self.hash = b""
+        self.data: Any = None
+
+    def reject(self, error: str):
+        self.status = STATUS_REJECTED
+        self.error = error
+
+    def is_rejected(self) -> bool:
+        return self.status in [STATUS_REJECTED, STATUS_NOT_ACCEPTED, STATUS_NOT_SENT]
+
+    def to_dictionary(self, with_transaction: bool = False) -> dict[str, Any]:
+        result: dict[str, Any] = {"source": self.source, "status": self.status}
+
+        if self.transaction:
+            result["sender"] = self.transaction.sender.to_bech32()
+            result["nonce"] = self.transaction.nonce
+        if self.hash:
+            result["hash"] = self.hash.hex()
+        if self.error:
+            result["error"] = self.error
+        if with_transaction and self.transaction:
+            result["tx"] = self.transaction.to_dictionary()
+
+        return result
+
+    def to_reject_dictionary(self) -> dict[str, Any]:
+        """As it was received (re-loadable as JSON Lines), along with the reason of the rejection."""
+        return {"source": self.source, "error": self.error, "tx": self.data}
+
+
+def load_relay_items(path: Path) -> list[RelayItem]:
+    """
+    Loads the inner transactions from a directory (one JSON file per transaction), a JSON Lines file or a batch.
+    Items that cannot be loaded are rejected, instead of failing the whole batch.
+    """
+    if path.is_dir():
+        return [_load_item(str(file), file.read_text()) for file in sorted(path.glob("*.json"))]
+
+    with open(path, "rb") as f:
+        if is_transactions_batch(f):
+            return [_create_item(f"{path}#{i}", tx) for i, tx in enumerate(TransactionsBatchReader(f))]
+
+    with open(path) as f:
+        return [_load_item(f"{path}:{line_number}", line) for line_number, line in enumerate(f, 1) if line.strip()]
+
+
+def _load_item(source: str, content: str) -> RelayItem:
+    data: Any = None
+
+    try:
+        data = json.loads(content)
+        transaction = Transaction.new_from_dictionary(data.get("tx") or data.get("emittedTransaction") or data)
+    except Exception as error:
+        item = RelayItem(source, error=f"invalid transaction: {error}")
+        item.data = data
+        return item
+
+    return _create_item(source, transaction)
+
+
+def _create_item(source: str, transaction: Transaction) -> RelayItem:
+    item = RelayItem(source, transaction)
+    item.data = transaction.to_dictionary()
+    return item
+
+
+class BatchRelayer:
+    """Validates the inner transactions of the users, then signs them as their relayer."""
+
+    def __init__(self, relayer: IAccount) -> None:
+        self.relayer = relayer
+        self.transaction_computer = TransactionComputer()
+        self._seen: set[tuple[str, int]] = set()
+
+    def relay(self, items: list[RelayItem]):
+        for item in items:
+            if item.is_rejected():
+                continue
+
+            error = self.validate(item.transaction)  # type: ignore
+            if error:
+                item.reject(error)
+                continue
+
+            transaction: Transaction = item.transaction  # type: ignore
+            transaction.relayer_signature = self.relayer.sign_transaction(transaction)
+            item.hash = self.transaction_computer.compute_transaction_hash(transaction)
+            item.status = STATUS_RELAYED
+
+    def validate(self, transaction: Transaction) -> str:
+        """Returns the reason of the rejection, or an empty string."""
+        if transaction.relayer != self.relayer.address:
+            relayer = transaction.relayer.to_bech32() if transaction.relayer else "none"
+            return f"the relayer of the transaction is {relayer}, not {self.relayer.address.to_bech32()}"
+
+        key = (transaction.sender.to_bech32(), transaction.nonce)
+        if key in self._seen:
+            return "duplicated nonce of the sender"
+
+        if not self._verify(transaction.sender, transaction.signature, transaction):
+            return "missing or invalid signature of the sender"
+
+        if transaction.guardian:
+            if not self.transaction_computer.has_options_set_for_guarded_transaction(transaction):
+                return "the transaction has a guardian, but not the options of a guarded transaction"
+            if not self._verify(transaction.guardian, transaction.guardian_signature, transaction):
+                return "missing or invalid signature of the guardian"
+
+        self._seen.add(key)
+        return ""
+
+    def _verify(self, signer: Address, signature: bytes, transaction: Transaction) -> bool:
+        if not signature:
+            return False
+
+        data = self.transaction_computer.compute_bytes_for_verifying(transaction)
+        return UserVerifier.from_address(signer).verify(data, signature)
+
+
+def broadcast_relayed(items: list[RelayItem], proxy: INetworkProvider):
+    """Broadcasts the relayed transactions, in chunks. If the request of a chunk fails, its items are marked as not sent."""
+    relayed = [item for item in items if item.status == STATUS_RELAYED]
+    transactions: list[Transaction] = [item.transaction for item in relayed]  # type: ignore
+    guardian_data_cache.forget_changed_guardian_data(transactions)
+
+    for start, hashes, error in send_transactions_in_chunks(transactions, proxy):
+        for item, hash in zip(relayed[start : start + len(hashes)], hashes):
+            if error:
+                item.status = STATUS_NOT_SENT
+                item.error = f"could not be sent: {error}"
+            elif hash:
+                item.status = STATUS_SENT
+            else:
+                item.status = STATUS_NOT_ACCEPTED
+                item.error = "not accepted by the network"
+
+
+def build_report(items: list[RelayItem], with_transactions: bool = False) -> dict[str, Any]:
+    statuses = [item.status for item in items]
+
+    return {
+        "numTransactions": len(items),
+        "numRelayed": len(items) - statuses.count(STATUS_REJECTED),
+        "numSent": statuses.count(STATUS_SENT),
+        "numRejected": len([item for item in items if item.is_rejected()]),
+        "items": [item.to_dictionary(with_transaction=with_transactions) for item in items],
+    }
+
+
+def save_rejects(items: list[RelayItem], path: Path) -> int:
+    rejected = [item for item in items if item.is_rejected()]
+
+    with open(path, "w") as f:
+        for item in rejected:
+            f.write(json.dumps(item.to_reject_dictionary()) + "\n")
+
+    return len(rejected)
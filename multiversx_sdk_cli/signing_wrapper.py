@@ -2,7 +2,10 @@ from typing import Optional, Union
 
 from multiversx_sdk import Transaction, TransactionComputer
 
-from multiversx_sdk_cli.cosign_transaction import cosign_transaction
+from multiversx_sdk_cli.cosign_transaction import (
+    cosign_transaction,
+    cosign_transactions,
+)
 from multiversx_sdk_cli.errors import TransactionSigningError
 from multiversx_sdk_cli.guardian_relayer_data import GuardianRelayerData
 from multiversx_sdk_cli.interfaces import IAccount
@@ -38,6 +41,29 @@ class SigningWrapper:
         )
         self._sign_relayed_transaction_if_relayer(transaction, relayer)
 
+    def sign_transactions(
+        self,
+        transactions: list[Transaction],
+        sender: Optional[IAccount] = None,
+        guardian_and_relayer: GuardianRelayerData = GuardianRelayerData(),
+    ):
+        """Signs a batch of transactions, same as `sign_transaction`. However, the guarded transactions are co-signed by the trusted cosigner service all at once, using a single 2FA code."""
+        guardian = guardian_and_relayer.guardian
+        guardian_service_url = guardian_and_relayer.guardian_service_url
+        guardian_2fa_code = guardian_and_relayer.guardian_2fa_code
+
+        for transaction in transactions:
+            self.sign_transaction(
+                transaction=transaction,
+                sender=sender,
+                guardian_and_relayer=GuardianRelayerData(guardian=guardian, relayer=guardian_and_relayer.relayer),
+            )
+
+        if not guardian and guardian_service_url and guardian_2fa_code:
+            guarded_transactions = [transaction for transaction in transactions if transaction.guardian]
+            if guarded_transactions:
+                cosign_transactions(guarded_transactions, guardian_service_url, guardian_2fa_code)
+
     def _set_options_for_guarded_transaction_if_needed(self, transaction: Transaction):
         if transaction.guardian:
             transaction_computer = TransactionComputer()
@@ -1,10 +1,20 @@
+import itertools
+import logging
 from collections import OrderedDict
-from typing import Any, Protocol
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Iterator, Optional, Protocol
 
-from multiversx_sdk import Transaction, TransactionOnNetwork
+from multiversx_sdk import Transaction, TransactionComputer, TransactionOnNetwork
+from multiversx_sdk.core.interfaces import INetworkConfig
 
 from multiversx_sdk_cli.utils import ISerializable
 
+logger = logging.getLogger("simulation")
+
+DEFAULT_NUM_SIMULATION_WORKERS = 8
+# Hex encoding of the "ok" return code (at the beginning of the data field of smart contract results).
+RETURN_CODE_OK = "6f6b"
+
 
 # fmt: off
 class INetworkProvider(Protocol):
@@ -32,3 +42,152 @@ class Simulator:
         simulation_response = self.proxy.simulate_transaction(transaction)
 
         return Simulation(simulation_response)
+
+
+class BatchSimulationResult(ISerializable):
+    """The outcome of simulating one transaction of a batch: status, return message, gas used and fee."""
+
+    def __init__(
+        self,
+        index: int,
+        transaction: Transaction,
+        simulation: Optional[Simulation],
+        return_message: str,
+        gas_used: int,
+        fee: int,
+    ) -> None:
+        self.index = index
+        self.transaction = transaction
+        self.simulation = simulation
+        self.return_message = return_message
+        self.gas_used = gas_used
+        self.fee = fee
+
+    def is_success(self) -> bool:
+        return not self.return_message
+
+    def to_dictionary(self) -> dict[str, Any]:
+        dictionary: dict[str, Any] = OrderedDict()
+        dictionary["index"] = self.index
+        dictionary["sender"] = self.transaction.sender.to_bech32()
+        dictionary["nonce"] = self.transaction.nonce
+        dictionary["status"] = "success" if self.is_success() else "fail"
+        dictionary["returnMessage"] = self.return_message
+        dictionary["gasUsed"] = self.gas_used
+        dictionary["fee"] = str(self.fee)
+        dictionary["execution"] = self.simulation.simulation_response.raw if self.simulation else None
+
+        return dictionary
+
+
+class BatchSimulationReport(ISerializable):
+    """Aggregates the results of a batch simulation."""
+
+    def __init__(self) -> None:
+        self.num_transactions = 0
+        self.num_failures = 0
+        self.gas_used = 0
+        self.fees = 0
+        self.failures: dict[str, list[int]] = {}
+
+    def add(self, result: BatchSimulationResult):
+        self.num_transactions += 1
+        self.gas_used += result.gas_used
+        self.fees += result.fee
+
+        if not result.is_success():
+            self.num_failures += 1
+            self.failures.setdefault(result.return_message, []).append(result.index)
+
+    def to_dictionary(self) -> dict[str, Any]:
+        dictionary: dict[str, Any] = OrderedDict()
+        dictionary["numTransactions"] = self.num_transactions
+        dictionary["numFailures"] = self.num_failures
+        dictionary["gasUsed"] = self.gas_used
+        dictionary["fees"] = str(self.fees)
+        dictionary["failures"] = [
+            {"returnMessage": message, "count": len(indices), "indices": indices}
+            for message, indices in sorted(self.failures.items(), key=lambda item: -len(item[1]))
+        ]
+
+        return dictionary
+
+
+class BatchSimulator:
+    """
+    Simulates many transactions concurrently, on a bounded pool of workers. Results are yielded in the order of the input
+    (as soon as they are available), so that they can be streamed. A transaction rejected by the network
+    (e.g. bad nonce) is reported as a failed simulation, not raised.
+    """
+
+    def __init__(
+        self,
+        proxy: INetworkProvider,
+        network_config: INetworkConfig,
+        num_workers: int = DEFAULT_NUM_SIMULATION_WORKERS,
+    ) -> None:
+        self.simulator = Simulator(proxy)
+        self.network_config = network_config
+        self.num_workers = num_workers
+        self.transaction_computer = TransactionComputer()
+
+    def run(self, transactions: Iterable[Transaction]) -> Iterator[BatchSimulationResult]:
+        with ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix="simulate") as executor:
+            yield from executor.map(self._simulate, itertools.count(), transactions)
+
+    def _simulate(self, index: int, transaction: Transaction) -> BatchSimulationResult:
+        try:
+            simulation = self.simulator.run(transaction)
+        except Exception as error:
+            logger.debug(f"Simulation of transaction {index} failed: {error}")
+            return BatchSimulationResult(index, transaction, None, str(error), gas_used=0, fee=0)
+
+        response = simulation.simulation_response
+        refund = self._get_refund(response)
+        gas_used = transaction.gas_limit - self._convert_refund_to_gas(transaction, refund)
+
+        try:
+            fee = self.transaction_computer.compute_transaction_fee(transaction, self.network_config) - refund
+        except Exception as error:
+            logger.debug(f"Cannot compute the fee of transaction {index}: {error}")
+            fee = 0
+
+        return BatchSimulationResult(index, transaction, simulation, _get_return_message(response), gas_used, fee)
+
+    def _get_refund(self, response: TransactionOnNetwork) -> int:
+        """The unused gas is refunded to the sender, by means of a smart contract result (with return code "ok")."""
+        refund = 0
+
+        for result in response.smart_contract_results:
+            is_ok = result.data.decode(errors="replace").startswith(f"@{RETURN_CODE_OK}")
+            if is_ok and result.receiver == response.sender:
+                refund += int(result.raw.get("value", 0) or 0)
+
+        return refund
+
+    def _convert_refund_to_gas(self, transaction: Transaction, refund: int) -> int:
+        price = transaction.gas_price * self.network_config.gas_price_modifier
+        return int(refund / price) if price else 0
+
+
+def _get_return_message(response: TransactionOnNetwork) -> str:
+    """Empty if the execution succeeded."""
+    raw = response.raw
+    status = raw.get("status", "")
+
+    if status and status != "success":
+        return str(raw.get("failReason") or status)
+
+    for result in response.smart_contract_results:
+        parts = result.data.decode(errors="replace").split("@")
+        if len(parts) > 1 and parts[0] == "" and parts[1] != RETURN_CODE_OK:
+            return str(result.raw.get("returnMessage") or _decode_return_code(parts[1]))
+
+    return ""
+
+
+def _decode_return_code(return_code: str) -> str:
+    try:
+        return bytes.fromhex(return_code).decode(errors="replace")
+    except ValueError:
+        return return_code
@@ -0,0 +1,108 @@
+import itertools
+import re
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from multiversx_sdk import Address, ProxyNetworkProvider
+from multiversx_sdk.abi import Abi, AbiDefinition
+
+from multiversx_sdk_cli import errors, utils
+
+# Placeholders of key templates, e.g. "balance{address}" or "items.item{index}".
+KEY_PLACEHOLDER_PATTERN = re.compile(r"\{(address|index|0x[0-9a-fA-F]*)\}")
+PLACEHOLDER_ADDRESS = "address"
+PLACEHOLDER_INDEX = "index"
+# Indices (e.g. of a `VecMapper`) are encoded as big-endian u32.
+INDEX_LENGTH = 4
+# Storage values are top-level encoded, as endpoint outputs are: they are decoded as the output of a synthetic endpoint.
+STORAGE_VALUE_ENDPOINT = "__storageValue__"
+
+
+class StorageKey:
+    def __init__(self, name: str, key: bytes) -> None:
+        self.name = name
+        self.key = key
+
+
+def expand_key_template(template: str, addresses: list[Address], indices: range) -> Iterator[StorageKey]:
+    """
+    Expands the placeholders of a key: {address} is replaced by each of the addresses (as public keys),
+    {index} by each of the indices (as u32, big-endian), {0x...} by the given bytes. The text around them is kept as it is.
+    """
+    parts = KEY_PLACEHOLDER_PATTERN.split(template)
+    texts, placeholders = parts[0::2], parts[1::2]
+
+    has_address = PLACEHOLDER_ADDRESS in placeholders
+    has_index = PLACEHOLDER_INDEX in placeholders
+    if has_address and not addresses:
+        raise errors.BadUsage(f"The key {template} needs addresses (see --addresses-file)")
+    if has_index and not indices:
+        raise errors.BadUsage(f"The key {template} needs indices (see --range)")
+
+    for address, index in itertools.product(addresses if has_address else [None], indices if has_index else [None]):
+        name = texts[0]
+        key = texts[0].encode()
+
+        for placeholder, text in zip(placeholders, texts[1:]):
+            if placeholder == PLACEHOLDER_ADDRESS:
+                name += f"{{{address.to_bech32()}}}"  # type: ignore
+                key += address.get_public_key()  # type: ignore
+            elif placeholder == PLACEHOLDER_INDEX:
+                name += f"{{{index}}}"
+                key += index.to_bytes(INDEX_LENGTH, byteorder="big")  # type: ignore
+            else:
+                name += f"{{{placeholder}}}"
+                key += bytes.fromhex(placeholder[2:])
+
+            name += text
+            key += text.encode()
+
+        yield StorageKey(name, key)
+
+
+def parse_range(value: str) -> range:
+    """Parses "start:end" (both inclusive)."""
+    try:
+        start, end = value.split(":")
+        return range(int(start), int(end) + 1)
+    except ValueError:
+        raise errors.BadUsage(f"Invalid range: {value} (expected: start:end)")
+
+
+def read_addresses(path: Path) -> list[Address]:
+    addresses: list[Address] = []
+
+    with open(path.expanduser()) as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            try:
+                addresses.append(Address.new_from_bech32(line.split()[0]))
+            except Exception:
+                raise errors.BadUserInput(f"invalid address on line {line_number}: {line}")
+
+    return addresses
+
+
+class StorageValueDecoder:
+    """Decodes the values of a storage mapper (top-level encoded), given their type, as declared in an ABI."""
+
+    def __init__(self, type_expression: str, abi_path: Optional[Path] = None) -> None:
+        abi_definition: dict[str, Any] = utils.read_json_file(abi_path) if abi_path else {}
+        endpoint = {"name": STORAGE_VALUE_ENDPOINT, "inputs": [], "outputs": [{"type": type_expression}]}
+        abi_definition["endpoints"] = abi_definition.get("endpoints", []) + [endpoint]
+
+        try:
+            self.abi = Abi(AbiDefinition.from_dict(abi_definition))
+        except Exception as error:
+            raise errors.BadUsage(f"Cannot decode values of type {type_expression}: {error}")
+
+    def decode(self, data: bytes) -> Any:
+        return self.abi.decode_endpoint_output_parameters(STORAGE_VALUE_ENDPOINT, [data])[0]
+
+
+def fetch_storage_entry(proxy: ProxyNetworkProvider, address: Address, key: bytes) -> bytes:
+    response = proxy.do_get_generic(f"address/{address.to_bech32()}/key/{key.hex()}")
+    return bytes.fromhex(response.get("value", ""))
@@ -0,0 +1,130 @@
+import gzip
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from multiversx_sdk import Address
+
+from multiversx_sdk_cli import errors
+from multiversx_sdk_cli.pooled_proxy import PooledProxyNetworkProvider
+
+logger = logging.getLogger("storage_streaming")
+
+# The response of "address/{address}/keys" is a single JSON object, {"data": {"pairs": {key: value, ...}, ...}, ...},
+# with hex-encoded keys and values. It is scanned as it arrives, instead of being loaded (and parsed) as a whole.
+PAIRS_START_PATTERN = re.compile(rb'"pairs"\s*:\s*\{')
+PAIR_PATTERN = re.compile(rb'\s*"([0-9a-fA-F]*)"\s*:\s*"([0-9a-fA-F]*)"\s*([,}])')
+PAIRS_END_PATTERN = re.compile(rb"\s*\}")
+
+MIN_LENGTH_OF_KEY_PREFIX = 3
+
+STATUS_ADDED = "added"
+STATUS_MODIFIED = "modified"
+STATUS_REMOVED = "removed"
+
+
+def fetch_storage_pairs(proxy: PooledProxyNetworkProvider, address: Address) -> Iterator[tuple[str, str]]:
+    chunks = proxy.do_get_streamed(f"address/{address.to_bech32()}/keys")
+    return parse_storage_pairs(chunks)
+
+
+def parse_storage_pairs(chunks: Iterable[bytes]) -> Iterator[tuple[str, str]]:
+    """Yields the (hex) key-value pairs of a storage response, while the response is still being received."""
+    buffer = b""
+    position = 0
+    in_pairs = False
+    is_first_pair = True
+
+    for chunk in chunks:
+        buffer = buffer[position:] + chunk
+        position = 0
+
+        if not in_pairs:
+            match = PAIRS_START_PATTERN.search(buffer)
+            if not match:
+                continue
+
+            in_pairs = True
+            position = match.end()
+
+        if is_first_pair and PAIRS_END_PATTERN.match(buffer, position):
+            return
+
+        while match := PAIR_PATTERN.match(buffer, position):
+            is_first_pair = False
+            position = match.end()
+            yield match.group(1).decode(), match.group(2).decode()
+
+            if match.group(3) == b"}":
+                return
+
+    raise errors.BadUserInput("unexpected (or incomplete) storage response")
+
+
+def decode_key(key: str) -> dict[str, Any]:
+    """
+    Storage keys usually start with a readable prefix (the name of a storage mapper, e.g. "balances"),
+    followed by binary data (e.g. an address or an index). The prefix, if any, is split from the rest.
+    """
+    data = bytes.fromhex(key)
+    length = 0
+    while length < len(data) and 0x20 <= data[length] < 0x7F:
+        length += 1
+
+    if length < MIN_LENGTH_OF_KEY_PREFIX:
+        return {"prefix": "", "rest": key}
+
+    return {"prefix": data[:length].decode(), "rest": data[length:].hex()}
+
+
+def parse_key_prefix(prefix: str) -> bytes:
+    """The prefix can be given as text or as hex (with "0x")."""
+    if prefix.startswith("0x"):
+        return bytes.fromhex(prefix[2:])
+    return prefix.encode()
+
+
+def filter_by_prefix(pairs: Iterable[tuple[str, str]], prefix: Optional[bytes]) -> Iterator[tuple[str, str]]:
+    prefix_hex = prefix.hex() if prefix else ""
+    return (pair for pair in pairs if pair[0].startswith(prefix_hex))
+
+
+def save_snapshot(pairs: Iterable[tuple[str, str]], path: Path) -> Iterator[tuple[str, str]]:
+    """Saves the pairs (gzipped JSON Lines) while passing them through. The snapshot is kept only if complete."""
+    partial_path = path.with_name(path.name + ".partial")
+
+    with gzip.open(partial_path, "wt") as f:
+        for key, value in pairs:
+            f.write(json.dumps({"key": key, "value": value}) + "\n")
+            yield key, value
+
+    partial_path.replace(path)
+
+
+def load_snapshot(path: Path, prefix: Optional[bytes] = None) -> dict[str, str]:
+    """Loads the pairs of a snapshot; given a prefix, only the matching keys (as for the live pairs)."""
+    try:
+        with gzip.open(path, "rt") as f:
+            entries = ((entry["key"], entry["value"]) for entry in map(json.loads, f))
+            return dict(filter_by_prefix(entries, prefix))
+    except (OSError, ValueError, KeyError) as error:
+        raise errors.BadUserInput(f"cannot read the storage snapshot {path}: {error}")
+
+
+def diff_storage(pairs: Iterable[tuple[str, str]], previous: dict[str, str]) -> Iterator[dict[str, Any]]:
+    """
+    Yields the changes against a previous snapshot: the added and modified keys, then the removed ones.
+    The previous snapshot is consumed (to avoid holding a copy of it).
+    """
+    for key, value in pairs:
+        previous_value = previous.pop(key, None)
+
+        if previous_value is None:
+            yield {"key": key, "status": STATUS_ADDED, "value": value}
+        elif previous_value != value:
+            yield {"key": key, "status": STATUS_MODIFIED, "value": value, "previousValue": previous_value}
+
+    for key, previous_value in previous.items():
+        yield {"key": key, "status": STATUS_REMOVED, "previousValue": previous_value}
@@ -0,0 +1,117 @@
+import json
+import logging
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterable, Iterator, TextIO
+
+from multiversx_sdk import Transaction, TransactionComputer, UserSecretKey
+
+from multiversx_sdk_cli import errors
+
+logger = logging.getLogger("stream_signing")
+
+# Lines are handed over to the workers in chunks, to amortize the inter-process communication.
+CHUNK_SIZE = 1000
+# Bounds the memory: reading the input is paused while this many chunks (per worker) are not yet written.
+MAX_NUM_PENDING_CHUNKS_PER_WORKER = 2
+
+# The state of a worker (set by `_init_worker`).
+_secret_keys: dict[bytes, UserSecretKey] = {}
+_transaction_computer = TransactionComputer()
+
+Chunk = tuple[int, list[str]]
+
+
+def sign_transactions_stream(
+    infile: TextIO, outfile: TextIO, secret_keys: list[UserSecretKey], num_workers: int = 1
+) -> int:
+    """
+    Reads transactions (JSON Lines), signs each one with the key of its sender, then writes them (JSON Lines),
+    in order, as soon as they are signed. The input is consumed in chunks, thus memory usage does not depend on its size.
+    Returns the number of signed transactions.
+    """
+    keys = {key.generate_public_key().buffer: key.buffer for key in secret_keys}
+    chunks = _read_chunks(infile)
+    start = time.perf_counter()
+    num_signed = 0
+
+    if num_workers > 1:
+        logger.info(f"Signing with {len(keys)} keys, using {num_workers} processes.")
+        results = _sign_in_parallel(chunks, keys, num_workers)
+    else:
+        _init_worker(keys)
+        results = (_sign_chunk(first_line_number, lines) for first_line_number, lines in chunks)
+
+    try:
+        for signed_lines in results:
+            outfile.writelines(signed_lines)
+            outfile.flush()
+            num_signed += len(signed_lines)
+    except ValueError as error:
+        raise errors.BadUserInput(str(error))
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"Signed {num_signed} transactions in {elapsed:.2f}s ({num_signed / max(elapsed, 1e-9):.0f} tx/sec).")
+    return num_signed
+
+
+def _read_chunks(infile: TextIO) -> Iterator[Chunk]:
+    lines: list[str] = []
+    first_line_number = 1
+
+    for line_number, line in enumerate(infile, start=1):
+        if not lines:
+            first_line_number = line_number
+
+        lines.append(line)
+
+        if len(lines) == CHUNK_SIZE:
+            yield first_line_number, lines
+            lines = []
+
+    if lines:
+        yield first_line_number, lines
+
+
+def _sign_in_parallel(chunks: Iterable[Chunk], keys: dict[bytes, bytes], num_workers: int) -> Iterator[list[str]]:
+    with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker, initargs=(keys,)) as executor:
+        pending: deque[Future[list[str]]] = deque()
+
+        for first_line_number, lines in chunks:
+            pending.append(executor.submit(_sign_chunk, first_line_number, lines))
+
+            if len(pending) >= num_workers * MAX_NUM_PENDING_CHUNKS_PER_WORKER:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+def _init_worker(keys: dict[bytes, bytes]):
+    global _secret_keys
+    _secret_keys = {public_key: UserSecretKey(secret_key) for public_key, secret_key in keys.items()}
+
+
+def _sign_chunk(first_line_number: int, lines: list[str]) -> list[str]:
+    """Raises `ValueError` (which, unlike our errors, can be passed between processes) for bad input."""
+    signed_lines: list[str] = []
+
+    for line_number, line in enumerate(lines, start=first_line_number):
+        if not line.strip():
+            continue
+
+        try:
+            data = json.loads(line)
+            transaction = Transaction.new_from_dictionary(data.get("tx") or data.get("emittedTransaction") or data)
+        except Exception as error:
+            raise ValueError(f"invalid transaction on line {line_number}: {error}")
+
+        secret_key = _secret_keys.get(transaction.sender.get_public_key())
+        if secret_key is None:
+            raise ValueError(f"no key for the sender on line {line_number}: {transaction.sender.to_bech32()}")
+
+        transaction.signature = secret_key.sign(_transaction_computer.compute_bytes_for_signing(transaction))
+        signed_lines.append(json.dumps(transaction.to_dictionary()) + "\n")
+
+    return signed_lines
@@ -0,0 +1,46 @@
+import json
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any
+
+HOST = "localhost"
+PORT = 7778
+
+GUARDIAN_SIGNATURE = "ab" * 64
+EXPECTED_CODE = "123456"
+
+
+class HTTP(BaseHTTPRequestHandler):
+    """Stands in for the trusted cosigner service: co-signs the transactions (with a dummy signature), if the code is correct."""
+
+    requests: list[dict[str, Any]] = []
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        payload = json.loads(self.rfile.read(length))
+        HTTP.requests.append(payload)
+
+        self.send_response(200)
+        self.send_header("Content-type", "application/json")
+        self.end_headers()
+
+        if self.path == "/sign-multiple-transactions":
+            if payload["code"] != EXPECTED_CODE:
+                response = {"data": None, "error": "invalid code", "code": "bad_request"}
+            else:
+                transactions = [dict(tx, guardianSignature=GUARDIAN_SIGNATURE) for tx in payload["transactions"]]
+                response = {"data": {"transactions": transactions}, "error": "", "code": "successful"}
+
+            self.wfile.write(bytes(json.dumps(response), "utf-8"))
+
+    def log_message(self, format: str, *args: Any):
+        pass
+
+
+if __name__ == "__main__":
+    server = HTTPServer((HOST, PORT), HTTP)
+    print("Server running...")
+
+    server.serve_forever()
+    server.server_close()
+
+    print("Server closed!")
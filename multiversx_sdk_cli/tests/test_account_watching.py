@@ -0,0 +1,84 @@
+import json
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from multiversx_sdk.network_providers.resources import GenericResponse
+
+from multiversx_sdk_cli import cli_shared
+from multiversx_sdk_cli.cli import main
+from multiversx_sdk_cli.pooled_proxy import PooledProxyNetworkProvider
+
+alice = "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
+bob = "erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx"
+
+
+def test_watch_accounts(capsys: Any, monkeypatch: Any, tmp_path: Path):
+    # The state of the accounts, for each poll.
+    polls = [
+        {alice: (1, 100, "h1", {"FNG-123456": "5"}), bob: (0, 0, "h0", {})},
+        {alice: (1, 100, "h1", {"FNG-123456": "5"}), bob: (0, 0, "h0", {})},
+        {alice: (2, 90, "h2", {"FNG-123456": "3", "OTHER-654321": "1"}), bob: (0, 10, "h0", {})},
+        {alice: (2, 90, "h2", {"FNG-123456": "3", "OTHER-654321": "1"}), bob: (0, 10, "h0", {})},
+    ]
+    poll_index = 0
+    num_token_requests = 0
+    sleeps: list[float] = []
+
+    def do_get_generic(self: Any, url: str) -> GenericResponse:
+        nonlocal num_token_requests
+        address = url.split("/")[1]
+        nonce, balance, root_hash, tokens = polls[poll_index][address]
+
+        if url.endswith("/esdt"):
+            num_token_requests += 1
+            return GenericResponse({"esdts": {identifier: {"balance": value} for identifier, value in tokens.items()}})
+        return GenericResponse({"account": {"nonce": nonce, "balance": str(balance), "rootHash": root_hash}})
+
+    def sleep(seconds: float):
+        nonlocal poll_index
+        sleeps.append(seconds)
+        poll_index += 1
+
+    monkeypatch.setattr(PooledProxyNetworkProvider, "do_get_generic", do_get_generic)
+    monkeypatch.setattr(cli_shared, "get_network_config", lambda _: SimpleNamespace(round_duration=6000))
+    monkeypatch.setattr(time, "sleep", sleep)
+
+    addresses_file = tmp_path / "addresses.txt"
+    addresses_file.write_text(f"{alice}\n{bob}\n")
+
+    return_code = main(
+        [
+            "get",
+            "account",
+            "--watch",
+            "--addresses-file",
+            str(addresses_file),
+            "--with-tokens",
+            "--polls",
+            "4",
+            "--proxy",
+            "https://testnet-api.multiversx.com",
+        ]
+    )
+    assert return_code == 0
+
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(event["event"], event["address"]) for event in events] == [
+        ("initial", alice),
+        ("initial", bob),
+        ("nonce", alice),
+        ("balance", alice),
+        ("token", alice),
+        ("token", alice),
+        ("balance", bob),
+    ]
+    assert events[0]["tokens"] == {"FNG-123456": "5"}
+    assert events[4] == {**events[4], "token": "FNG-123456", "previous": "5", "current": "3"}
+    assert events[5] == {**events[5], "token": "OTHER-654321", "previous": None, "current": "1"}
+
+    # Tokens are fetched again only when the root hash changes.
+    assert num_token_requests == 3
+    # The interval grows while nothing changes, and is reset on changes.
+    assert sleeps == [6, 12, 6]
@@ -0,0 +1,107 @@
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from multiversx_sdk import AccountOnNetwork, Address, Token, TokenAmountOnNetwork
+
+from multiversx_sdk_cli.bulk_fetching import (
+    RateLimiter,
+    RecordsWriter,
+    fetch_concurrently,
+)
+from multiversx_sdk_cli.cli import main
+from multiversx_sdk_cli.pooled_proxy import PooledProxyNetworkProvider
+
+alice = "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
+bob = "erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx"
+carol = "erd1k2s324ww2g0yj38qn2ch2jwctdy8mnfxep94q9arncc6xecg3xaq6mjse8"
+
+
+def test_fetch_concurrently_keeps_the_order():
+    def fetch(item: int) -> int:
+        time.sleep((10 - item) / 1000)
+        if item == 3:
+            raise ValueError("bad item")
+        return item * 2
+
+    results = list(fetch_concurrently(range(10), fetch, num_workers=4))
+
+    assert [result.item for result in results] == list(range(10))
+    assert [result.value for result in results if not result.error] == [0, 2, 4, 8, 10, 12, 14, 16, 18]
+    assert str(results[3].error) == "bad item"
+
+
+def test_rate_limiter():
+    limiter = RateLimiter(100)
+    start = time.monotonic()
+    for _ in range(11):
+        limiter.acquire()
+
+    assert time.monotonic() - start >= 0.1
+
+
+def test_records_writer_resumes(tmp_path: Path):
+    outfile = tmp_path / "records.csv"
+    with RecordsWriter(outfile, "csv", ["a", "b"]) as writer:
+        writer.write({"a": 1, "b": None})
+
+    with open(outfile, "a") as f:
+        f.write("2,partial")
+
+    with RecordsWriter(outfile, "csv", ["a", "b"], resume=True) as writer:
+        assert writer.existing_records == [{"a": "1", "b": ""}]
+        writer.write({"a": 2, "b": "x"})
+
+    assert outfile.read_text().splitlines() == ["a,b", "1,", "2,x"]
+
+
+def test_get_accounts(capsys: Any, monkeypatch: Any, tmp_path: Path):
+    requested: list[str] = []
+
+    def get_account(self: Any, address: Address) -> AccountOnNetwork:
+        requested.append(address.to_bech32())
+        if address.to_bech32() == carol:
+            raise Exception("connection reset")
+        return AccountOnNetwork(
+            raw={}, address=address, nonce=7, balance=10**18, is_guarded=False, username="alice.elrond"
+        )
+
+    def get_token_of_account(self: Any, address: Address, token: Token) -> TokenAmountOnNetwork:
+        requested.append(f"{address.to_bech32()}/{token.identifier}-{token.nonce}")
+        return TokenAmountOnNetwork(raw={}, token=token, amount=42, attributes=b"")
+
+    monkeypatch.setattr(PooledProxyNetworkProvider, "get_account", get_account)
+    monkeypatch.setattr(PooledProxyNetworkProvider, "get_token_of_account", get_token_of_account)
+
+    addresses_file = tmp_path / "addresses.txt"
+    addresses_file.write_text(f"# custodial\n{alice} NFT-123456-0a\n\n{bob}\n{carol}\n")
+    outfile = tmp_path / "snapshot.jsonl"
+
+    args = ["get", "accounts", "--file", str(addresses_file), "--token", "FNG-123456", "--outfile", str(outfile)]
+    args += ["--proxy", "https://testnet-api.multiversx.com"]
+    assert main(args) == 0
+
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["numFetched"] == 6
+    assert summary["failures"] == [{"address": carol, "token": "", "error": "connection reset"}]
+
+    records = [json.loads(line) for line in outfile.read_text().splitlines()]
+    assert [(record["address"], record["token"]) for record in records] == [
+        (alice, ""),
+        (alice, "NFT-123456-0a"),
+        (alice, "FNG-123456"),
+        (bob, ""),
+        (bob, "FNG-123456"),
+        (carol, "FNG-123456"),
+    ]
+    assert records[0]["balance"] == "1000000000000000000"
+    assert records[0]["nonce"] == 7
+    assert records[1]["balance"] == "42"
+    assert f"{alice}/NFT-123456-10" in requested
+
+    # Only the failed (or missing) entries are fetched again.
+    requested.clear()
+    assert main(args + ["--resume"]) == 0
+    assert json.loads(capsys.readouterr().out)["numSkipped"] == 6
+    assert requested == [carol]
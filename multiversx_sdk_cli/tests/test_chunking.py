@@ -0,0 +1,51 @@
+from argparse import Namespace
+from typing import Any, Sequence
+
+import pytest
+
+from multiversx_sdk_cli import chunking
+from multiversx_sdk_cli.chunking import (
+    compute_chunk_size,
+    split_amount,
+    split_items_into_chunks,
+)
+from multiversx_sdk_cli.errors import BadUsage
+
+
+def _compute_gas_limit(items: Sequence[Any]) -> int:
+    return 1_000_000 + 6_000_000 * len(items)
+
+
+def test_compute_chunk_size():
+    items = list(range(250))
+
+    assert compute_chunk_size(items, _compute_gas_limit, max_gas_limit=600_000_000) == 99
+    assert compute_chunk_size(items, _compute_gas_limit, max_gas_limit=61_000_000) == 10
+    assert compute_chunk_size(items[:5], _compute_gas_limit, max_gas_limit=600_000_000) == 5
+    assert compute_chunk_size(items[:1], _compute_gas_limit, max_gas_limit=600_000_000) == 1
+
+    with pytest.raises(BadUsage):
+        compute_chunk_size(items, _compute_gas_limit, max_gas_limit=5_000_000)
+
+
+def test_split_amount():
+    assert split_amount(10, [[1, 2], [3, 4], [5]]) == [4, 4, 2]
+    assert split_amount(11, [[1, 2], [3]]) == [7, 4]
+    assert split_amount(0, [[1], [2]]) == [0, 0]
+
+
+def test_split_items_into_chunks_without_network(monkeypatch: Any):
+    def fail(*args: Any):
+        raise AssertionError("the network config should not be fetched")
+
+    monkeypatch.setattr(chunking, "get_max_gas_limit_per_transaction", fail)
+    proxy = "https://devnet-api.multiversx.com"
+
+    assert split_items_into_chunks(Namespace(proxy=proxy), [1], _compute_gas_limit) == [[1]]
+    assert split_items_into_chunks(Namespace(proxy=proxy, gas_limit=9_000_000), [1, 2, 3], _compute_gas_limit) == [
+        [1, 2, 3]
+    ]
+    assert split_items_into_chunks(Namespace(proxy=proxy, nodes_per_transaction=2), [1, 2, 3], _compute_gas_limit) == [
+        [1, 2],
+        [3],
+    ]
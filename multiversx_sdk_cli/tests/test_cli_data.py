@@ -0,0 +1,91 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from multiversx_sdk_cli.cli import main
+from multiversx_sdk_cli.data_storage import DataStore
+
+
+def test_store_and_load(capsys: Any, monkeypatch: Any, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+
+    assert main(["data", "store", "--key", "contract", "--value", "erd1qqq", "--partition", "devnet"]) == 0
+    assert main(["data", "store", "--key", "contract", "--value", "erd1ppp", "--partition", "mainnet"]) == 0
+    capsys.readouterr()
+
+    assert main(["data", "load", "--key", "contract", "--partition", "devnet"]) == 0
+    assert capsys.readouterr().out == "erd1qqq\n"
+
+    assert main(["data", "load", "--key", "missing", "--partition", "devnet"]) == 0
+    assert capsys.readouterr().out == "\n"
+
+
+def test_store_many_and_dump(capsys: Any, monkeypatch: Any, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+
+    pairs_file = tmp_path / "pairs.json"
+    pairs_file.write_text(json.dumps({f"hash{i}": f"{i:064x}" for i in range(1000)} | {"count": 1000}))
+
+    assert main(["data", "store-many", "--file", str(pairs_file), "--partition", "deploy"]) == 0
+    assert main(["data", "store", "--key", "owner", "--value", "alice"]) == 0
+    capsys.readouterr()
+
+    assert main(["data", "dump", "--partition", "deploy"]) == 0
+    dumped = json.loads(capsys.readouterr().out)
+    assert list(dumped.keys()) == ["deploy"]
+    assert len(dumped["deploy"]) == 1001
+    assert dumped["deploy"]["hash7"] == f"{7:064x}"
+    assert dumped["deploy"]["count"] == "1000"
+
+    assert main(["data", "dump"]) == 0
+    assert json.loads(capsys.readouterr().out)["*"] == {"owner": "alice"}
+
+
+def test_import_legacy_file(capsys: Any, monkeypatch: Any, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    legacy = {"*": {"contract": "erd1qqq"}, "devnet": {"hash": "abba"}}
+    (tmp_path / "mxpy.data-storage.json").write_text(json.dumps(legacy))
+
+    # Readers see the legacy entries without creating the store; the first writer imports them.
+    assert main(["data", "load", "--key", "hash", "--partition", "devnet"]) == 0
+    assert capsys.readouterr().out == "abba\n"
+    assert not (tmp_path / "mxpy.data-storage.sqlite").exists()
+
+    other_file = tmp_path / "other.json"
+    other_file.write_text(json.dumps({"devnet": {"hash": "beef", "nonce": 7}}))
+    assert main(["data", "import", "--file", str(other_file)]) == 0
+
+    with DataStore(tmp_path / "mxpy.data-storage.sqlite") as store:
+        assert store.dump() == {"*": {"contract": "erd1qqq"}, "devnet": {"hash": "beef", "nonce": "7"}}
+
+
+def test_load_and_dump_do_not_create_store(capsys: Any, monkeypatch: Any, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+
+    assert main(["data", "load", "--key", "contract"]) == 0
+    assert capsys.readouterr().out == "\n"
+
+    assert main(["data", "dump"]) == 0
+    assert json.loads(capsys.readouterr().out) == {}
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_parse(capsys: Any, tmp_path: Path):
+    output = {"contractAddress": "erd1qqq", "emittedTransactionHash": "abba", "results": [{"hash": "aa"}]}
+    json_file = tmp_path / "output.json"
+    json_file.write_text(json.dumps(output))
+
+    args = ["data", "parse", "--file", str(json_file)]
+    assert main(args + ["--expression", "data['contractAddress']", "--expression", "$.results[*].hash"]) == 0
+    assert capsys.readouterr().out == "erd1qqq\n['aa']\n"
+
+    assert main(args + ["--expression", "data['missing']"]) == 0
+    assert capsys.readouterr().out == "\n"
+
+    jsonl_file = tmp_path / "outputs.jsonl"
+    jsonl_file.write_text(json.dumps(output) + "\n\n" + json.dumps({"contractAddress": "erd1ppp"}) + "\n")
+
+    args = ["data", "parse", "--file", str(jsonl_file), "--expression", "$.contractAddress"]
+    assert main(args + ["--expression", "$.emittedTransactionHash"]) == 0
+    assert capsys.readouterr().out.splitlines() == ['["erd1qqq", "abba"]', '["erd1ppp", null]']
@@ -0,0 +1,61 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from multiversx_sdk_cli import errors, utils
+from multiversx_sdk_cli.cli import main
+
+testdata_path = Path(__file__).parent / "testdata"
+
+
+def test_format_json():
+    data = {"nonce": 7, "data": b"hello", "value": 2**70}
+
+    assert utils.format_json(data) == json.dumps({"nonce": 7, "data": "68656c6c6f", "value": 2**70}, indent=4)
+    assert utils.format_json(data, "compact") == '{"nonce":7,"data":"68656c6c6f","value":1180591620717411303424}'
+    assert utils.format_json(data, "jsonl") == utils.format_json(data, "compact")
+    assert utils.format_json([{"a": 1}, {"b": [2, 3]}], "jsonl") == '{"a":1}\n{"b":[2,3]}'
+
+
+def test_format_json_with_orjson():
+    try:
+        import orjson  # type: ignore # noqa: F401
+    except ImportError:
+        with pytest.raises(errors.DependencyMissing):
+            utils.format_json({"a": 1}, "orjson")
+        return
+
+    assert utils.format_json({"a": 1, "b": b"\x01"}, "orjson") == '{"a":1,"b":"01"}'
+    # Integers larger than 64 bits are not supported by orjson: the output falls back to the standard encoder.
+    assert utils.format_json({"value": 2**70}, "orjson") == '{"value":1180591620717411303424}'
+
+
+def test_output_format_argument(capsys: Any):
+    args = [
+        "tx",
+        "new",
+        "--pem",
+        str(testdata_path / "alice.pem"),
+        "--receiver",
+        "erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx",
+        "--nonce",
+        "89",
+        "--gas-limit",
+        "50000",
+        "--chain",
+        "D",
+    ]
+
+    assert main(["--output-format", "compact"] + args) == 0
+    compact_output = capsys.readouterr().out
+    assert compact_output.count("\n") == 1
+
+    # Global arguments are accepted anywhere on the command line.
+    assert main(args + ["--output-format", "json"]) == 0
+    indented_output = capsys.readouterr().out
+    assert indented_output.count("\n") > 1
+
+    assert json.loads(compact_output) == json.loads(indented_output)
+    assert json.loads(compact_output)["emittedTransaction"]["nonce"] == 89
@@ -2,6 +2,7 @@ import json
 from pathlib import Path
 from typing import Any
 
+import multiversx_sdk_cli.validators_signing
 from multiversx_sdk_cli.cli import main
 
 parent = Path(__file__).parent
@@ -897,6 +898,42 @@ def _read_stdout(capsys: Any) -> str:
     return stdout
 
 
+def test_add_nodes_in_chunks_with_parallel_signing(capsys: Any, monkeypatch: Any):
+    monkeypatch.setattr(multiversx_sdk_cli.validators_signing, "MIN_NUM_KEYS_FOR_PARALLEL_SIGNING", 1)
+    validators_file = parent / "testdata" / "validators.pem"
+
+    main(
+        [
+            "staking-provider",
+            "add-nodes",
+            "--validators-pem",
+            str(validators_file),
+            "--delegation-contract",
+            "erd1qqqqqqqqqqqqqqqpqqqqqqqqqqqqqqqqqqqqqqqqqqqqqthllllsy5r6rh",
+            "--pem",
+            str(alice),
+            "--chain",
+            "T",
+            "--nonce",
+            "7",
+            "--nodes-per-transaction",
+            "2",
+        ]
+    )
+    outputs = get_transaction(capsys)
+    assert len(outputs) == 2
+
+    assert [output["emittedTransaction"]["nonce"] for output in outputs] == [7, 8]
+    assert (
+        outputs[0]["emittedTransactionData"]
+        == "addNodes@e7beaa95b3877f47348df4dd1cb578a4f7cabf7a20bfeefe5cdd263878ff132b765e04fef6f40c93512b666c47ed7719b8902f6c922c04247989b7137e837cc81a62e54712471c97a2ddab75aa9c2f58f813ed4c0fa722bde0ab718bff382208@307ef00b648eed52ce4e95f8155f2e65491addd49266254f7c32ff06622e335752a6a6ad2efeb2534ec0db6a431b4989@78689fd4b1e2e434d567fe01e61598a42717d83124308266bd09ccc15d2339dd318c019914b86ac29adbae5dd8a02d0307425e9bd85a296e94943708c72f8c670f0b7c50a890a5719088dbd9f1d062cad9acffa06df834106eebe1a4257ef00d@4c90003d4b535fe709b6583708ae276e29558c58d160ad6241c3063e590611a2e327f2b8299b4955179a85eab50b4587"
+    )
+    assert (
+        outputs[1]["emittedTransactionData"]
+        == "addNodes@7188b234a8bf834f2e6258012aa09a2ab93178ffab9c789480275f61fe02cd1b9a58ddc63b79a73abea9e2b7ac5cac0b0d4324eff50aca2f0ec946b9ae6797511fa3ce461b57e77129cba8ab3b51147695d4ce889cbe67905f6586b4e4f22491@1d6cf6b0a38fa5c10df6493eae0b14c5d119d9f7d3d3e790a047e4e7c09919f64f910971ceef380b49f70fc982d07d19"
+    )
+
+
 def get_transaction(capsys: Any):
     output = _read_stdout(capsys)
     return json.loads(output)
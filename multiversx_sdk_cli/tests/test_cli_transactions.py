@@ -1,8 +1,17 @@
 import json
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
+from multiversx_sdk import Address, Transaction, TransactionOnNetwork
+from multiversx_sdk.network_providers.http_resources import (
+    transaction_from_simulate_response,
+)
+
+from multiversx_sdk_cli import cli_shared
 from multiversx_sdk_cli.cli import main
+from multiversx_sdk_cli.pooled_proxy import PooledProxyNetworkProvider
+from multiversx_sdk_cli.transactions import save_transactions_to_jsonl
 
 testdata_path = Path(__file__).parent / "testdata"
 testdata_out = Path(__file__).parent / "testdata-out"
@@ -485,6 +494,89 @@ def test_raise_error_when_data_and_transfers_provided(capsys: Any):
     assert return_code == 1
 
 
+def test_simulate_batch(capsys: Any, monkeypatch: Any, tmp_path: Path):
+    alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+    bob = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
+    responses: list[dict[str, Any]] = [
+        # The unused gas (50000) is refunded.
+        {"status": "success", "scResults": {"aa": _create_sc_result(bob, alice, "@6f6b", 500_000_000_000)}},
+        {"status": "fail", "failReason": "insufficient funds"},
+        {"status": "success", "scResults": {"bb": _create_sc_result(bob, alice, "@75736572206572726f72", 0)}},
+        {"status": "fail", "failReason": "insufficient funds"},
+    ]
+
+    def simulate_transaction(self: Any, transaction: Transaction) -> TransactionOnNetwork:
+        return transaction_from_simulate_response(transaction, responses[transaction.nonce])
+
+    monkeypatch.setattr(PooledProxyNetworkProvider, "simulate_transaction", simulate_transaction)
+    monkeypatch.setattr(
+        cli_shared,
+        "get_network_config",
+        lambda _: SimpleNamespace(min_gas_limit=50_000, gas_per_data_byte=1_500, gas_price_modifier=0.01),
+    )
+
+    infile = tmp_path / "txs.jsonl"
+    outfile = tmp_path / "results.jsonl"
+    with open(infile, "w") as f:
+        transactions = [
+            Transaction(sender=alice, receiver=bob, gas_limit=100_000, chain_id="D", nonce=nonce) for nonce in range(4)
+        ]
+        save_transactions_to_jsonl(transactions, f)
+
+    return_code = main(
+        [
+            "tx",
+            "simulate-batch",
+            "--infile",
+            str(infile),
+            "--outfile",
+            str(outfile),
+            "--proxy",
+            "https://devnet-api.multiversx.com",
+            "--concurrency",
+            "2",
+        ]
+    )
+    assert return_code == 0
+
+    results = [json.loads(line) for line in outfile.read_text().splitlines()]
+    assert [result["index"] for result in results] == [0, 1, 2, 3]
+    assert [result["status"] for result in results] == ["success", "fail", "fail", "fail"]
+    assert results[0]["gasUsed"] == 50_000
+    assert results[0]["fee"] == "50000000000000"
+    assert results[2]["returnMessage"] == "wrong argument"
+
+    report = json.loads(_read_stdout(capsys))
+    assert report["numTransactions"] == 4
+    assert report["numFailures"] == 3
+    assert report["gasUsed"] == 350_000
+    assert report["fees"] == str(50_000_000_000_000 + 3 * 50_500_000_000_000)
+    assert report["failures"] == [
+        {"returnMessage": "insufficient funds", "count": 2, "indices": [1, 3]},
+        {"returnMessage": "wrong argument", "count": 1, "indices": [2]},
+    ]
+
+    # Without --outfile, the results are streamed to stdout (valid JSON Lines), while the report goes to stderr.
+    return_code = main(
+        ["tx", "simulate-batch", "--infile", str(infile), "--proxy", "https://devnet-api.multiversx.com"]
+    )
+    assert return_code == 0
+
+    captured = capsys.readouterr()
+    assert [json.loads(line) for line in captured.out.splitlines()] == results
+    assert json.loads(captured.err)["numFailures"] == 3
+
+
+def _create_sc_result(sender: Address, receiver: Address, data: str, value: int) -> dict[str, Any]:
+    return {
+        "sender": sender.to_bech32(),
+        "receiver": receiver.to_bech32(),
+        "data": data,
+        "value": value,
+        "returnMessage": "wrong argument" if data != "@6f6b" else "",
+    }
+
+
 def _read_stdout(capsys: Any) -> str:
     stdout: str = capsys.readouterr().out.strip()
     return stdout
@@ -4,6 +4,7 @@ from typing import Any
 
 from multiversx_sdk import ValidatorPEM
 
+import multiversx_sdk_cli.validators_signing
 from multiversx_sdk_cli.cli import main
 
 testdata_path = Path(__file__).parent / "testdata"
@@ -30,6 +31,38 @@ def test_create_validator_wallet():
     assert wallet.secret_key
 
 
+def test_create_many_validator_keys(monkeypatch: Any, tmp_path: Path):
+    monkeypatch.setattr(multiversx_sdk_cli.validators_signing, "MIN_NUM_KEYS_FOR_PARALLEL_SIGNING", 1)
+    outfile = tmp_path / "validators.pem"
+
+    return_code = main(
+        [
+            "validator-wallet",
+            "new",
+            "--outfile",
+            str(outfile),
+            "--count",
+            "5",
+            "--node-keys-folder",
+            str(tmp_path / "nodes"),
+        ]
+    )
+    assert not return_code
+
+    wallets = ValidatorPEM.from_file_all(outfile)
+    assert len(wallets) == 5
+    assert len(set(wallet.label for wallet in wallets)) == 5
+
+    for wallet in wallets:
+        assert wallet.secret_key.generate_public_key().hex() == wallet.label
+
+    index = json.loads((tmp_path / "validators.pem.index.json").read_text())
+    assert index == [{"index": i, "publicKey": wallet.label} for i, wallet in enumerate(wallets)]
+
+    node_key = ValidatorPEM.from_file(tmp_path / "nodes" / "validators" / "validatorKey04.pem")
+    assert node_key.label == wallets[4].label
+
+
 def test_validator_sign_and_verify_message(capsys: Any):
     message = "test"
     validator = testdata_path / "validator_01.pem"
@@ -591,6 +591,45 @@ def test_re_stake_unstaked_nodes(capsys: Any):
     )
 
 
+def test_stake_in_chunks(capsys: Any):
+    validators_pem = testdata_path / "validators_file.pem"
+
+    return_code = main(
+        [
+            "validator",
+            "stake",
+            "--pem",
+            str(alice_pem),
+            "--value",
+            "5000000000000000000001",
+            "--validators-pem",
+            str(validators_pem),
+            "--reward-address",
+            reward_address,
+            "--chain",
+            "localnet",
+            "--nonce=7",
+            "--nodes-per-transaction=1",
+        ]
+    )
+    assert return_code == 0
+
+    outputs = get_output(capsys)
+    assert len(outputs) == 2
+
+    first_tx, second_tx = outputs[0]["emittedTransaction"], outputs[1]["emittedTransaction"]
+    assert first_tx["nonce"] == 7
+    assert second_tx["nonce"] == 8
+    assert first_tx["value"] == "2500000000000000000000"
+    assert second_tx["value"] == "2500000000000000000001"
+    assert outputs[0]["emittedTransactionData"].startswith(
+        "stake@01@f8910e47cf9464777c912e6390758bb39715fffcb861b184017920e4a807b42553f2f21e7f3914b81bcf58b66a72ab16d97013ae1cff807cefc977ef8cbf116258534b9e46d19528042d16ef8374404a89b184e0a4ee18c77c49e454d04eae8d@"
+    )
+    assert outputs[1]["emittedTransactionData"].startswith(
+        "stake@01@1b4e60e6d100cdf234d3427494dac55fbac49856cadc86bcb13a01b9bb05a0d9143e86c186c948e7ae9e52427c9523102efe9019a2a9c06db02993f2e3e6756576ae5a3ec7c235d548bc79de1a6990e1120ae435cb48f7fc436c9f9098b92a0d@"
+    )
+
+
 def get_output(capsys: Any):
     tx = _read_stdout(capsys)
     return json.loads(tx)
@@ -0,0 +1,60 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from multiversx_sdk_cli import config_env
+from multiversx_sdk_cli.config_env import MxpyEnv
+from multiversx_sdk_cli.config_files import update_json_file
+
+
+def test_update_json_file_is_serialized(tmp_path: Path):
+    path = tmp_path / "mxpy.json"
+    num_snapshot_drops: list[int] = []
+
+    def increment(_: int):
+        with update_json_file(path, lambda: num_snapshot_drops.append(1)) as data:
+            data["counter"] = data.get("counter", 0) + 1
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(increment, range(200)))
+
+    assert json.loads(path.read_text()) == {"counter": 200}
+    assert len(num_snapshot_drops) == 200
+    assert sorted(file.name for file in tmp_path.iterdir()) == ["mxpy.json", "mxpy.json.lock"]
+
+
+def test_update_json_file_writes_nothing_on_error(tmp_path: Path):
+    path = tmp_path / "mxpy.json"
+    path.write_text('{"active": "default"}')
+
+    with pytest.raises(ValueError):
+        with update_json_file(path, lambda: None) as data:
+            data["active"] = "other"
+            raise ValueError("invalid")
+
+    assert json.loads(path.read_text()) == {"active": "default"}
+
+
+def test_env_snapshot_is_dropped_on_write(monkeypatch: Any, tmp_path: Path):
+    path = tmp_path / "env.mxpy.json"
+    path.write_text(json.dumps({"active": "devnet", "environments": {"devnet": {"proxy_url": "https://one"}}}))
+    monkeypatch.setattr(config_env, "LOCAL_ENV_PATH", path)
+    monkeypatch.setattr(config_env, "GLOBAL_ENV_PATH", path)
+    config_env._drop_snapshot()
+
+    try:
+        assert MxpyEnv.from_active_env().proxy_url == "https://one"
+
+        # Changed by another process: this one keeps its snapshot.
+        path.write_text(json.dumps({"active": "devnet", "environments": {"devnet": {"proxy_url": "https://two"}}}))
+        assert MxpyEnv.from_active_env().proxy_url == "https://one"
+
+        # Changed by this process: the change is made over the latest content, and the snapshot is dropped.
+        config_env.set_value("explorer_url", "https://explorer", "devnet")
+        assert MxpyEnv.from_active_env().proxy_url == "https://two"
+        assert MxpyEnv.from_active_env().explorer_url == "https://explorer"
+    finally:
+        config_env._drop_snapshot()
@@ -0,0 +1,103 @@
+import json
+import threading
+from http.server import HTTPServer
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+from multiversx_sdk import Address, Transaction
+
+from multiversx_sdk_cli import cosign_transaction
+from multiversx_sdk_cli.cli import main
+from multiversx_sdk_cli.errors import GuardianServiceError
+from multiversx_sdk_cli.guardian_relayer_data import GuardianRelayerData
+from multiversx_sdk_cli.signing_wrapper import SigningWrapper
+from multiversx_sdk_cli.tests import local_cosign_server
+
+testdata_path = Path(__file__).parent / "testdata"
+alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+guardian = Address.new_from_bech32("erd1k2s324ww2g0yj38qn2ch2jwctdy8mnfxep94q9arncc6xecg3xaq6mjse8")
+
+
+@pytest.fixture
+def cosigner_url() -> Iterator[str]:
+    local_cosign_server.HTTP.requests = []
+    server = HTTPServer((local_cosign_server.HOST, 0), local_cosign_server.HTTP)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://{local_cosign_server.HOST}:{server.server_port}"
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_cosign_transactions_in_one_request(cosigner_url: str):
+    guarded = [_create_transaction(nonce, guardian) for nonce in range(250)]
+    not_guarded = _create_transaction(250, None)
+
+    SigningWrapper().sign_transactions(
+        transactions=guarded + [not_guarded],
+        guardian_and_relayer=GuardianRelayerData(
+            guardian_address=guardian,
+            guardian_service_url=cosigner_url,
+            guardian_2fa_code=local_cosign_server.EXPECTED_CODE,
+        ),
+    )
+
+    assert [len(request["transactions"]) for request in local_cosign_server.HTTP.requests] == [250]
+    assert all(tx.guardian_signature.hex() == local_cosign_server.GUARDIAN_SIGNATURE for tx in guarded)
+    assert not not_guarded.guardian_signature
+
+
+def test_cosign_transactions_with_wrong_code(cosigner_url: str):
+    with pytest.raises(GuardianServiceError):
+        cosign_transaction.cosign_transactions([_create_transaction(0, guardian)], cosigner_url, "000000")
+
+
+def test_unjail_in_chunks_with_cosigner(capsys: Any, cosigner_url: str):
+    return_code = main(
+        [
+            "validator",
+            "unjail",
+            "--pem",
+            str(testdata_path / "alice.pem"),
+            "--value",
+            "5000000000000000000000",
+            "--nodes-public-keys",
+            "e7beaa95b3877f47348df4dd1cb578a4f7cabf7a20bfeefe5cdd263878ff132b765e04fef6f40c93512b666c47ed7719b8902f6c922c04247989b7137e837cc81a62e54712471c97a2ddab75aa9c2f58f813ed4c0fa722bde0ab718bff382208,"
+            "78689fd4b1e2e434d567fe01e61598a42717d83124308266bd09ccc15d2339dd318c019914b86ac29adbae5dd8a02d0307425e9bd85a296e94943708c72f8c670f0b7c50a890a5719088dbd9f1d062cad9acffa06df834106eebe1a4257ef00d",
+            "--chain",
+            "localnet",
+            "--nonce=7",
+            "--nodes-per-transaction=1",
+            "--guardian",
+            guardian.to_bech32(),
+            "--guardian-service-url",
+            cosigner_url,
+            "--guardian-2fa-code",
+            local_cosign_server.EXPECTED_CODE,
+        ]
+    )
+    assert return_code == 0
+
+    outputs = json.loads(capsys.readouterr().out)
+    assert len(outputs) == 2
+    assert len(local_cosign_server.HTTP.requests) == 1
+    assert len(local_cosign_server.HTTP.requests[0]["transactions"]) == 2
+
+    for output in outputs:
+        assert output["emittedTransaction"]["guardian"] == guardian.to_bech32()
+        assert output["emittedTransaction"]["guardianSignature"] == local_cosign_server.GUARDIAN_SIGNATURE
+
+
+def _create_transaction(nonce: int, guardian: Any) -> Transaction:
+    return Transaction(
+        sender=alice,
+        receiver=alice,
+        gas_limit=100000,
+        chain_id="localnet",
+        nonce=nonce,
+        guardian=guardian,
+        signature=bytes(64),
+    )
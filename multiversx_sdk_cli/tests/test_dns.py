@@ -0,0 +1,61 @@
+import threading
+from pathlib import Path
+from typing import Any
+
+from multiversx_sdk import Address, SmartContractQuery, SmartContractQueryResponse
+
+from multiversx_sdk_cli import dns
+
+alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+
+
+class ProxyMock:
+    def __init__(self) -> None:
+        self.queries: list[SmartContractQuery] = []
+        self.lock = threading.Lock()
+
+    def query_contract(self, query: SmartContractQuery) -> SmartContractQueryResponse:
+        with self.lock:
+            self.queries.append(query)
+
+        name = query.arguments[0].decode()
+        return_data_parts = [alice.get_public_key()] if name.startswith("alice") else []
+        return SmartContractQueryResponse(
+            function=query.function, return_code="ok", return_message="", return_data_parts=return_data_parts
+        )
+
+
+def test_dns_addresses_table():
+    addresses = dns.compute_all_dns_addresses()
+    assert len(addresses) == 256
+    assert addresses[0].to_bech32() == "erd1qqqqqqqqqqqqqpgqnhvsujzd95jz6fyv3ldmynlf97tscs9nqqqq49en6w"
+    assert addresses[255] == dns._compute_dns_address_for_shard_id(255)
+    assert dns.dns_address_for_name("alice.elrond").to_bech32() == (
+        "erd1qqqqqqqqqqqqqpgqf97pgqdy0tstwauxu09kszz020hp5kgqqzzsscqtww"
+    )
+
+
+def test_resolve_many(monkeypatch: Any, tmp_path: Path):
+    monkeypatch.setattr(dns, "DNS_CACHE_FILE", tmp_path / "dns_cache.json")
+    proxy = ProxyMock()
+    names = ["alice.elrond", "bob.elrond", "alice2.elrond", "alice.elrond"]
+
+    result = dns.resolve_many(names, proxy, "https://proxy", num_workers=4)
+    assert list(result.keys()) == ["alice.elrond", "bob.elrond", "alice2.elrond"]
+    assert result["alice.elrond"] == alice
+    assert result["alice2.elrond"] == alice
+    assert result["bob.elrond"].to_hex() == dns.ADDRESS_ZERO_HEX
+    assert len(proxy.queries) == 3
+
+    for query in proxy.queries:
+        assert query.contract == dns.dns_address_for_name(query.arguments[0].decode())
+
+    # Served from the cache.
+    proxy.queries.clear()
+    assert dns.resolve_many(names, proxy, "https://proxy") == result
+    assert len(proxy.queries) == 0
+
+    # Another proxy, or a disabled cache, means new queries.
+    dns.resolve_many(names, proxy, "https://another-proxy")
+    dns.resolve_many(names, proxy, "https://proxy", cache_ttl=0)
+    assert len(proxy.queries) == 6
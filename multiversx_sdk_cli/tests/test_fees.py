@@ -0,0 +1,166 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from multiversx_sdk import (
+    Address,
+    Token,
+    TokenManagementTransactionsFactory,
+    TokenTransfer,
+    Transaction,
+    TransactionsFactoryConfig,
+    TransferTransactionsFactory,
+    ValidatorPublicKey,
+    ValidatorsTransactionsFactory,
+)
+
+from multiversx_sdk_cli import fees
+from multiversx_sdk_cli.cli import main
+from multiversx_sdk_cli.fees import FeeCalculator, FeeParameters, LocalGasLimitEstimator
+from multiversx_sdk_cli.transactions import save_transactions_to_jsonl
+
+testdata_path = Path(__file__).parent / "testdata"
+
+alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+bob = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
+contract = Address.new_from_bech32("erd1qqqqqqqqqqqqqpgqf97pgqdy0tstwauxu09kszz020hp5kgqqzzsscqtww")
+validator_key = ValidatorPublicKey.from_string(
+    "e7beaa95b3877f47348df4dd1cb578a4f7cabf7a20bfeefe5cdd263878ff132b765e04fef6f40c93512b666c47ed7719b8902f6c922c04247989b7137e837cc81a62e54712471c97a2ddab75aa9c2f58f813ed4c0fa722bde0ab718bff382208"
+)
+
+# Same as the defaults of the transactions factories.
+default_fee_parameters = FeeParameters(
+    chain_id="T",
+    min_gas_limit=50_000,
+    gas_per_data_byte=1_500,
+    gas_price_modifier=0.01,
+    min_gas_price=1_000_000_000,
+)
+
+
+class EstimatorMock:
+    def __init__(self) -> None:
+        self.num_estimations = 0
+
+    def estimate_gas_limit(self, transaction: Transaction) -> int:
+        self.num_estimations += 1
+        return 42
+
+
+def test_compute_gas_limit_like_the_factories():
+    config = TransactionsFactoryConfig("T")
+    calculator = FeeCalculator(default_fee_parameters)
+
+    transactions = [
+        TransferTransactionsFactory(config).create_transaction_for_native_token_transfer(alice, bob, 1, "hello"),
+        TransferTransactionsFactory(config).create_transaction_for_esdt_token_transfer(
+            alice, bob, [TokenTransfer(Token("TEST-123456"), 10)]
+        ),
+        TransferTransactionsFactory(config).create_transaction_for_esdt_token_transfer(
+            alice, bob, [TokenTransfer(Token("NFT-123456", 1), 1), TokenTransfer(Token("NFT-123456", 2), 1)]
+        ),
+        TokenManagementTransactionsFactory(config).create_transaction_for_issuing_fungible(
+            alice, "Test", "TEST", 1000, 2, True, True, True, True, True, True
+        ),
+        TokenManagementTransactionsFactory(config).create_transaction_for_local_minting(alice, "TEST-123456", 10),
+        ValidatorsTransactionsFactory(config).create_transaction_for_unjailing(alice, [validator_key] * 3, 1),
+        ValidatorsTransactionsFactory(config).create_transaction_for_topping_up(alice, 1),
+    ]
+
+    for transaction in transactions:
+        assert calculator.compute_gas_limit(transaction) == transaction.gas_limit
+
+
+def test_do_not_compute_gas_limit_of_contract_calls():
+    calculator = FeeCalculator(default_fee_parameters)
+
+    assert calculator.compute_gas_limit(_create_transaction(alice, contract, "add@05")) is None
+    assert calculator.compute_gas_limit(_create_transaction(alice, contract, "")) is None
+    assert calculator.compute_gas_limit(_create_transaction(alice, alice, "SaveKeyValue@01@02")) is None
+    # Transfer and execute.
+    assert calculator.compute_gas_limit(_create_transaction(alice, contract, "ESDTTransfer@54455354@0a")) is None
+    assert calculator.compute_gas_limit(_create_transaction(alice, bob, "ESDTTransfer@54455354@0a@616464")) is None
+
+
+def test_local_gas_limit_estimator():
+    fallback = EstimatorMock()
+    estimator = LocalGasLimitEstimator(default_fee_parameters, fallback=fallback, gas_multiplier=1.5)
+
+    guarded = _create_transaction(alice, bob, "")
+    guarded.guardian = bob
+    assert estimator.estimate_gas_limit(guarded) == 150_000
+    assert fallback.num_estimations == 0
+
+    assert estimator.estimate_gas_limit(_create_transaction(alice, contract, "add@05")) == 42
+    assert fallback.num_estimations == 1
+
+    # Without a fallback, the gas limit is left as it is.
+    estimator = LocalGasLimitEstimator(default_fee_parameters)
+    assert estimator.estimate_gas_limit(_create_transaction(alice, contract, "add@05", 7_000_000)) == 7_000_000
+
+
+def test_save_and_load_fee_parameters(monkeypatch: Any, tmp_path: Path):
+    monkeypatch.setattr(fees, "FEE_PARAMETERS_FILE", tmp_path / "fee_parameters.json")
+
+    assert fees.load_fee_parameters("T") is None
+    fees.save_fee_parameters(default_fee_parameters)
+    assert fees.load_fee_parameters("T") == default_fee_parameters
+    assert fees.load_fee_parameters("D") is None
+
+
+def test_compute_fees_offline(capsys: Any, monkeypatch: Any, tmp_path: Path):
+    monkeypatch.setattr(fees, "FEE_PARAMETERS_FILE", tmp_path / "fee_parameters.json")
+    fees.save_fee_parameters(default_fee_parameters)
+
+    infile = tmp_path / "txs.jsonl"
+    with open(infile, "w") as f:
+        transactions = [
+            _create_transaction(alice, bob, "", 50_000),
+            _create_transaction(alice, contract, "add@05", 1_000_000),
+            _create_transaction(alice, bob, "hello", 50_000),
+        ]
+        save_transactions_to_jsonl(transactions, f)
+
+    assert main(["tx", "fee", "--infile", str(infile)]) == 0
+
+    output = json.loads(capsys.readouterr().out)
+    entries = output["transactions"]
+    assert [entry["fee"] for entry in entries] == ["50000000000000", "68410000000000", None]
+    assert [entry["computedGasLimit"] for entry in entries] == [50_000, None, 57_500]
+    assert entries[2]["error"] == "Not enough gas provided: 50000"
+    assert output["totalFee"] == "118410000000000"
+
+    # Unknown chain.
+    with open(infile, "w") as f:
+        save_transactions_to_jsonl([_create_transaction(alice, bob, "", 50_000, chain_id="X")], f)
+    assert main(["tx", "fee", "--infile", str(infile)]) == 1
+
+
+def test_compute_gas_limit_offline(capsys: Any, monkeypatch: Any, tmp_path: Path):
+    monkeypatch.setattr(fees, "FEE_PARAMETERS_FILE", tmp_path / "fee_parameters.json")
+    fees.save_fee_parameters(FeeParameters("T", 70_000, 2_000, 0.01, 1_000_000_000))
+
+    return_code = main(
+        [
+            "tx",
+            "new",
+            "--pem",
+            str(testdata_path / "alice.pem"),
+            "--receiver",
+            bob.to_bech32(),
+            "--nonce",
+            "7",
+            "--data",
+            "hello",
+            "--chain",
+            "T",
+        ]
+    )
+    assert return_code == 0
+    assert json.loads(capsys.readouterr().out)["emittedTransaction"]["gasLimit"] == 80_000
+
+
+def _create_transaction(
+    sender: Address, receiver: Address, data: str, gas_limit: int = 0, chain_id: str = "T"
+) -> Transaction:
+    return Transaction(sender=sender, receiver=receiver, gas_limit=gas_limit, chain_id=chain_id, data=data.encode())
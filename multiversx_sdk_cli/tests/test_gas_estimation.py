@@ -0,0 +1,102 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from multiversx_sdk import Address, Transaction
+
+from multiversx_sdk_cli import cli_shared
+from multiversx_sdk_cli.gas_estimation import (
+    CachingGasLimitEstimator,
+    GasEstimatesCache,
+    SimulatingGasLimitEstimator,
+)
+
+alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+contract = Address.new_from_bech32("erd1qqqqqqqqqqqqqpgqf97pgqdy0tstwauxu09kszz020hp5kgqqzzsscqtww")
+
+
+class ProxyMock:
+    url = "https://proxy"
+
+    def __init__(self) -> None:
+        self.code_hash = bytes([1] * 32)
+        self.num_simulations = 0
+
+    def get_account(self, address: Address) -> Any:
+        return SimpleNamespace(contract_code_hash=self.code_hash if address.is_smart_contract() else b"")
+
+    def estimate_transaction_cost(self, transaction: Transaction) -> Any:
+        self.num_simulations += 1
+        return SimpleNamespace(gas_limit=1_000_000 + len(transaction.data))
+
+
+def test_reuse_estimations_for_same_call_shape(tmp_path: Path):
+    proxy = ProxyMock()
+    cache = GasEstimatesCache(tmp_path / "gas.json", max_size=10)
+    estimator = CachingGasLimitEstimator(proxy, cache, gas_multiplier=1.0, safety_margin=1.5)  # type: ignore
+
+    assert estimator.estimate_gas_limit(_create_call("add@05")) == 1_500_009
+    assert estimator.estimate_gas_limit(_create_call("add@07")) == 1_500_009
+    assert proxy.num_simulations == 1
+
+    # Another shape (argument size, function, token transfer).
+    estimator.estimate_gas_limit(_create_call("add@0500"))
+    estimator.estimate_gas_limit(_create_call("sub@05"))
+    estimator.estimate_gas_limit(_create_call("ESDTTransfer@544553542d313233343536@0a@616464@05"))
+    estimator.estimate_gas_limit(_create_call("ESDTTransfer@544553542d313233343536@0a@737562@05"))
+    assert proxy.num_simulations == 5
+
+    # Persisted.
+    assert len(GasEstimatesCache(tmp_path / "gas.json", max_size=10)) == 5
+
+    # The contract has been upgraded.
+    proxy.code_hash = bytes([2] * 32)
+    estimator.estimate_gas_limit(_create_call("upgradeContract@0500"))
+    estimator.estimate_gas_limit(_create_call("add@05"))
+    assert proxy.num_simulations == 7
+
+
+def test_do_not_cache_transfers_to_users(tmp_path: Path):
+    proxy = ProxyMock()
+    cache = GasEstimatesCache(tmp_path / "gas.json", max_size=10)
+    estimator = CachingGasLimitEstimator(proxy, cache)  # type: ignore
+
+    for _ in range(2):
+        estimator.estimate_gas_limit(Transaction(sender=alice, receiver=alice, gas_limit=0, chain_id="D", data=b"hi"))
+
+    assert proxy.num_simulations == 2
+    assert len(cache) == 0
+
+
+def test_apply_safety_margin_when_not_cached(tmp_path: Path):
+    proxy = ProxyMock()
+    cache = GasEstimatesCache(tmp_path / "gas.json", max_size=10)
+    caching_estimator = CachingGasLimitEstimator(proxy, cache, gas_multiplier=1.0, safety_margin=1.5)  # type: ignore
+    simulating_estimator = SimulatingGasLimitEstimator(proxy, gas_multiplier=1.0, safety_margin=1.5)  # type: ignore
+
+    transfer = Transaction(sender=alice, receiver=alice, gas_limit=0, chain_id="D", data=b"hi")
+    assert caching_estimator.estimate_gas_limit(transfer) == 1_500_003
+    assert simulating_estimator.estimate_gas_limit(transfer) == 1_500_003
+    assert simulating_estimator.estimate_gas_limit(_create_call("add@05")) == 1_500_009
+
+
+def test_gas_estimates_cache_is_bounded(tmp_path: Path):
+    cache = GasEstimatesCache(tmp_path / "gas.json", max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def _create_call(data: str) -> Transaction:
+    return Transaction(sender=alice, receiver=contract, gas_limit=0, chain_id="D", data=data.encode())
+
+
+def test_caching_is_opt_in():
+    estimator = cli_shared._initialize_simulating_gas_limit_estimator("https://devnet-gateway.multiversx.com", 1.0)
+    assert not isinstance(estimator, CachingGasLimitEstimator)
+    assert estimator.safety_margin == 1.1
@@ -0,0 +1,85 @@
+import time
+from pathlib import Path
+from typing import Any
+
+from multiversx_sdk import Address, Transaction
+
+from multiversx_sdk_cli import guardian_data_cache
+
+proxy_url = "https://devnet-api.multiversx.com"
+alice = "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
+guardian_data = {
+    "guarded": True,
+    "activeGuardian": {
+        "activationEpoch": 42,
+        "address": "erd1k2s324ww2g0yj38qn2ch2jwctdy8mnfxep94q9arncc6xecg3xaq6mjse8",
+        "serviceUID": "MultiversXTCSService",
+    },
+}
+
+
+def test_cache_guardian_data(monkeypatch: Any, tmp_path: Path):
+    _enable_cache(monkeypatch, tmp_path)
+
+    assert guardian_data_cache.get_guardian_data(proxy_url, alice) is None
+
+    guardian_data_cache.put_guardian_data(proxy_url, alice, guardian_data)
+    assert guardian_data_cache.get_guardian_data(proxy_url, alice) == guardian_data
+    assert guardian_data_cache.get_guardian_data("https://testnet-api.multiversx.com", alice) is None
+
+    # Expired.
+    now = time.time()
+    monkeypatch.setattr(guardian_data_cache.time, "time", lambda: now + 601)
+    assert guardian_data_cache.get_guardian_data(proxy_url, alice) is None
+
+
+def test_do_not_cache_pending_guardian(monkeypatch: Any, tmp_path: Path):
+    _enable_cache(monkeypatch, tmp_path)
+
+    guardian_data_cache.put_guardian_data(proxy_url, alice, guardian_data)
+    assert guardian_data_cache.get_guardian_data(proxy_url, alice) == guardian_data
+
+    # A guardian change is pending: the previously cached entry is dropped, as well.
+    pending = dict(guardian_data, pendingGuardian={"activationEpoch": 62, "address": alice, "serviceUID": ""})
+    guardian_data_cache.put_guardian_data(proxy_url, alice, pending)
+    assert guardian_data_cache.get_guardian_data(proxy_url, alice) is None
+
+
+def test_forget_guardian_data_when_guarding(monkeypatch: Any, tmp_path: Path):
+    _enable_cache(monkeypatch, tmp_path)
+    testnet_url = "https://testnet-api.multiversx.com"
+    bob = "erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx"
+
+    for url, address in [(proxy_url, alice), (testnet_url, alice), (proxy_url, bob)]:
+        guardian_data_cache.put_guardian_data(url, address, guardian_data)
+
+    transfer = Transaction(
+        sender=Address.new_from_bech32(alice), receiver=Address.new_from_bech32(bob), gas_limit=50000, chain_id="D"
+    )
+    guardian_data_cache.forget_changed_guardian_data([transfer])
+    assert guardian_data_cache.get_guardian_data(proxy_url, alice) == guardian_data
+
+    unguard = Transaction(
+        sender=Address.new_from_bech32(alice),
+        receiver=Address.new_from_bech32(alice),
+        gas_limit=400000,
+        chain_id="D",
+        data=b"UnGuardAccount",
+    )
+    guardian_data_cache.forget_changed_guardian_data([transfer, unguard])
+    assert guardian_data_cache.get_guardian_data(proxy_url, alice) is None
+    assert guardian_data_cache.get_guardian_data(testnet_url, alice) is None
+    assert guardian_data_cache.get_guardian_data(proxy_url, bob) == guardian_data
+
+
+def test_cache_is_opt_in(monkeypatch: Any, tmp_path: Path):
+    monkeypatch.setattr(guardian_data_cache, "GUARDIAN_DATA_CACHE_FILE", tmp_path / "cache.json")
+
+    guardian_data_cache.put_guardian_data(proxy_url, alice, guardian_data)
+    assert guardian_data_cache.get_guardian_data(proxy_url, alice) is None
+    assert not (tmp_path / "cache.json").exists()
+
+
+def _enable_cache(monkeypatch: Any, tmp_path: Path):
+    monkeypatch.setattr(guardian_data_cache, "GUARDIAN_DATA_CACHE_FILE", tmp_path / "cache.json")
+    monkeypatch.setattr(guardian_data_cache.config, "get_guardian_data_cache_ttl_from_config", lambda: 600)
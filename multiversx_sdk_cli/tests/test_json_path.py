@@ -0,0 +1,41 @@
+import pytest
+
+from multiversx_sdk_cli import errors
+from multiversx_sdk_cli.json_path import MISSING, JsonPath
+
+document = {
+    "contractAddress": "erd1qqq",
+    "emittedTransaction": {"nonce": 7, "data": "deploy@01"},
+    "results": [{"hash": "aa", "logs": {"events": ["a", "b"]}}, {"hash": "bb"}],
+    "odd key": {"x-y": 1},
+}
+
+
+def test_compile_and_evaluate():
+    assert JsonPath.compile("data['contractAddress']").evaluate(document) == "erd1qqq"
+    assert JsonPath.compile('data["emittedTransaction"]["nonce"]').evaluate(document) == 7
+    assert JsonPath.compile("$.emittedTransaction.nonce").evaluate(document) == 7
+    assert JsonPath.compile("emittedTransaction.data").evaluate(document) == "deploy@01"
+    assert JsonPath.compile("$.results[-1].hash").evaluate(document) == "bb"
+    assert JsonPath.compile("$.results[0].logs.events[1]").evaluate(document) == "b"
+    assert JsonPath.compile("$['odd key'].x-y").evaluate(document) == 1
+    assert JsonPath.compile("$").evaluate(document) is document
+
+
+def test_evaluate_with_wildcards():
+    assert JsonPath.compile("$.results[*].hash").evaluate(document) == ["aa", "bb"]
+    assert JsonPath.compile("$.results.*.logs.events[*]").evaluate(document) == ["a", "b"]
+    assert JsonPath.compile("$.missing[*]").evaluate(document) == []
+
+
+def test_evaluate_missing():
+    assert JsonPath.compile("data['missing']").evaluate(document) is MISSING
+    assert JsonPath.compile("$.results[5].hash").evaluate(document) is MISSING
+    assert JsonPath.compile("$.contractAddress.nested").evaluate(document) is MISSING
+    assert str(MISSING) == ""
+
+
+def test_compile_rejects_code():
+    for expression in ["data['a'] + 1", "__import__('os')", "data.keys()", "$.results[0"]:
+        with pytest.raises(errors.BadUsage):
+            JsonPath.compile(expression)
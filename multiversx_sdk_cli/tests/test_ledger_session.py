@@ -0,0 +1,84 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from multiversx_sdk import Address, Transaction, TransactionComputer
+
+from multiversx_sdk_cli import ledger_session
+from multiversx_sdk_cli.cli import main
+
+alice = "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
+bob = "erd1k2s324ww2g0yj38qn2ch2jwctdy8mnfxep94q9arncc6xecg3xaq6mjse8"
+
+
+class LedgerAppMock:
+    num_connections = 0
+
+    def __init__(self) -> None:
+        LedgerAppMock.num_connections += 1
+        self.signed: list[bytes] = []
+
+    def get_address(self, address_index: int = 0) -> str:
+        return [alice, bob][address_index]
+
+    def set_address(self, address_index: int = 0):
+        pass
+
+    def get_version(self) -> str:
+        return "1.0.22"
+
+    def sign_transaction(self, tx_bytes: bytes) -> str:
+        self.signed.append(tx_bytes)
+        return bytes([len(self.signed)] * 64).hex()
+
+    def close(self):
+        pass
+
+
+def test_sign_transactions_in_one_session(monkeypatch: Any, capsys: Any, tmp_path: Path):
+    monkeypatch.setattr(ledger_session, "LedgerApp", LedgerAppMock)
+    LedgerAppMock.num_connections = 0
+
+    infile = tmp_path / "txs.jsonl"
+    outfile = tmp_path / "signed.jsonl"
+
+    with open(infile, "w") as f:
+        for nonce in range(3):
+            tx = Transaction(
+                sender=Address.new_from_bech32(alice),
+                receiver=Address.new_from_bech32(bob),
+                gas_limit=50000,
+                chain_id="D",
+                nonce=nonce,
+                data=b"x" * 1000,
+            )
+            f.write(json.dumps({"emittedTransaction": tx.to_dictionary()}) + "\n")
+
+    return_code = main(["ledger", "sign-transactions", "--infile", str(infile), "--outfile", str(outfile)])
+    assert not return_code
+    assert LedgerAppMock.num_connections == 1
+
+    lines = outfile.read_text().splitlines()
+    assert len(lines) == 3
+
+    for i, line in enumerate(lines):
+        tx = Transaction.new_from_dictionary(json.loads(line))
+        assert tx.nonce == i
+        assert tx.signature == bytes([i + 1] * 64)
+        assert TransactionComputer().has_options_set_for_hash_signing(tx)
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["numSignatures"] == 3
+
+
+def test_sign_transactions_with_wrong_sender(monkeypatch: Any, tmp_path: Path):
+    monkeypatch.setattr(ledger_session, "LedgerApp", LedgerAppMock)
+
+    infile = tmp_path / "txs.jsonl"
+    tx = Transaction(
+        sender=Address.new_from_bech32(bob), receiver=Address.new_from_bech32(alice), gas_limit=50000, chain_id="D"
+    )
+    infile.write_text(json.dumps(tx.to_dictionary()) + "\n")
+
+    return_code = main(["ledger", "sign-transactions", "--infile", str(infile), "--outfile", str(tmp_path / "out")])
+    assert return_code
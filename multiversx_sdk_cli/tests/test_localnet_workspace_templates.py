@@ -0,0 +1,47 @@
+from pathlib import Path
+from typing import Any
+
+from multiversx_sdk_cli import utils
+from multiversx_sdk_cli.localnet import workspace_templates
+from multiversx_sdk_cli.localnet.config_root import ConfigRoot
+
+
+def test_store_and_instantiate_template(monkeypatch: Any, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(workspace_templates, "TEMPLATES_FOLDER", tmp_path / "templates")
+
+    config = ConfigRoot()
+    fingerprint = "abcdef"
+
+    for config_folder in config.all_nodes_config_folders():
+        utils.ensure_folder(config_folder)
+        utils.write_json_file(config_folder / "nodesSetup.json", {"startTime": 42, "initialNodes": []})
+        utils.write_file(config_folder / "config.toml", "foo = 'bar'")
+
+    assert not workspace_templates.instantiate(config, fingerprint)
+
+    workspace_templates.store(config, fingerprint)
+    assert (tmp_path / "templates" / fingerprint).is_dir()
+    assert not list((tmp_path / "templates").glob("*.tmp"))
+
+    utils.remove_folder(config.root())
+    assert workspace_templates.instantiate(config, fingerprint)
+
+    for config_folder in config.all_nodes_config_folders():
+        nodes_setup = utils.read_json_file(config_folder / "nodesSetup.json")
+        assert nodes_setup["startTime"] > 42
+        assert (config_folder / "config.toml").read_text() == "foo = 'bar'"
+
+
+def test_prune_templates(monkeypatch: Any, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(workspace_templates, "TEMPLATES_FOLDER", tmp_path / "templates")
+    monkeypatch.setattr(workspace_templates, "MAX_NUM_TEMPLATES", 2)
+
+    config = ConfigRoot()
+    utils.ensure_folder(config.root())
+
+    for fingerprint in ["a", "b", "c"]:
+        workspace_templates.store(config, fingerprint)
+
+    assert len(list((tmp_path / "templates").iterdir())) == 2
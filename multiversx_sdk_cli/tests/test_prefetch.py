@@ -0,0 +1,51 @@
+import threading
+
+import pytest
+
+from multiversx_sdk_cli.prefetch import Prefetcher
+
+
+def test_prefetcher_memoizes_results():
+    prefetcher = Prefetcher()
+    calls: list[int] = []
+
+    def fetch(value: int) -> int:
+        calls.append(value)
+        return value * 2
+
+    prefetcher.submit("a", fetch, 21)
+    assert prefetcher.get("a", fetch, 21) == 42
+    assert prefetcher.get("a", fetch, 21) == 42
+    assert calls == [21]
+
+
+def test_prefetcher_does_not_memoize_failures():
+    prefetcher = Prefetcher()
+    attempts: list[int] = []
+
+    def fetch() -> str:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError("unreachable")
+        return "ok"
+
+    with pytest.raises(ConnectionError):
+        prefetcher.get("b", fetch)
+
+    assert prefetcher.get("b", fetch) == "ok"
+    assert len(attempts) == 2
+
+
+def test_prefetcher_does_not_keep_the_process_alive():
+    prefetcher = Prefetcher()
+    released = threading.Event()
+
+    def fetch() -> bool:
+        released.wait()
+        return threading.current_thread().daemon
+
+    future = prefetcher.submit("c", fetch)
+    assert not future.done()
+
+    released.set()
+    assert prefetcher.get("c", fetch) is True
@@ -0,0 +1,139 @@
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from multiversx_sdk import Account, Address, ProxyNetworkProvider, Transaction
+
+from multiversx_sdk_cli import cli_shared
+from multiversx_sdk_cli.cli import main
+
+testdata_path = Path(__file__).parent / "testdata"
+alice = Account.new_from_pem(testdata_path / "alice.pem")
+relayer = Account.new_from_pem(testdata_path / "testUser.pem")
+receiver = Address.new_from_bech32("erd1qqqqqqqqqqqqqpgqf97pgqdy0tstwauxu09kszz020hp5kgqqzzsscqtww")
+
+
+def test_relay_batch(capsys: Any, tmp_path: Path):
+    infile = tmp_path / "inner.jsonl"
+    lines = [
+        _create_signed_transaction(0),
+        _create_signed_transaction(1, relayer=alice.address),
+        _create_signed_transaction(2, signed=False),
+        None,
+        _create_signed_transaction(0),
+        _create_signed_transaction(3),
+    ]
+    infile.write_text("\n".join(json.dumps(tx.to_dictionary()) if tx else "{not json" for tx in lines) + "\n")
+
+    return_code = main(
+        ["tx", "relay-batch", "--relayer-pem", str(testdata_path / "testUser.pem"), "--infile", str(infile)]
+    )
+    assert return_code == 0
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["numTransactions"] == 6
+    assert report["numRelayed"] == 2
+    assert report["numRejected"] == 4
+
+    items = report["items"]
+    assert [item["status"] for item in items] == ["relayed", "rejected", "rejected", "rejected", "rejected", "relayed"]
+    assert "the relayer of the transaction is" in items[1]["error"]
+    assert items[2]["error"] == "missing or invalid signature of the sender"
+    assert items[3]["source"].endswith("inner.jsonl:4")
+    assert items[4]["error"] == "duplicated nonce of the sender"
+
+    expected = _create_signed_transaction(3)
+    expected.relayer_signature = relayer.sign_transaction(expected)
+    assert items[5]["tx"] == expected.to_dictionary()
+
+    rejects = (tmp_path / "inner.rejects.jsonl").read_text().splitlines()
+    assert len(rejects) == 4
+    assert json.loads(rejects[0])["tx"]["nonce"] == 1
+
+
+def test_relay_batch_from_directory_and_send(capsys: Any, monkeypatch: Any, tmp_path: Path):
+    def send_transactions(self: Any, transactions: list[Transaction]) -> tuple[int, list[bytes]]:
+        assert all(tx.relayer_signature for tx in transactions)
+        return 1, [bytes(32), b""]
+
+    monkeypatch.setattr(ProxyNetworkProvider, "send_transactions", send_transactions)
+    monkeypatch.setattr(cli_shared, "get_network_config", lambda _: SimpleNamespace(raw={"erd_address_hrp": "erd"}))
+
+    folder = tmp_path / "inner"
+    folder.mkdir()
+    for nonce in range(2):
+        tx = _create_signed_transaction(nonce)
+        (folder / f"tx-{nonce}.json").write_text(json.dumps({"emittedTransaction": tx.to_dictionary()}))
+
+    rejects_file = tmp_path / "rejects.jsonl"
+    return_code = main(
+        [
+            "tx",
+            "relay-batch",
+            "--relayer-pem",
+            str(testdata_path / "testUser.pem"),
+            "--infile",
+            str(folder),
+            "--rejects-file",
+            str(rejects_file),
+            "--send",
+            "--proxy",
+            "https://testnet-api.multiversx.com",
+        ]
+    )
+    assert return_code == 0
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["numSent"] == 1
+    assert [item["status"] for item in report["items"]] == ["sent", "notAccepted"]
+    assert "tx" not in report["items"][0]
+    assert json.loads(rejects_file.read_text())["source"].endswith("tx-1.json")
+
+
+def test_relay_batch_keeps_going_when_a_request_fails(capsys: Any, monkeypatch: Any, tmp_path: Path):
+    num_requests: list[int] = []
+
+    def send_transactions(self: Any, transactions: list[Transaction]) -> tuple[int, list[bytes]]:
+        num_requests.append(len(transactions))
+        if len(num_requests) == 1:
+            raise ConnectionError("connection reset")
+        return len(transactions), [bytes(32)] * len(transactions)
+
+    monkeypatch.setattr(ProxyNetworkProvider, "send_transactions", send_transactions)
+    monkeypatch.setattr(cli_shared, "get_network_config", lambda _: SimpleNamespace(raw={"erd_address_hrp": "erd"}))
+
+    infile = tmp_path / "inner.jsonl"
+    infile.write_text(
+        "".join(json.dumps(_create_signed_transaction(nonce).to_dictionary()) + "\n" for nonce in range(150))
+    )
+
+    args = ["tx", "relay-batch", "--relayer-pem", str(testdata_path / "testUser.pem"), "--infile", str(infile)]
+    assert main(args + ["--send", "--proxy", "https://testnet-api.multiversx.com"]) == 0
+    assert num_requests == [100, 50]
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["numSent"] == 50
+    assert report["numRejected"] == 100
+    assert report["items"][0]["status"] == "notSent"
+    assert report["items"][0]["error"] == "could not be sent: connection reset"
+    assert report["items"][100]["status"] == "sent"
+
+    # The transactions not sent can be relayed (and sent) again, from the rejects file.
+    rejects = (tmp_path / "inner.rejects.jsonl").read_text().splitlines()
+    assert [json.loads(line)["tx"]["nonce"] for line in rejects] == list(range(100))
+
+
+def _create_signed_transaction(nonce: int, relayer: Address = relayer.address, signed: bool = True) -> Transaction:
+    transaction = Transaction(
+        sender=alice.address,
+        receiver=receiver,
+        gas_limit=100_000,
+        chain_id="D",
+        nonce=nonce,
+        relayer=relayer,
+    )
+
+    if signed:
+        transaction.signature = alice.sign_transaction(transaction)
+    return transaction
@@ -1,7 +1,14 @@
+import threading
+from argparse import Namespace
+from pathlib import Path
+from typing import Any
+
 from multiversx_sdk import Address
 
+from multiversx_sdk_cli import cli_shared
 from multiversx_sdk_cli.args_converter import convert_args_to_typed_values
 from multiversx_sdk_cli.cli_shared import prepare_token_transfers
+from multiversx_sdk_cli.prefetch import prefetcher
 
 
 def test_prepare_token_tranfers():
@@ -56,3 +63,38 @@ def test_prepare_args_for_factories():
         arguments[5].get_payload()
         == Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th").get_public_key()
     )
+
+
+def test_prepare_sender_fetches_network_data_concurrently(monkeypatch: Any):
+    # Each fetch waits for the other two; if they weren't concurrent, the barrier would time out.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def wait_and_return(value: Any) -> Any:
+        barrier.wait()
+        return value
+
+    monkeypatch.setattr(cli_shared, "get_current_nonce_for_address", lambda address, proxy: wait_and_return(42))
+    monkeypatch.setattr(cli_shared, "_do_fetch_guardian_data", lambda address, proxy: wait_and_return({}))
+    monkeypatch.setattr(cli_shared, "_do_fetch_network_config", lambda proxy: wait_and_return(None))
+    prefetcher.clear()
+
+    args = Namespace(
+        pem=str(Path(__file__).parent / "testdata" / "alice.pem"),
+        sender_wallet_index=0,
+        hrp="erd",
+        proxy="https://devnet-api.multiversx.com",
+        nonce=None,
+        chain=None,
+        guardian=None,
+        guardian_pem=None,
+        guardian_keyfile=None,
+        guardian_ledger=False,
+    )
+
+    sender = cli_shared.prepare_sender(args)
+    assert sender.nonce == 42
+    assert not barrier.broken
+
+    # Memoized.
+    assert cli_shared._fetch_guardian_data(sender.address.to_bech32(), args.proxy) == {}
+    prefetcher.clear()
@@ -0,0 +1,99 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from multiversx_sdk import Address
+from multiversx_sdk.network_providers.resources import GenericResponse
+
+from multiversx_sdk_cli import errors
+from multiversx_sdk_cli.cli import main
+from multiversx_sdk_cli.pooled_proxy import PooledProxyNetworkProvider
+from multiversx_sdk_cli.storage_entries import (
+    StorageValueDecoder,
+    expand_key_template,
+    parse_range,
+)
+
+testdata_path = Path(__file__).parent / "testdata"
+contract = "erd1qqqqqqqqqqqqqpgqf97pgqdy0tstwauxu09kszz020hp5kgqqzzsscqtww"
+alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+bob = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
+
+
+def test_expand_key_template():
+    keys = list(expand_key_template("balance{address}", [alice, bob], range(0)))
+    assert [key.name for key in keys] == [f"balance{{{alice.to_bech32()}}}", f"balance{{{bob.to_bech32()}}}"]
+    assert keys[0].key == b"balance" + alice.get_public_key()
+
+    keys = list(expand_key_template("items.item{index}", [], parse_range("1:3")))
+    assert [key.key for key in keys] == [b"items.item" + i.to_bytes(4, "big") for i in [1, 2, 3]]
+
+    keys = list(expand_key_template("{0x01ff}stake{address}.{index}", [alice], parse_range("7:7")))
+    assert keys[0].key == bytes.fromhex("01ff") + b"stake" + alice.get_public_key() + b"." + bytes([0, 0, 0, 7])
+
+    assert [key.key for key in expand_key_template("owner", [alice], range(0))] == [b"owner"]
+
+    with pytest.raises(errors.BadUsage):
+        list(expand_key_template("balance{address}", [], range(0)))
+
+
+def test_storage_value_decoder():
+    assert StorageValueDecoder("BigUint").decode(bytes.fromhex("0de0b6b3a7640000")) == 10**18
+    assert StorageValueDecoder("List<u32>").decode(bytes.fromhex("0000000100000002")) == [1, 2]
+    assert StorageValueDecoder("BigUint").decode(b"") == 0
+
+    with pytest.raises(errors.BadUsage):
+        StorageValueDecoder("UnknownType")
+
+
+def test_storage_value_decoder_with_abi():
+    decoder = StorageValueDecoder("EsdtTokenPayment", testdata_path / "multisig.abi.json")
+    payment = decoder.decode(bytes.fromhex("00000004544553540000000000000000000000010a"))
+    assert (payment.token_identifier, payment.token_nonce, payment.amount) == ("TEST", 0, 10)
+
+
+def test_get_storage_entries(capsys: Any, monkeypatch: Any, tmp_path: Path):
+    values = {(b"balance" + alice.get_public_key()).hex(): "0a", (b"balance" + bob.get_public_key()).hex(): ""}
+
+    def do_get_generic(self: Any, url: str) -> GenericResponse:
+        key = url.split("/")[-1]
+        if key not in values:
+            raise Exception("unknown key")
+        return GenericResponse({"value": values[key]})
+
+    monkeypatch.setattr(PooledProxyNetworkProvider, "do_get_generic", do_get_generic)
+
+    addresses_file = tmp_path / "addresses.txt"
+    addresses_file.write_text(f"{alice.to_bech32()}\n# comment\n{bob.to_bech32()}\n")
+
+    return_code = main(
+        [
+            "get",
+            "storage-entry",
+            "--address",
+            contract,
+            "--key",
+            "balance{address}",
+            "--key",
+            "owner",
+            "--addresses-file",
+            str(addresses_file),
+            "--value-type",
+            "BigUint",
+            "--proxy",
+            "https://testnet-api.multiversx.com",
+        ]
+    )
+    assert return_code == 0
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record["key"] for record in records] == [
+        f"balance{{{alice.to_bech32()}}}",
+        f"balance{{{bob.to_bech32()}}}",
+        "owner",
+    ]
+    assert records[0]["value"] == "0a"
+    assert records[0]["decodedValue"] == 10
+    assert records[1]["decodedValue"] == 0
+    assert records[2]["error"] == "unknown key"
@@ -0,0 +1,77 @@
+import json
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+from multiversx_sdk_cli import errors
+from multiversx_sdk_cli.cli import main
+from multiversx_sdk_cli.pooled_proxy import PooledProxyNetworkProvider
+from multiversx_sdk_cli.storage_streaming import decode_key, parse_storage_pairs
+
+contract = "erd1qqqqqqqqqqqqqpgqf97pgqdy0tstwauxu09kszz020hp5kgqqzzsscqtww"
+balances_key = (b"balances" + bytes(32)).hex()
+owner_key = b"owner".hex()
+counter_key = "01ff"
+
+
+def test_parse_storage_pairs_in_small_chunks():
+    response = _create_response({balances_key: "0a", owner_key: "", counter_key: "07"})
+    chunks = [response[i : i + 7] for i in range(0, len(response), 7)]
+
+    assert list(parse_storage_pairs(chunks)) == [(balances_key, "0a"), (owner_key, ""), (counter_key, "07")]
+    assert list(parse_storage_pairs([_create_response({})])) == []
+
+    with pytest.raises(errors.BadUserInput):
+        list(parse_storage_pairs([response[: len(response) // 2]]))
+
+
+def test_decode_key():
+    assert decode_key(balances_key) == {"prefix": "balances", "rest": bytes(32).hex()}
+    assert decode_key(owner_key) == {"prefix": "owner", "rest": ""}
+    assert decode_key(counter_key) == {"prefix": "", "rest": counter_key}
+
+
+def test_get_storage_stream_snapshot_and_diff(capsys: Any, monkeypatch: Any, tmp_path: Path):
+    storage = {balances_key: "0a", owner_key: "aa", counter_key: "07"}
+
+    def do_get_streamed(self: Any, url: str) -> Iterator[bytes]:
+        assert url == f"address/{contract}/keys"
+        yield _create_response(storage)
+
+    monkeypatch.setattr(PooledProxyNetworkProvider, "do_get_streamed", do_get_streamed)
+
+    args = ["get", "storage", "--address", contract, "--proxy", "https://testnet-api.multiversx.com"]
+    snapshot = tmp_path / "storage.jsonl.gz"
+
+    assert main(args + ["--snapshot", str(snapshot)]) == 0
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["key"] for line in lines] == [balances_key, owner_key, counter_key]
+    assert lines[0]["decodedKey"]["prefix"] == "balances"
+
+    assert main(args + ["--prefix", "owner"]) == 0
+    assert [json.loads(line)["value"] for line in capsys.readouterr().out.splitlines()] == ["aa"]
+
+    storage = {balances_key: "0b", counter_key: "07", "02": "01"}
+    assert main(args + ["--diff", str(snapshot)]) == 0
+    changes = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(change["key"], change["status"]) for change in changes] == [
+        (balances_key, "modified"),
+        ("02", "added"),
+        (owner_key, "removed"),
+    ]
+    assert changes[0]["previousValue"] == "0a"
+
+    # The snapshot is filtered by the same prefix as the live pairs: the other keys are not reported as removed.
+    assert main(args + ["--diff", str(snapshot), "--prefix", "balances"]) == 0
+    changes = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(change["key"], change["status"]) for change in changes] == [(balances_key, "modified")]
+
+    storage = {counter_key: "07"}
+    assert main(args + ["--diff", str(snapshot), "--prefix", "0x01"]) == 0
+    assert capsys.readouterr().out == ""
+
+
+def _create_response(pairs: dict[str, str]) -> bytes:
+    response = {"data": {"blockInfo": {"nonce": 42}, "pairs": pairs}, "error": "", "code": "successful"}
+    return json.dumps(response, indent=2).encode()
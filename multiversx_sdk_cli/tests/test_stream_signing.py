@@ -0,0 +1,97 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from multiversx_sdk import Account, Address, Transaction, UserPEM
+
+from multiversx_sdk_cli import cli_password, stream_signing
+from multiversx_sdk_cli.cli import main
+from multiversx_sdk_cli.transactions import save_transactions_to_jsonl
+
+testdata_path = Path(__file__).parent / "testdata"
+receiver = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
+
+
+@pytest.mark.parametrize("concurrency", ["1", "2"])
+def test_sign_stream(capsys: Any, monkeypatch: Any, tmp_path: Path, concurrency: str):
+    monkeypatch.setattr(stream_signing, "CHUNK_SIZE", 2)
+
+    accounts = [Account(entry.secret_key) for entry in UserPEM.from_file_all(testdata_path / "multiple_addresses.pem")]
+    transactions = [_create_transaction(accounts[nonce % len(accounts)].address, nonce) for nonce in range(7)]
+
+    infile = tmp_path / "txs.jsonl"
+    with open(infile, "w") as f:
+        save_transactions_to_jsonl(transactions, f)
+        f.write("\n")
+
+    return_code = main(
+        [
+            "tx",
+            "sign",
+            "--stream",
+            "--pem",
+            str(testdata_path / "multiple_addresses.pem"),
+            "--infile",
+            str(infile),
+            "--concurrency",
+            concurrency,
+        ]
+    )
+    assert return_code == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == len(transactions)
+
+    for line, transaction in zip(lines, transactions):
+        account = accounts[transaction.nonce % len(accounts)]
+        assert json.loads(line)["signature"] == account.sign_transaction(transaction).hex()
+
+
+def test_sign_stream_with_keystores_map(capsys: Any, monkeypatch: Any, tmp_path: Path):
+    monkeypatch.setattr(cli_password, "getpass", lambda _: "password")  # type: ignore
+
+    alice = Account.new_from_keystore(testdata_path / "alice.json", "password")
+    keystores_map = tmp_path / "keystores.json"
+    keystores_map.write_text(json.dumps({alice.address.to_bech32(): str(testdata_path / "alice.json")}))
+
+    infile = tmp_path / "txs.jsonl"
+    with open(infile, "w") as f:
+        save_transactions_to_jsonl([_create_transaction(alice.address, 42)], f)
+
+    return_code = main(
+        ["tx", "sign", "--stream", "--keystores-map", str(keystores_map), "--infile", str(infile), "--concurrency", "1"]
+    )
+    assert return_code == 0
+
+    signed = json.loads(capsys.readouterr().out)
+    assert signed["signature"] == alice.sign_transaction(_create_transaction(alice.address, 42)).hex()
+
+
+def test_sign_stream_with_unknown_sender(caplog: Any, tmp_path: Path):
+    infile = tmp_path / "txs.jsonl"
+    with open(infile, "w") as f:
+        unknown = Address.new_from_bech32("erd1qqqqqqqqqqqqqpgqf97pgqdy0tstwauxu09kszz020hp5kgqqzzsscqtww")
+        save_transactions_to_jsonl([_create_transaction(receiver, 0), _create_transaction(unknown, 1)], f)
+
+    return_code = main(
+        [
+            "tx",
+            "sign",
+            "--stream",
+            "--pem",
+            str(testdata_path / "multiple_addresses.pem"),
+            "--infile",
+            str(infile),
+            "--outfile",
+            str(tmp_path / "signed.jsonl"),
+            "--concurrency",
+            "1",
+        ]
+    )
+    assert return_code == 1
+    assert "no key for the sender on line 2" in caplog.text
+
+
+def _create_transaction(sender: Address, nonce: int) -> Transaction:
+    return Transaction(sender=sender, receiver=receiver, gas_limit=50_000, chain_id="D", nonce=nonce, value=nonce)
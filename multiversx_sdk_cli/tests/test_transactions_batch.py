@@ -0,0 +1,224 @@
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from multiversx_sdk import (
+    Account,
+    Address,
+    ProxyNetworkProvider,
+    Transaction,
+    TransactionComputer,
+)
+
+from multiversx_sdk_cli import errors
+from multiversx_sdk_cli.cli import main
+from multiversx_sdk_cli.transactions import (
+    save_transactions_to_jsonl,
+    send_and_wait_for_results,
+)
+from multiversx_sdk_cli.transactions_batch import (
+    TransactionsBatchReader,
+    TransactionsBatchWriter,
+    is_transactions_batch,
+    load_transactions_from_batch,
+    save_transactions_to_batch,
+)
+
+testdata_path = Path(__file__).parent / "testdata"
+alice = Account.new_from_pem(testdata_path / "alice.pem")
+bob = Account.new_from_pem(testdata_path / "testUser.pem")
+receiver = Address.new_from_bech32("erd1qqqqqqqqqqqqqpgqf97pgqdy0tstwauxu09kszz020hp5kgqqzzsscqtww")
+
+
+def test_save_and_load(tmp_path: Path):
+    transactions = [_create_transaction(nonce) for nonce in range(5)]
+    transactions[1].data = b"add@07"
+    transactions[2].relayer = bob.address
+    transactions[3].guardian = bob.address
+    transactions[3].options = 2
+    transactions[4].signature = alice.sign_transaction(transactions[4])
+
+    with open(tmp_path / "txs.mxtxb", "wb") as f:
+        assert save_transactions_to_batch(transactions, f) == 5
+
+    with open(tmp_path / "txs.mxtxb", "rb") as f:
+        assert is_transactions_batch(f)
+        loaded = load_transactions_from_batch(f)
+
+    assert [tx.to_dictionary() for tx in loaded] == [tx.to_dictionary() for tx in transactions]
+
+
+def test_random_access_over_many_blocks():
+    transactions = [_create_transaction(nonce) for nonce in range(10)]
+    transactions[7].sender = bob.address
+
+    f = io.BytesIO()
+    with TransactionsBatchWriter(f, num_records_per_block=3) as writer:
+        for tx in transactions:
+            writer.write(tx)
+    assert len(writer.block_offsets) == 4
+
+    reader = TransactionsBatchReader(io.BytesIO(f.getvalue()))
+    computer = TransactionComputer()
+    assert len(reader) == 10
+    assert reader.get_hashes() == [computer.compute_transaction_hash(tx) for tx in transactions]
+
+    assert reader.get(8).nonce == 8
+    assert reader.get_by_nonce(7)[0].sender == bob.address
+    assert reader.get_by_hash(computer.compute_transaction_hash(transactions[4])).nonce == 4  # type: ignore
+    assert reader.get_by_hash(bytes(32)) is None
+
+
+def test_load_bad_input():
+    with pytest.raises(errors.BadUserInput, match="bad magic bytes"):
+        TransactionsBatchReader(io.BytesIO(b"{}\n" * 100))
+
+    f = io.BytesIO()
+    save_transactions_to_batch([_create_transaction(0)], f)
+    with pytest.raises(errors.BadUserInput, match="truncated"):
+        TransactionsBatchReader(io.BytesIO(f.getvalue()[:-4]))
+
+
+def test_pack_sign_relay_unpack(capsys: Any, tmp_path: Path):
+    transactions = [_create_transaction(nonce) for nonce in range(3)]
+    for tx in transactions:
+        tx.relayer = bob.address
+
+    jsonl_file = tmp_path / "txs.jsonl"
+    with open(jsonl_file, "w") as f:
+        save_transactions_to_jsonl(transactions, f)
+
+    batch_file = tmp_path / "txs.mxtxb"
+    signed_file = tmp_path / "signed.mxtxb"
+    relayed_file = tmp_path / "relayed.mxtxb"
+
+    assert main(["tx", "pack", "--infile", str(jsonl_file), "--outfile", str(batch_file)]) == 0
+    assert (
+        main(
+            [
+                "tx",
+                "sign",
+                "--pem",
+                str(testdata_path / "alice.pem"),
+                "--infile",
+                str(batch_file),
+                "--outfile",
+                str(signed_file),
+            ]
+        )
+        == 0
+    )
+    assert (
+        main(
+            [
+                "tx",
+                "relay",
+                "--relayer-pem",
+                str(testdata_path / "testUser.pem"),
+                "--infile",
+                str(signed_file),
+                "--outfile",
+                str(relayed_file),
+            ]
+        )
+        == 0
+    )
+
+    capsys.readouterr()
+    assert main(["tx", "unpack", "--infile", str(relayed_file)]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 3
+
+    for line, tx in zip(lines, transactions):
+        tx.signature = alice.sign_transaction(tx)
+        tx.relayer_signature = bob.sign_transaction(tx)
+        assert json.loads(line) == tx.to_dictionary()
+
+    hash = TransactionComputer().compute_transaction_hash(transactions[1]).hex()
+    assert main(["tx", "unpack", "--infile", str(relayed_file), "--hash", hash]) == 0
+    assert json.loads(capsys.readouterr().out)["nonce"] == 1
+
+    # The batch is for another relayer.
+    assert (
+        main(
+            [
+                "tx",
+                "relay",
+                "--relayer-pem",
+                str(testdata_path / "alice.pem"),
+                "--infile",
+                str(signed_file),
+                "--outfile",
+                str(relayed_file),
+            ]
+        )
+        == 1
+    )
+
+
+def test_send_batch_in_chunks(capsys: Any, monkeypatch: Any, tmp_path: Path):
+    requests: list[list[int]] = []
+
+    def send_transactions(self: Any, transactions: list[Transaction]) -> tuple[int, list[bytes]]:
+        requests.append([tx.nonce for tx in transactions])
+        if len(requests) == 2:
+            raise ConnectionError("timeout")
+        return len(transactions), [tx.nonce.to_bytes(32, "big") for tx in transactions]
+
+    monkeypatch.setattr(ProxyNetworkProvider, "send_transactions", send_transactions)
+
+    transactions = [_create_transaction(nonce) for nonce in range(250)]
+    for tx in transactions:
+        tx.signature = alice.sign_transaction(tx)
+
+    batch_file = tmp_path / "txs.mxtxb"
+    with open(batch_file, "wb") as f:
+        save_transactions_to_batch(transactions, f)
+
+    args = ["tx", "send", "--infile", str(batch_file), "--proxy", "https://testnet-api.multiversx.com"]
+    assert main(args) == 0
+
+    # The request of the second chunk failed: the results of the others are kept.
+    assert [len(nonces) for nonces in requests] == [100, 100, 50]
+    output = json.loads(capsys.readouterr().out)
+    assert output["numSent"] == 150
+    assert output["rejected"] == list(range(100, 200))
+    assert output["hashes"][201] == (201).to_bytes(32, "big").hex()
+    assert output["failedRequests"] == [{"first": 100, "last": 199, "error": "timeout"}]
+
+
+def test_do_not_await_transactions_blocked_by_rejected_nonce():
+    awaited: list[bytes] = []
+
+    class ProxyMock:
+        def send_transactions(self, transactions: list[Transaction]) -> tuple[int, list[bytes]]:
+            hashes = [b"" if tx.nonce == 1 else bytes([tx.nonce]) * 32 for tx in transactions]
+            return len(transactions) - 1, hashes
+
+        def await_transaction_completed(self, transaction_hash: bytes, options: Any = None) -> Any:
+            awaited.append(transaction_hash)
+            return transaction_hash
+
+    transactions = [_create_transaction(nonce) for nonce in range(4)]
+    transactions[3].sender = bob.address
+    for tx in transactions:
+        tx.signature = b"\x00" * 64
+
+    results = send_and_wait_for_results(transactions, ProxyMock(), timeout=1)  # type: ignore
+
+    # Nonce 2 of alice waits for the rejected nonce 1; bob's transaction is not affected.
+    assert results == [bytes([0]) * 32, None, None, bytes([3]) * 32]
+    assert sorted(awaited) == [bytes([0]) * 32, bytes([3]) * 32]
+
+
+def _create_transaction(nonce: int) -> Transaction:
+    return Transaction(
+        sender=alice.address,
+        receiver=receiver,
+        gas_limit=100_000,
+        chain_id="D",
+        nonce=nonce,
+        value=nonce * 10**18,
+    )
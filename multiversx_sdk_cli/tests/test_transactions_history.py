@@ -0,0 +1,112 @@
+import base64
+import csv
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+from multiversx_sdk import Address
+
+from multiversx_sdk_cli import errors, transactions_history
+from multiversx_sdk_cli.cli import main
+from multiversx_sdk_cli.pooled_proxy import PooledApiNetworkProvider
+from multiversx_sdk_cli.transactions_history import parse_time
+
+alice = "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
+bob = "erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx"
+contract = "erd1qqqqqqqqqqqqqpgqf97pgqdy0tstwauxu09kszz020hp5kgqqzzsscqtww"
+timestamps = [100, 100, 101, 102, 102, 102, 103, 104, 105, 106]
+
+
+def test_parse_time():
+    assert parse_time("1700000000") == 1700000000
+    assert parse_time("2024-01-01") == 1704067200
+    assert parse_time("2024-01-01T02:00:00+02:00") == 1704067200
+
+    with pytest.raises(errors.BadUsage):
+        parse_time("yesterday")
+
+
+def test_get_transactions_with_cursor_and_resume(monkeypatch: Any, tmp_path: Path):
+    transactions = [_create_transaction(index, timestamp) for index, timestamp in enumerate(timestamps)]
+    requests: list[dict[str, Any]] = []
+
+    def do_get_generic(self: Any, url: str, url_parameters: Optional[dict[str, Any]] = None) -> Any:
+        assert url == f"accounts/{alice}/transactions"
+        assert url_parameters is not None
+        requests.append(url_parameters)
+
+        after, before = url_parameters.get("after", 0), url_parameters.get("before", 10**10)
+        start, size = url_parameters["from"], url_parameters["size"]
+        listing = [tx for tx in transactions if after <= tx["timestamp"] <= before]
+        return listing[start : start + size]
+
+    monkeypatch.setattr(PooledApiNetworkProvider, "do_get_generic", do_get_generic)
+    # Small listings, so that the export has to continue from a cursor (a timestamp shared by many transactions).
+    monkeypatch.setattr(transactions_history, "MAX_LISTING_WINDOW", 5)
+
+    outfile = tmp_path / "history.csv"
+    args = ["get", "transactions", "--address", alice, "--outfile", str(outfile), "--page-size", "2"]
+    args += ["--api", "https://testnet-api.multiversx.com"]
+
+    assert main(args + ["--to", "104"]) == 0
+    assert [record["hash"] for record in _read_records(outfile)] == [f"{i:064x}" for i in range(8)]
+
+    assert main(args + ["--resume"]) == 0
+    records = _read_records(outfile)
+    assert [record["hash"] for record in records] == [f"{i:064x}" for i in range(10)]
+    assert all(request["order"] == "asc" for request in requests)
+
+    assert records[0]["direction"] == "out"
+    assert records[0]["function"] == ""
+    assert records[1]["direction"] == "in"
+    assert records[1]["function"] == "ESDTTransfer"
+    assert records[1]["transfers"] == '[{"token": "FOO-abcdef", "amount": "1000"}]'
+    assert records[2]["function"] == "claim"
+    assert records[2]["receiver"] == contract
+
+
+def test_transaction_from_listing_item():
+    item = _create_transaction(1, 100)
+    transaction = transactions_history.transaction_from_listing_item(item)
+
+    assert transaction.raw == item
+    assert transaction.hash.hex() == f"{1:064x}"
+    assert transaction.sender.to_bech32() == bob
+    assert transaction.receiver.to_bech32() == alice
+    assert transaction.nonce == 1
+    assert transaction.timestamp == 100
+    assert transaction.value == 1
+    assert transaction.data == b"ESDTTransfer@" + b"FOO-abcdef".hex().encode() + b"@03e8"
+    assert transaction.status.is_successful
+
+    record = transactions_history.to_history_record(Address.new_from_bech32(alice), item)
+    assert record["function"] == "ESDTTransfer"
+    assert record["value"] == "1"
+
+
+def _create_transaction(index: int, timestamp: int) -> dict[str, Any]:
+    kind = index % 3
+    if kind == 0:
+        sender, receiver, data = alice, bob, b""
+    elif kind == 1:
+        sender, receiver, data = bob, alice, b"ESDTTransfer@" + b"FOO-abcdef".hex().encode() + b"@03e8"
+    else:
+        sender, receiver, data = alice, contract, b"claim@01"
+
+    return {
+        "txHash": f"{index:064x}",
+        "timestamp": timestamp,
+        "nonce": index,
+        "sender": sender,
+        "receiver": receiver,
+        "value": "1",
+        "data": base64.b64encode(data).decode(),
+        "status": "success",
+        "fee": "50000000000000",
+        "gasUsed": 50000,
+    }
+
+
+def _read_records(path: Path) -> list[dict[str, str]]:
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
@@ -0,0 +1,120 @@
+import base64
+import csv
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from multiversx_sdk import AwaitingOptions, TransactionOnNetwork
+from multiversx_sdk.abi import Abi
+from multiversx_sdk.network_providers.http_resources import (
+    transaction_from_proxy_response,
+)
+
+from multiversx_sdk_cli.cli import main
+from multiversx_sdk_cli.pooled_proxy import PooledProxyNetworkProvider
+from multiversx_sdk_cli.transactions_lookup import TransactionsLookup
+
+testdata_path = Path(__file__).parent / "testdata"
+alice = "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
+contract = "erd1qqqqqqqqqqqqqpgqf97pgqdy0tstwauxu09kszz020hp5kgqqzzsscqtww"
+completed_hash = "aa" * 32
+pending_hash = "bb" * 32
+missing_hash = "cc" * 32
+
+
+def test_transaction_to_record_with_abi():
+    abi = Abi.load(testdata_path / "multisig.abi.json")
+    lookup = TransactionsLookup(proxy=None, abi=abi)  # type: ignore
+
+    record = lookup.to_record(_create_transaction(completed_hash))
+    assert record["status"] == "success"
+    assert record["gasUsed"] == 4000000
+    assert record["fee"] == "100000000000000"
+    assert record["returnCode"] == "ok"
+    assert record["returnValues"] == [5]
+    assert record["events"] == [{"name": "asyncCallError", "values": SimpleNamespace(err_code=3, err_message=b"boom")}]
+
+    lookup = TransactionsLookup(proxy=None)  # type: ignore
+    record = lookup.to_record(_create_transaction(completed_hash))
+    assert record["returnValues"] == [bytes([5])]
+    assert "events" not in record
+
+
+def test_get_transactions_outcome(monkeypatch: Any, tmp_path: Path):
+    def get_transaction(self: Any, hash: str) -> TransactionOnNetwork:
+        if hash == missing_hash:
+            raise Exception("transaction not found")
+        return _create_transaction(hash, status="pending" if hash == pending_hash else "success")
+
+    def await_transaction_completed(self: Any, hash: str, options: AwaitingOptions) -> TransactionOnNetwork:
+        assert options.timeout_in_milliseconds == 30000
+        return _create_transaction(hash)
+
+    monkeypatch.setattr(PooledProxyNetworkProvider, "get_transaction", get_transaction)
+    monkeypatch.setattr(PooledProxyNetworkProvider, "await_transaction_completed", await_transaction_completed)
+
+    hashes_file = tmp_path / "hashes.txt"
+    hashes_file.write_text(f"{completed_hash}\n# comment\n{pending_hash}\n{missing_hash}\n")
+    outfile = tmp_path / "outcome.csv"
+
+    return_code = main(
+        [
+            "get",
+            "transaction",
+            "--hashes-file",
+            str(hashes_file),
+            "--outfile",
+            str(outfile),
+            "--format",
+            "csv",
+            "--wait",
+            "--timeout",
+            "30",
+            "--abi",
+            str(testdata_path / "multisig.abi.json"),
+            "--proxy",
+            "https://testnet-api.multiversx.com",
+        ]
+    )
+    assert return_code == 0
+
+    with open(outfile, newline="") as f:
+        records = list(csv.DictReader(f))
+
+    assert [record["hash"] for record in records] == [completed_hash, pending_hash, missing_hash]
+    assert [record["status"] for record in records] == ["success", "success", ""]
+    assert json.loads(records[1]["returnValues"]) == [5]
+    assert json.loads(records[1]["events"])[0]["values"] == {"err_code": 3, "err_message": b"boom".hex()}
+    assert records[2]["error"] == "transaction not found"
+
+
+def _create_transaction(hash: str, status: str = "success") -> TransactionOnNetwork:
+    response = {
+        "sender": alice,
+        "receiver": contract,
+        "nonce": 7,
+        "gasLimit": 5000000,
+        "gasUsed": 4000000,
+        "fee": "100000000000000",
+        "function": "proposeAsyncCall",
+        "status": status,
+        "smartContractResults": [{"sender": contract, "receiver": alice, "data": "@6f6b@05", "nonce": 8}],
+        "logs": {
+            "address": contract,
+            "events": [
+                {"address": contract, "identifier": "ESDTTransfer", "topics": [_base64(b"FOO-abcdef")]},
+                {
+                    "address": contract,
+                    "identifier": "proposeAsyncCall",
+                    "topics": [_base64(b"asyncCallError"), _base64(bytes([3])), _base64(b"boom")],
+                },
+            ],
+        },
+    }
+
+    return transaction_from_proxy_response(hash, response)
+
+
+def _base64(data: bytes) -> str:
+    return base64.b64encode(data).decode()
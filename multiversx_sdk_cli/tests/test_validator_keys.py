@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import pytest
+from multiversx_sdk import Address, ValidatorSigner, ValidatorsSigners
+
+from multiversx_sdk_cli.errors import BadUserInput
+from multiversx_sdk_cli.validator_keys import ValidatorKeysFile
+from multiversx_sdk_cli.validators_signing import sign_message_with_validator_keys
+
+parent = Path(__file__).parent
+validators_pem = parent / "testdata" / "validators.pem"
+
+
+def test_load_keys_file():
+    expected = ValidatorsSigners.new_from_pem(validators_pem)
+
+    with ValidatorKeysFile(validators_pem) as keys_file:
+        assert len(keys_file) == 3
+        assert [key.hex() for key in keys_file.get_public_keys()] == [key.hex() for key in expected.get_public_keys()]
+        assert [key.hex() for key in keys_file.get_secret_keys()] == [
+            signer.secret_key.hex() for signer in expected.get_signers()
+        ]
+
+
+def test_public_keys_are_derived_from_secret_keys(tmp_path: Path):
+    expected = ValidatorsSigners.new_from_pem(validators_pem)
+    labels = [key.hex() for key in expected.get_public_keys()]
+
+    # The labels of the first two keys are swapped.
+    content = validators_pem.read_text()
+    content = content.replace(labels[0], "first").replace(labels[1], labels[0]).replace("first", labels[1])
+    path = tmp_path / "mislabeled.pem"
+    path.write_text(content)
+
+    with ValidatorKeysFile(path) as keys_file:
+        assert keys_file.get_labels()[:2] == [labels[1], labels[0]]
+        assert [key.hex() for key in keys_file.get_public_keys()] == labels
+
+        # The lookup by public key (label) checks the decoded secret key.
+        with pytest.raises(BadUserInput):
+            keys_file.get_secret_key_by_public_key(labels[0])
+
+
+def test_get_secret_keys_by_public_key():
+    expected = ValidatorsSigners.new_from_pem(validators_pem)
+    public_keys = [key.hex() for key in expected.get_public_keys()]
+    secret_keys = [signer.secret_key.hex() for signer in expected.get_signers()]
+
+    with ValidatorKeysFile(validators_pem) as keys_file:
+        assert keys_file.find_index(public_keys[2]) == 2
+        assert keys_file.find_index("abba") is None
+        assert [key.hex() for key in keys_file.get_secret_keys([public_keys[2], public_keys[0]])] == [
+            secret_keys[2],
+            secret_keys[0],
+        ]
+
+        with pytest.raises(BadUserInput):
+            keys_file.get_secret_key_by_public_key("abba")
+
+
+def test_load_empty_keys_file(tmp_path: Path):
+    path = tmp_path / "empty.pem"
+    path.write_text("")
+
+    with ValidatorKeysFile(path) as keys_file:
+        assert len(keys_file) == 0
+        assert keys_file.get_signers() == []
+
+
+def test_sign_message_with_validator_keys():
+    message = Address.new_from_bech32("erd1qqqqqqqqqqqqqqqpqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqylllslmq6y6").get_public_key()
+
+    with ValidatorKeysFile(validators_pem) as keys_file:
+        secret_keys = keys_file.get_secret_keys()
+
+    public_keys, signatures = sign_message_with_validator_keys(secret_keys, message)
+
+    assert [key.hex() for key in public_keys] == [key.generate_public_key().hex() for key in secret_keys]
+    assert signatures == [ValidatorSigner(key).sign(message) for key in secret_keys]
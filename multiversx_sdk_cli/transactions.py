@@ -1,6 +1,7 @@
 import json
 import logging
-from typing import Optional, Protocol, TextIO, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional, Protocol, TextIO, Union
 
 from multiversx_sdk import AwaitingOptions, Transaction, TransactionOnNetwork
 
@@ -10,6 +11,9 @@ logger = logging.getLogger("transactions")
 
 
 ONE_SECOND_IN_MILLISECONDS = 1000
+MAX_NUM_CONCURRENT_AWAITS = 16
+# Large batches are broadcast in chunks (one request per chunk).
+MAX_NUM_TRANSACTIONS_PER_REQUEST = 100
 
 
 # fmt: off
@@ -17,6 +21,9 @@ class INetworkProvider(Protocol):
     def send_transaction(self, transaction: Transaction) -> bytes:
         ...
 
+    def send_transactions(self, transactions: list[Transaction]) -> tuple[int, list[bytes]]:
+        ...
+
     def await_transaction_completed(self, transaction_hash: Union[bytes, str], options: Optional[AwaitingOptions] = None) -> TransactionOnNetwork:
         ...
 # fmt: on
@@ -34,7 +41,100 @@ def send_and_wait_for_result(transaction: Transaction, proxy: INetworkProvider,
     return tx_on_network
 
 
+def send_and_wait_for_results(
+    transactions: list[Transaction], proxy: INetworkProvider, timeout: int
+) -> list[Optional[TransactionOnNetwork]]:
+    """
+    Broadcasts the transactions in one request, then awaits them concurrently. Transactions not accepted by the network
+    are not awaited (None is returned for them); neither are the ones with higher nonces from the same sender, since
+    they cannot be executed before the nonce gap is filled.
+    """
+    if not all(transaction.signature for transaction in transactions):
+        raise errors.TransactionIsNotSigned()
+
+    options = AwaitingOptions(timeout_in_milliseconds=timeout * ONE_SECOND_IN_MILLISECONDS)
+
+    num_accepted, hashes = proxy.send_transactions(transactions)
+    if num_accepted != len(transactions):
+        logger.warning(f"Only {num_accepted} out of {len(transactions)} transactions were accepted by the network.")
+
+    hashes = _skip_blocked_transactions(transactions, hashes)
+
+    def await_completed(tx_hash: bytes) -> Optional[TransactionOnNetwork]:
+        return proxy.await_transaction_completed(tx_hash, options) if tx_hash else None
+
+    with ThreadPoolExecutor(max_workers=min(len(hashes), MAX_NUM_CONCURRENT_AWAITS) or 1) as executor:
+        return list(executor.map(await_completed, hashes))
+
+
+def _skip_blocked_transactions(transactions: list[Transaction], hashes: list[bytes]) -> list[bytes]:
+    """Clears the hashes of the transactions that follow (by nonce) a rejected transaction of the same sender."""
+    first_rejected_nonces: dict[str, int] = {}
+    for transaction, tx_hash in zip(transactions, hashes):
+        if not tx_hash:
+            sender = transaction.sender.to_bech32()
+            first_rejected_nonces[sender] = min(transaction.nonce, first_rejected_nonces.get(sender, transaction.nonce))
+
+    result: list[bytes] = []
+    for transaction, tx_hash in zip(transactions, hashes):
+        sender = transaction.sender.to_bech32()
+        first_rejected_nonce = first_rejected_nonces.get(sender)
+
+        if tx_hash and first_rejected_nonce is not None and transaction.nonce > first_rejected_nonce:
+            logger.warning(
+                f"Not awaiting transaction {tx_hash.hex()} (sender = {sender}, nonce = {transaction.nonce}): "
+                f"it is blocked by the rejected transaction with nonce = {first_rejected_nonce}."
+            )
+            tx_hash = b""
+
+        result.append(tx_hash)
+
+    return result
+
+
+def send_transactions_in_chunks(
+    transactions: list[Transaction], proxy: INetworkProvider, chunk_size: int = MAX_NUM_TRANSACTIONS_PER_REQUEST
+) -> Iterator[tuple[int, list[bytes], str]]:
+    """
+    Broadcasts the transactions in chunks, one request each. For each chunk, yields its offset, the hashes (empty for
+    the transactions not accepted) and the error (if the request failed). A failed request does not stop the next ones.
+    """
+    for start in range(0, len(transactions), chunk_size):
+        chunk = transactions[start : start + chunk_size]
+
+        try:
+            num_accepted, hashes = proxy.send_transactions(chunk)
+            logger.info(f"Sent {len(chunk)} transactions, {num_accepted} accepted.")
+            yield start, hashes, ""
+        except Exception as error:
+            logger.error(f"Could not send transactions {start} to {start + len(chunk) - 1}: {error}")
+            yield start, [b""] * len(chunk), str(error)
+
+
 def load_transaction_from_file(f: TextIO) -> Transaction:
-    data_json: bytes = f.read().encode()
-    transaction_dictionary = json.loads(data_json).get("tx") or json.loads(data_json).get("emittedTransaction")
+    data = json.loads(f.read())
+    transaction_dictionary = data.get("tx") or data.get("emittedTransaction")
     return Transaction.new_from_dictionary(transaction_dictionary)
+
+
+def load_transactions_from_jsonl(f: TextIO) -> list[Transaction]:
+    """Loads a JSON Lines file; each line holds a transaction, either plain or wrapped (as in the output of mxpy)."""
+    transactions: list[Transaction] = []
+
+    for line_number, line in enumerate(f, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            data = json.loads(line)
+            transaction_dictionary = data.get("tx") or data.get("emittedTransaction") or data
+            transactions.append(Transaction.new_from_dictionary(transaction_dictionary))
+        except Exception as error:
+            raise errors.BadUserInput(f"invalid transaction on line {line_number}: {error}")
+
+    return transactions
+
+
+def save_transactions_to_jsonl(transactions: list[Transaction], f: TextIO):
+    for transaction in transactions:
+        f.write(json.dumps(transaction.to_dictionary()) + "\n")
@@ -0,0 +1,278 @@
+import io
+import logging
+import struct
+from hashlib import blake2b
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
+
+import multiversx_sdk.core.proto.transaction_pb2 as ProtoTransaction
+from multiversx_sdk import Address, Transaction
+from multiversx_sdk.core.proto.transaction_serializer import ProtoSerializer
+
+from multiversx_sdk_cli import errors
+
+logger = logging.getLogger("transactions_batch")
+
+# A compact container for (signed) transactions. Layout:
+#
+#   header:   MAGIC, flags (u8), length of the HRP (u8), HRP
+#   blocks:   length (u32), then the records (optionally compressed with zstd);
+#             each record is a length-prefixed (u32) transaction, serialized as protobuf (the network's wire format)
+#   footer:   number of blocks (u32), their offsets (u64 each),
+#             number of records (u32), then an index entry for each record: block, offset, length, nonce, hash
+#   trailer:  offset of the footer (u64), TRAILER_MAGIC
+#
+# The footer allows random access (by position, nonce or hash) without reading the whole file.
+MAGIC = b"MXTXB\x01"
+TRAILER_MAGIC = b"MXTXBEND"
+FLAG_ZSTD = 0x01
+DEFAULT_NUM_RECORDS_PER_BLOCK = 1024
+
+HASH_LENGTH = 32
+LENGTH_FORMAT = struct.Struct("<I")
+OFFSET_FORMAT = struct.Struct("<Q")
+INDEX_ENTRY_FORMAT = struct.Struct("<IIIQ32s")
+TRAILER_FORMAT = struct.Struct("<Q8s")
+
+
+class IndexEntry:
+    def __init__(self, block: int, offset: int, length: int, nonce: int, hash: bytes) -> None:
+        self.block = block
+        self.offset = offset
+        self.length = length
+        self.nonce = nonce
+        self.hash = hash
+
+
+def is_transactions_batch(f: BinaryIO) -> bool:
+    """Checks the magic bytes, without consuming them (the stream must support `peek`)."""
+    peek = getattr(f, "peek", None)
+    if peek is None:
+        return False
+    return bool(peek(len(MAGIC))[: len(MAGIC)] == MAGIC)
+
+
+def save_transactions_to_batch(transactions: Iterable[Transaction], f: BinaryIO, compress: bool = False) -> int:
+    with TransactionsBatchWriter(f, compress=compress) as writer:
+        for transaction in transactions:
+            writer.write(transaction)
+        return len(writer.index)
+
+
+def load_transactions_from_batch(f: BinaryIO) -> list[Transaction]:
+    return list(TransactionsBatchReader(f))
+
+
+class TransactionsBatchWriter:
+    """Writes transactions incrementally: only the current block and the index are kept in memory."""
+
+    def __init__(
+        self,
+        f: BinaryIO,
+        compress: bool = False,
+        num_records_per_block: int = DEFAULT_NUM_RECORDS_PER_BLOCK,
+    ) -> None:
+        self.f = f
+        self.compressor = _get_zstd().ZstdCompressor() if compress else None
+        self.num_records_per_block = num_records_per_block
+        self.serializer = ProtoSerializer()
+        self.hrp: Optional[str] = None
+        self.index: list[IndexEntry] = []
+        self.block_offsets: list[int] = []
+        self.position = 0
+        self._block = bytearray()
+        self._num_records_in_block = 0
+
+    def __enter__(self) -> "TransactionsBatchWriter":
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
+
+    def write(self, transaction: Transaction):
+        if self.hrp is None:
+            self.hrp = transaction.sender.get_hrp()
+            self._write_header()
+
+        record = self.serializer.serialize_transaction(transaction)
+        hash = blake2b(record, digest_size=HASH_LENGTH).digest()
+        offset = len(self._block) + LENGTH_FORMAT.size
+
+        self.index.append(IndexEntry(len(self.block_offsets), offset, len(record), transaction.nonce, hash))
+        self._block += LENGTH_FORMAT.pack(len(record)) + record
+        self._num_records_in_block += 1
+
+        if self._num_records_in_block == self.num_records_per_block:
+            self._flush_block()
+
+    def close(self):
+        if self.hrp is None:
+            self.hrp = ""
+            self._write_header()
+
+        self._flush_block()
+
+        footer_offset = self.position
+        footer = bytearray(LENGTH_FORMAT.pack(len(self.block_offsets)))
+        for block_offset in self.block_offsets:
+            footer += OFFSET_FORMAT.pack(block_offset)
+
+        footer += LENGTH_FORMAT.pack(len(self.index))
+        for entry in self.index:
+            footer += INDEX_ENTRY_FORMAT.pack(entry.block, entry.offset, entry.length, entry.nonce, entry.hash)
+
+        self._write(bytes(footer) + TRAILER_FORMAT.pack(footer_offset, TRAILER_MAGIC))
+        self.f.flush()
+
+    def _write_header(self):
+        hrp = (self.hrp or "").encode()
+        flags = FLAG_ZSTD if self.compressor else 0
+        self._write(MAGIC + bytes([flags, len(hrp)]) + hrp)
+
+    def _flush_block(self):
+        if not self._num_records_in_block:
+            return
+
+        block = self.compressor.compress(bytes(self._block)) if self.compressor else bytes(self._block)
+        self.block_offsets.append(self.position)
+        self._write(LENGTH_FORMAT.pack(len(block)) + block)
+
+        self._block = bytearray()
+        self._num_records_in_block = 0
+
+    def _write(self, data: bytes):
+        self.f.write(data)
+        self.position += len(data)
+
+
+class TransactionsBatchReader:
+    """
+    Reads the index upfront, then decodes transactions on demand (one block is cached).
+    Non-seekable streams (e.g. stdin) are read into memory first.
+    """
+
+    def __init__(self, f: BinaryIO) -> None:
+        self.f = f if f.seekable() else io.BytesIO(f.read())
+        self.start = self.f.tell()
+
+        header = self._read_at(0, len(MAGIC) + 2)
+        if header[: len(MAGIC)] != MAGIC:
+            raise errors.BadUserInput("not a transactions batch (bad magic bytes)")
+
+        flags, hrp_length = header[len(MAGIC)], header[len(MAGIC) + 1]
+        self.hrp = self._read_at(len(header), hrp_length).decode()
+        self.is_compressed = bool(flags & FLAG_ZSTD)
+        self.decompressor = _get_zstd().ZstdDecompressor() if self.is_compressed else None
+
+        self.block_offsets, self.index = self._read_footer()
+        self.indices_by_hash = {entry.hash: i for i, entry in enumerate(self.index)}
+        self._cached_block: tuple[int, bytes] = (-1, b"")
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __iter__(self) -> Iterator[Transaction]:
+        for i in range(len(self.index)):
+            yield self.get(i)
+
+    def get(self, position: int) -> Transaction:
+        entry = self.index[position]
+        block = self._get_block(entry.block)
+        return self._decode(block[entry.offset : entry.offset + entry.length])
+
+    def get_by_hash(self, hash: bytes) -> Optional[Transaction]:
+        position = self.indices_by_hash.get(hash)
+        return self.get(position) if position is not None else None
+
+    def get_by_nonce(self, nonce: int) -> list[Transaction]:
+        """Nonces are unique per sender; a batch may hold transactions of many senders."""
+        return [self.get(i) for i, entry in enumerate(self.index) if entry.nonce == nonce]
+
+    def get_hashes(self) -> list[bytes]:
+        return [entry.hash for entry in self.index]
+
+    def _read_footer(self) -> tuple[list[int], list[IndexEntry]]:
+        self.f.seek(0, io.SEEK_END)
+        end = self.f.tell() - self.start
+        if end < len(MAGIC) + 2 + TRAILER_FORMAT.size:
+            raise errors.BadUserInput("truncated transactions batch")
+
+        footer_offset, trailer_magic = TRAILER_FORMAT.unpack(
+            self._read_at(end - TRAILER_FORMAT.size, TRAILER_FORMAT.size)
+        )
+        if trailer_magic != TRAILER_MAGIC:
+            raise errors.BadUserInput("truncated transactions batch (bad trailer)")
+
+        footer = self._read_at(footer_offset, end - TRAILER_FORMAT.size - footer_offset)
+        (num_blocks,) = LENGTH_FORMAT.unpack_from(footer, 0)
+        position = LENGTH_FORMAT.size
+        block_offsets = [
+            OFFSET_FORMAT.unpack_from(footer, position + i * OFFSET_FORMAT.size)[0] for i in range(num_blocks)
+        ]
+        position += num_blocks * OFFSET_FORMAT.size
+
+        (num_records,) = LENGTH_FORMAT.unpack_from(footer, position)
+        position += LENGTH_FORMAT.size
+        index = [
+            IndexEntry(*INDEX_ENTRY_FORMAT.unpack_from(footer, position + i * INDEX_ENTRY_FORMAT.size))
+            for i in range(num_records)
+        ]
+
+        return block_offsets, index
+
+    def _get_block(self, block_index: int) -> bytes:
+        if self._cached_block[0] != block_index:
+            offset = self.block_offsets[block_index]
+            (length,) = LENGTH_FORMAT.unpack(self._read_at(offset, LENGTH_FORMAT.size))
+            block = self._read_at(offset + LENGTH_FORMAT.size, length)
+
+            if self.decompressor:
+                block = self.decompressor.decompress(block)
+
+            self._cached_block = (block_index, block)
+
+        return self._cached_block[1]
+
+    def _read_at(self, offset: int, length: int) -> bytes:
+        self.f.seek(self.start + offset)
+        data = self.f.read(length)
+        if len(data) != length:
+            raise errors.BadUserInput("truncated transactions batch")
+        return data
+
+    def _decode(self, record: bytes) -> Transaction:
+        message = ProtoTransaction.Transaction()
+        message.ParseFromString(record)
+
+        return Transaction(
+            sender=Address(message.SndAddr, self.hrp),
+            receiver=Address(message.RcvAddr, self.hrp),
+            gas_limit=message.GasLimit,
+            chain_id=message.ChainID.decode(),
+            nonce=message.Nonce,
+            value=_decode_value(message.Value),
+            sender_username=message.SndUserName.decode(),
+            receiver_username=message.RcvUserName.decode(),
+            gas_price=message.GasPrice,
+            data=message.Data,
+            version=message.Version,
+            options=message.Options,
+            guardian=Address(message.GuardAddr, self.hrp) if message.GuardAddr else None,
+            relayer=Address(message.Relayer, self.hrp) if message.Relayer else None,
+            signature=message.Signature,
+            guardian_signature=message.GuardSignature,
+            relayer_signature=message.RelayerSignature,
+        )
+
+
+def _decode_value(value: bytes) -> int:
+    """The inverse of `ProtoSerializer.serialize_transaction_value`: a sign byte, then the big-endian magnitude."""
+    return int.from_bytes(value[1:], byteorder="big") if value else 0
+
+
+def _get_zstd() -> Any:
+    try:
+        import zstandard  # type: ignore
+
+        return zstandard
+    except ImportError:
+        raise errors.DependencyMissing("zstandard", "(needed for compression; run: pip install zstandard)")
@@ -0,0 +1,267 @@
+import base64
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Iterator, Optional
+
+from multiversx_sdk import (
+    Address,
+    ApiNetworkProvider,
+    TokenComputer,
+    TransactionDecoder,
+    TransactionLogs,
+    TransactionOnNetwork,
+    TransactionStatus,
+)
+
+from multiversx_sdk_cli import errors
+from multiversx_sdk_cli.bulk_fetching import fetch_concurrently
+
+logger = logging.getLogger("transactions_history")
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_NUM_PREFETCHED_PAGES = 4
+# The API does not serve results beyond this offset (from + size) of a listing. Past it, a new listing
+# is started from the timestamp of the last transaction (this is the cursor).
+MAX_LISTING_WINDOW = 10_000
+# Only these fields are requested, to keep the pages small.
+REQUESTED_FIELDS = [
+    "txHash",
+    "timestamp",
+    "nonce",
+    "sender",
+    "receiver",
+    "value",
+    "data",
+    "function",
+    "status",
+    "fee",
+    "gasUsed",
+]
+
+HISTORY_RECORD_FIELDS = [
+    "hash",
+    "timestamp",
+    "nonce",
+    "direction",
+    "sender",
+    "receiver",
+    "status",
+    "function",
+    "value",
+    "transfers",
+    "fee",
+    "gasUsed",
+]
+HISTORY_INTEGER_FIELDS = ["timestamp", "nonce", "gasUsed"]
+
+
+class HistoryCursor:
+    """
+    Where a listing (sorted by timestamp) should continue from: the timestamp of the last transaction already seen,
+    and the hashes of all the seen transactions having that timestamp (since the next listing includes them again).
+    """
+
+    def __init__(self, timestamp: int = 0, hashes: Optional[set[str]] = None) -> None:
+        self.timestamp = timestamp
+        self.hashes = hashes or set()
+
+    @classmethod
+    def from_records(cls, records: list[dict[str, Any]]) -> "HistoryCursor":
+        if not records:
+            return cls()
+
+        timestamp = int(records[-1]["timestamp"])
+        hashes = {record["hash"] for record in records if int(record["timestamp"]) == timestamp}
+        return cls(timestamp, hashes)
+
+    def is_seen(self, timestamp: int, hash: str) -> bool:
+        return timestamp < self.timestamp or (timestamp == self.timestamp and hash in self.hashes)
+
+    def advance(self, timestamp: int, hash: str):
+        if timestamp != self.timestamp:
+            self.timestamp = timestamp
+            self.hashes = set()
+        self.hashes.add(hash)
+
+
+class TransactionsHistory:
+    """
+    Pages through the transactions of an account (oldest first), fetching the next pages in parallel
+    while the current ones are processed.
+    """
+
+    def __init__(
+        self,
+        api: ApiNetworkProvider,
+        address: Address,
+        start: int = 0,
+        end: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        num_prefetched_pages: int = DEFAULT_NUM_PREFETCHED_PAGES,
+    ) -> None:
+        self.api = api
+        self.address = address
+        self.start = start
+        self.end = end
+        self.page_size = page_size
+        self.num_prefetched_pages = num_prefetched_pages
+
+    def fetch(self, cursor: HistoryCursor) -> Iterator[dict[str, Any]]:
+        """Yields the raw transactions (as returned by the API) not yet seen by the cursor; the cursor is advanced."""
+        while True:
+            listing_start = max(self.start, cursor.timestamp)
+            num_in_listing = 0
+            num_new_in_listing = 0
+
+            for transaction in self._fetch_listing(listing_start):
+                num_in_listing += 1
+                timestamp, hash = transaction.get("timestamp", 0), transaction.get("txHash", "")
+
+                if cursor.is_seen(timestamp, hash):
+                    continue
+
+                cursor.advance(timestamp, hash)
+                num_new_in_listing += 1
+                yield transaction
+
+            is_listing_exhausted = num_in_listing < self._get_listing_size()
+            if is_listing_exhausted:
+                return
+
+            if num_new_in_listing == 0:
+                raise errors.HistoryPagingError(cursor.timestamp)
+
+            logger.info(f"Continuing from timestamp {cursor.timestamp}")
+
+    def _get_listing_size(self) -> int:
+        return (MAX_LISTING_WINDOW // self.page_size) * self.page_size
+
+    def _fetch_listing(self, after: int) -> Iterator[dict[str, Any]]:
+        num_pages = self._get_listing_size() // self.page_size
+        is_exhausted = threading.Event()
+
+        def page_indices() -> Iterator[int]:
+            for index in range(num_pages):
+                if is_exhausted.is_set():
+                    return
+                yield index
+
+        def fetch_page(index: int) -> list[dict[str, Any]]:
+            return self._fetch_page(after, index * self.page_size)
+
+        for result in fetch_concurrently(page_indices(), fetch_page, self.num_prefetched_pages):
+            if result.error:
+                raise result.error
+
+            yield from result.value
+
+            if len(result.value) < self.page_size:
+                is_exhausted.set()
+                return
+
+    def _fetch_page(self, after: int, offset: int) -> list[dict[str, Any]]:
+        parameters: dict[str, Any] = {
+            "from": offset,
+            "size": self.page_size,
+            "order": "asc",
+            "fields": ",".join(REQUESTED_FIELDS),
+        }
+        if after:
+            parameters["after"] = after
+        if self.end:
+            parameters["before"] = self.end
+
+        logger.debug(f"Fetching page at offset {offset}, after {after}")
+        response = self.api.do_get_generic(f"accounts/{self.address.to_bech32()}/transactions", parameters)
+        return list(response)
+
+
+def to_history_record(address: Address, transaction: dict[str, Any]) -> dict[str, Any]:
+    hash = transaction.get("txHash", "")
+    on_network = transaction_from_listing_item(transaction)
+
+    try:
+        # For transfers and execute, the function is the one called (through the transfer); otherwise, the builtin one.
+        decoder = TransactionDecoder()
+        metadata = decoder.get_transaction_metadata(on_network)
+        function = metadata.function_name or decoder.get_normal_transaction_metadata(on_network).function_name or ""
+        receiver = metadata.receiver
+        transfers = metadata.transfers or []
+    except Exception as error:
+        logger.debug(f"Cannot decode the data of {hash}: {error}")
+        function, receiver, transfers = on_network.function, on_network.receiver.to_bech32(), []
+
+    token_computer = TokenComputer()
+    sender = on_network.sender.to_bech32()
+
+    return {
+        "hash": hash,
+        "timestamp": transaction.get("timestamp", 0),
+        "nonce": transaction.get("nonce", 0),
+        "direction": _get_direction(address.to_bech32(), sender, receiver),
+        "sender": sender,
+        "receiver": receiver,
+        "status": transaction.get("status", ""),
+        "function": function or transaction.get("function", ""),
+        "value": str(on_network.value),
+        "transfers": [
+            {"token": token_computer.compute_extended_identifier(transfer.token), "amount": str(transfer.amount)}
+            for transfer in transfers
+        ],
+        "fee": transaction.get("fee", ""),
+        "gasUsed": transaction.get("gasUsed", 0),
+    }
+
+
+def transaction_from_listing_item(transaction: dict[str, Any]) -> TransactionOnNetwork:
+    """
+    Builds a transaction (only the fields needed for decoding it are set) out of an item of an API listing, which only
+    holds the requested fields.
+    """
+    return TransactionOnNetwork(
+        raw=transaction,
+        sender=Address.new_from_bech32(transaction.get("sender", "")),
+        receiver=Address.new_from_bech32(transaction.get("receiver", "")),
+        hash=bytes.fromhex(transaction.get("txHash", "")),
+        nonce=transaction.get("nonce", 0),
+        round=-1,
+        epoch=-1,
+        timestamp=transaction.get("timestamp", 0),
+        block_hash=b"",
+        miniblock_hash=b"",
+        sender_shard=-1,
+        receiver_shard=-1,
+        value=int(transaction.get("value", 0)),
+        gas_limit=0,
+        gas_price=0,
+        function=transaction.get("function", ""),
+        data=base64.b64decode(transaction.get("data", "") or ""),
+        version=-1,
+        options=-1,
+        signature=b"",
+        status=TransactionStatus(transaction.get("status", "")),
+        smart_contract_results=[],
+        logs=TransactionLogs(address=Address.empty(), events=[]),
+    )
+
+
+def _get_direction(address: str, sender: str, receiver: str) -> str:
+    if sender == receiver:
+        return "self"
+    return "out" if sender == address else "in"
+
+
+def parse_time(value: str) -> int:
+    """Parses a Unix timestamp, or an ISO 8601 date (e.g. 2024-01-31 or 2024-01-31T12:00:00; UTC unless specified)."""
+    if value.isdigit():
+        return int(value)
+
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise errors.BadUsage(f"Invalid time: {value} (expected: a Unix timestamp or an ISO 8601 date)")
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
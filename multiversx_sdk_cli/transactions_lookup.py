@@ -0,0 +1,126 @@
+import logging
+from typing import Any, Optional
+
+from multiversx_sdk import (
+    AwaitingOptions,
+    ProxyNetworkProvider,
+    SmartContractTransactionsOutcomeParser,
+    TransactionEvent,
+    TransactionEventsParser,
+    TransactionOnNetwork,
+)
+from multiversx_sdk.abi import Abi
+
+logger = logging.getLogger("transactions_lookup")
+
+TRANSACTION_RECORD_FIELDS = [
+    "hash",
+    "status",
+    "sender",
+    "receiver",
+    "nonce",
+    "function",
+    "gasLimit",
+    "gasUsed",
+    "fee",
+    "returnCode",
+    "returnMessage",
+    "returnValues",
+    "events",
+    "error",
+]
+
+ONE_SECOND_IN_MILLISECONDS = 1000
+
+
+class TransactionsLookup:
+    """Fetches transactions (waiting for the pending ones, if asked to) and flattens their outcome into records."""
+
+    def __init__(
+        self,
+        proxy: ProxyNetworkProvider,
+        abi: Optional[Abi] = None,
+        wait: bool = False,
+        timeout: int = 0,
+    ) -> None:
+        self.proxy = proxy
+        self.abi = abi
+        self.wait = wait
+        self.awaiting_options = AwaitingOptions(timeout_in_milliseconds=timeout * ONE_SECOND_IN_MILLISECONDS)
+        self.outcome_parser = SmartContractTransactionsOutcomeParser(abi)
+        self.events_parser = TransactionEventsParser(abi) if abi else None
+
+    def fetch(self, hash: str) -> TransactionOnNetwork:
+        transaction = self.proxy.get_transaction(hash)
+
+        if self.wait and not transaction.status.is_completed:
+            logger.info(f"Waiting for {hash}")
+            transaction = self.proxy.await_transaction_completed(hash, self.awaiting_options)
+
+        return transaction
+
+    def to_record(self, transaction: TransactionOnNetwork) -> dict[str, Any]:
+        record: dict[str, Any] = {
+            "hash": transaction.hash.hex(),
+            "status": transaction.status.status,
+            "sender": transaction.sender.to_bech32(),
+            "receiver": transaction.receiver.to_bech32(),
+            "nonce": transaction.nonce,
+            "function": transaction.function,
+            "gasLimit": transaction.gas_limit,
+            "gasUsed": transaction.raw.get("gasUsed"),
+            "fee": transaction.raw.get("fee"),
+        }
+
+        if transaction.function and transaction.status.is_completed:
+            self._add_outcome(record, transaction)
+
+        if self.events_parser:
+            record["events"] = self._parse_events(transaction)
+
+        return record
+
+    def _add_outcome(self, record: dict[str, Any], transaction: TransactionOnNetwork):
+        # Without an ABI, the return values are left as they are (raw bytes).
+        try:
+            outcome = self.outcome_parser.parse_execute(transaction, transaction.function if self.abi else None)
+        except Exception as error:
+            record["error"] = f"cannot parse the outcome: {error}"
+            return
+
+        record["returnCode"] = outcome.return_code
+        record["returnMessage"] = outcome.return_message
+        record["returnValues"] = outcome.values
+
+    def _parse_events(self, transaction: TransactionOnNetwork) -> list[Any]:
+        """Only the events declared in the ABI are decoded (e.g. "ESDTTransfer" or "completedTxEvent" are skipped)."""
+        events = _gather_events(transaction)
+        known_events = [event for event in events if self._get_event_name(event) is not None]
+        parsed: list[Any] = []
+
+        for event in known_events:
+            try:
+                parsed_event = self.events_parser.parse_events([event])[0]  # type: ignore
+                parsed.append({"name": self._get_event_name(event), "values": parsed_event})
+            except Exception as error:
+                parsed.append({"name": self._get_event_name(event), "error": str(error)})
+
+        return parsed
+
+    def _get_event_name(self, event: TransactionEvent) -> Optional[str]:
+        if not self.abi or not event.topics:
+            return None
+
+        try:
+            name = event.topics[0].decode()
+        except UnicodeDecodeError:
+            return None
+
+        return name if name in self.abi.events_prototypes_by_name else None
+
+
+def _gather_events(transaction: TransactionOnNetwork) -> list[TransactionEvent]:
+    events = list(transaction.logs.events)
+    for result in transaction.smart_contract_results:
+        events.extend(result.logs.events)
+    return events
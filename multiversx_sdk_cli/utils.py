@@ -12,6 +12,8 @@ from typing import Any, Optional, Protocol, Union, runtime_checkable
 
 import toml
 
+from multiversx_sdk_cli import errors
+
 logger = logging.getLogger("utils")
 
 
@@ -107,14 +109,47 @@ def write_json_file(filename: Union[str, Path], data: Any):
         json.dump(data, f, indent=4)
 
 
+# Set once, from the global --output-format argument.
+_output_format = "json"
+
+
+def set_output_format(format: str):
+    global _output_format
+    _output_format = format
+
+
 def dump_out_json(data: Any, outfile: Any = None):
     if not outfile:
         outfile = sys.stdout
 
-    json.dump(data, outfile, indent=4, cls=BasicEncoder)
+    outfile.write(format_json(data, _output_format))
     outfile.write("\n")
 
 
+def format_json(data: Any, format: str = "json") -> str:
+    if format == "jsonl" and isinstance(data, list):
+        return "\n".join(format_json(item, "compact") for item in data)
+    if format in ["compact", "jsonl"]:
+        return json.dumps(data, separators=(",", ":"), cls=BasicEncoder)
+    if format == "orjson":
+        return _format_json_with_orjson(data)
+    return json.dumps(data, indent=4, cls=BasicEncoder)
+
+
+def _format_json_with_orjson(data: Any) -> str:
+    try:
+        import orjson  # type: ignore
+    except ImportError:
+        raise errors.DependencyMissing("orjson", "(needed for --output-format orjson; run: pip install orjson)")
+
+    try:
+        serialized: bytes = orjson.dumps(data, default=BasicEncoder().default)
+        return serialized.decode()
+    except TypeError:
+        # E.g. integers larger than 64 bits (such as decoded BigUint values) are not supported by orjson.
+        return format_json(data, "compact")
+
+
 def get_subfolders(folder: Path) -> list[str]:
     return [item.name for item in os.scandir(folder) if item.is_dir() and not item.name.startswith(".")]
 
@@ -0,0 +1,74 @@
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Iterable
+
+from multiversx_sdk import ValidatorPublicKey, ValidatorSecretKey
+
+logger = logging.getLogger("validators_signing")
+
+# Below this number of keys, spawning worker processes costs more than it saves.
+MIN_NUM_KEYS_FOR_PARALLEL_SIGNING = 32
+
+
+def sign_message_with_validator_keys(
+    keys: list[ValidatorSecretKey], message: bytes
+) -> tuple[list[ValidatorPublicKey], list[bytes]]:
+    """Signs the same message (e.g. a delegation contract's public key) with each BLS key. Returns the public keys and the signatures, in order."""
+    secret_keys = [key.buffer for key in keys]
+    results = _map_over_keys("Signed with", _sign, secret_keys, repeat(message))
+
+    public_keys = [ValidatorPublicKey(public_key) for public_key, _ in results]
+    signatures = [signature for _, signature in results]
+    return public_keys, signatures
+
+
+def generate_validator_keys(count: int) -> list[tuple[ValidatorSecretKey, ValidatorPublicKey]]:
+    """
+    Generates BLS keys. The secret keys are generated by this process, while the public keys are derived in parallel.
+    """
+    secret_keys = [ValidatorSecretKey.generate() for _ in range(count)]
+    return list(zip(secret_keys, derive_public_keys(secret_keys, action="Generated")))
+
+
+def derive_public_keys(
+    keys: list[ValidatorSecretKey], action: str = "Derived public keys of"
+) -> list[ValidatorPublicKey]:
+    public_keys = _map_over_keys(action, _derive_public_key, [key.buffer for key in keys])
+    return [ValidatorPublicKey(public_key) for public_key in public_keys]
+
+
+def _map_over_keys(action: str, func: Callable[..., Any], secret_keys: list[bytes], *args: Iterable[Any]) -> list[Any]:
+    start = time.perf_counter()
+
+    if len(secret_keys) < MIN_NUM_KEYS_FOR_PARALLEL_SIGNING:
+        results = list(map(func, secret_keys, *args))
+    else:
+        num_workers = os.cpu_count() or 1
+        chunksize = max(len(secret_keys) // (num_workers * 4), 1)
+        logger.info(f"Processing {len(secret_keys)} validator keys, using {num_workers} processes.")
+
+        # Workers are spawned (not forked): forking a process that runs other threads (e.g. network reads) may deadlock.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=context) as executor:
+            results = list(executor.map(func, secret_keys, *args, chunksize=chunksize))
+
+    elapsed = time.perf_counter() - start
+    if secret_keys:
+        logger.info(
+            f"{action} {len(secret_keys)} validator keys in {elapsed:.2f}s ({len(secret_keys) / max(elapsed, 1e-9):.0f} keys/sec)."
+        )
+
+    return results
+
+
+def _sign(secret_key: bytes, message: bytes) -> tuple[bytes, bytes]:
+    key = ValidatorSecretKey(secret_key)
+    return key.generate_public_key().buffer, key.sign(message)
+
+
+def _derive_public_key(secret_key: bytes) -> bytes:
+    return ValidatorSecretKey(secret_key).generate_public_key().buffer